@@ -155,8 +155,10 @@ def nodes_index():
                 ("Topologic.TopologyAnalyze", "SvTopologyAnalyze"),
                 ("Topologic.TopologyApertures", "SvTopologyApertures"),
                 ("Topologic.TopologyBoolean", "SvTopologyBoolean"),
+                ("Topologic.TopologyBooleanReduce", "SvTopologyBooleanReduce"),
                 ("Topologic.TopologyBoundingBox", "SvTopologyBoundingBox"),
                 ("Topologic.TopologyByGeometry", "SvTopologyByGeometry"),
+                ("Topologic.TopologyByImportedArchive", "SvTopologyByImportedArchive"),
                 ("Topologic.TopologyByImportedBRep", "SvTopologyByImportedBRep"),
                 ("Topologic.TopologyByString", "SvTopologyByString"),
                 ("Topologic.TopologyCenterOfMass", "SvTopologyCenterOfMass"),
@@ -170,9 +172,12 @@ def nodes_index():
                 ("Topologic.TopologyDivide", "SvTopologyDivide"),
                 ("Topologic.TopologyEncodeInformation", "SvTopologyEncodeInformation"),
                 ("Topologic.TopologyExplode", "SvTopologyExplode"),
+                ("Topologic.TopologyExportInformation", "SvTopologyExportInformation"),
+                ("Topologic.TopologyExportToArchive", "SvTopologyExportToArchive"),
                 ("Topologic.TopologyExportToBRep", "SvTopologyExportToBRep"),
                 ("Topologic.TopologyFilter", "SvTopologyFilter"),
                 ("Topologic.TopologyGeometry", "SvTopologyGeometry"),
+                ("Topologic.TopologyImportInformation", "SvTopologyImportInformation"),
                 ("Topologic.TopologyIsSame", "SvTopologyIsSame"),
                 ("Topologic.TopologyOCCTShape", "SvTopologyOCCTShape"),
                 ("Topologic.TopologyPlace", "SvTopologyPlace"),
@@ -202,12 +207,14 @@ def nodes_index():
                 ("Topologic.GraphAdjacentVertices", "SvGraphAdjacentVertices"),
                 ("Topologic.GraphAllPaths", "SvGraphAllPaths"),
                 ("Topologic.GraphByTopology", "SvGraphByTopology"),
+                ("Topologic.GraphCentrality", "SvGraphCentrality"),
                 ("Topologic.GraphConnect", "SvGraphConnect"),
                 ("Topologic.GraphContainsEdge", "SvGraphContainsEdge"),
                 ("Topologic.GraphContainsVertex", "SvGraphContainsVertex"),
                 ("Topologic.GraphDegreeSequence", "SvGraphDegreeSequence"),
                 ("Topologic.GraphDensity", "SvGraphDensity"),
                 ("Topologic.GraphDiameter", "SvGraphDiameter"),
+                ("Topologic.GraphDistanceMatrix", "SvGraphDistanceMatrix"),
                 ("Topologic.GraphEdge", "SvGraphEdge"),
                 ("Topologic.GraphEdges", "SvGraphEdges"),
                 ("Topologic.GraphIsComplete", "SvGraphIsComplete"),
@@ -481,12 +488,14 @@ class NODEVIEW_MT_AddTPSubcategoryGraph(bpy.types.Menu):
             ['SvGraphAdjacentVertices'],
             ['SvGraphAllPaths'],
             ['SvGraphByTopology'],
+            ['SvGraphCentrality'],
             ['SvGraphConnect'],
             ['SvGraphContainsEdge'],
             ['SvGraphContainsVertex'],
             ['SvGraphDegreeSequence'],
             ['SvGraphDensity'],
             ['SvGraphDiameter'],
+            ['SvGraphDistanceMatrix'],
             ['SvGraphEdge'],
             ['SvGraphEdges'],
             ['SvGraphIsComplete'],
@@ -552,8 +561,10 @@ class NODEVIEW_MT_AddTPSubcategoryTopology(bpy.types.Menu):
             ['SvTopologyAnalyze'],
             ['SvTopologyApertures'],
             ['SvTopologyBoolean'],
+            ['SvTopologyBooleanReduce'],
             ['SvTopologyBoundingBox'],
             ['SvTopologyByGeometry'],
+            ['SvTopologyByImportedArchive'],
             ['SvTopologyByImportedBRep'],
 			['SvTopologyByString'],
             ['SvTopologyCenterOfMass'],
@@ -567,9 +578,12 @@ class NODEVIEW_MT_AddTPSubcategoryTopology(bpy.types.Menu):
             ['SvTopologyDivide'],
             ['SvTopologyEncodeInformation'],
             ['SvTopologyExplode'],
+            ['SvTopologyExportInformation'],
+            ['SvTopologyExportToArchive'],
             ['SvTopologyExportToBRep'],
             ['SvTopologyFilter'],
             ['SvTopologyGeometry'],
+            ['SvTopologyImportInformation'],
             ['SvTopologyIsSame'],
             ['SvTopologyOCCTShape'],
             ['SvTopologyPlace'],
@@ -4,15 +4,10 @@ from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, list_match_func, list_match_modes
 
 import topologic
-# From https://stackabuse.com/python-how-to-flatten-list-of-lists/
-def flatten(element):
-	returnList = []
-	if isinstance(element, list) == True:
-		for anItem in element:
-			returnList = returnList + flatten(anItem)
-	else:
-		returnList = [element]
-	return returnList
+
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.Replication')
+from topologicsverchok.nodes.Topologic.Replication import flatten
 
 def processItem(item):
 	topology = None
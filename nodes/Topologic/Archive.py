@@ -0,0 +1,227 @@
+# Topology archives: one zip file holding many topologies with their dictionaries, contents and apertures. This module must not import bpy
+# The table of contents (index.json) lists every entry with its key and type. Each entry is stored in its own members,
+# so loading one entry reads the table of contents and that entry only, whatever the size of the archive
+
+import os
+import json
+import shutil
+import zipfile
+import tempfile
+
+import topologic
+from topologic import Vertex, Edge, Wire, Face, Shell, Cell, CellComplex, Cluster, Topology
+import cppyy
+
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.BRepIO')
+importlib.import_module('topologicsverchok.nodes.Topologic.Parallel')
+from topologicsverchok.nodes.Topologic.BRepIO import exportTopology, topologyByBRepFile, temporaryPathNear
+from topologicsverchok.nodes.Topologic.Parallel import getKeysAndValues, dictionaryByKeysValues, subTopologies, subTopologyTypes, subTopologyDictionaries, setSubTopologyDictionaries
+
+archiveFormat = "TopologicArchive"
+archiveVersion = 1
+indexName = "index.json"
+
+def classByType(argument):
+	switcher = {
+		1: Vertex,
+		2: Edge,
+		4: Wire,
+		8: Face,
+		16: Shell,
+		32: Cell,
+		64: CellComplex,
+		128: Cluster }
+	return switcher.get(argument, Topology)
+
+def fixTopologyClass(topology):
+  topology.__class__ = classByType(topology.GetType())
+  return topology
+
+def topologyContents(topology):
+	# The direct contents of the topology, without its apertures
+	contents = cppyy.gbl.std.list[topologic.Topology.Ptr]()
+	_ = topology.Contents(contents)
+	return [fixTopologyClass(aContent) for aContent in contents if aContent.GetType() != topologic.Aperture.Type()]
+
+def topologyApertures(topology):
+	# Returns (subTopologyType, index, aperture) for the apertures of the topology and of its sub-topologies
+	# The lowest dimensional host is tried first so that every aperture is recorded once, on the member that holds it
+	hosts = []
+	for subTopologyType, subTopologyClass in subTopologyTypes:
+		for i, aSubTopology in enumerate(subTopologies(topology, subTopologyType, subTopologyClass)):
+			hosts.append((subTopologyType, i, aSubTopology))
+	hosts.append((None, 0, topology))
+	returnList = []
+	seen = []
+	for subTopologyType, i, aHost in hosts:
+		apertures = cppyy.gbl.std.list[topologic.Aperture.Ptr]()
+		_ = aHost.Apertures(apertures)
+		for anAperture in apertures:
+			apertureTopology = anAperture.Topology()
+			if any(apertureTopology.IsSame(aTopology) for aTopology in seen):
+				continue
+			seen.append(apertureTopology)
+			returnList.append((subTopologyType, i, apertureTopology))
+	return returnList
+
+def apertureHost(topology, subTopologyType, index):
+	if subTopologyType == None:
+		return topology
+	subTopologyClass = dict(subTopologyTypes)[subTopologyType]
+	return subTopologies(topology, subTopologyType, subTopologyClass)[index]
+
+class ArchiveWriter:
+	# Adds topologies to a new archive one at a time, so only the entry being written is held in memory
+	# Shapes are written by OCCT to a temporary file next to the archive and then copied into it
+	# The archive itself is written to a temporary file that replaces the path on close. An export that fails
+	# leaves no file behind, or the previous archive untouched
+	def __init__(self, path, binary=False, compress=True):
+		self.path = path
+		self.binary = binary
+		self.archivePath = temporaryPathNear(path)
+		self.zip = zipfile.ZipFile(self.archivePath, "w", zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED)
+		self.temporaryPath = temporaryPathNear(path)
+		self.entries = []
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exceptionType, exceptionValue, traceback):
+		if exceptionType == None:
+			self.close()
+		else:
+			self.abort()
+
+	def writeShape(self, topology, name):
+		exportTopology(topology, self.temporaryPath, self.binary)
+		self.zip.write(self.temporaryPath, name)
+
+	def record(self, topology, prefix, counter):
+		# Writes the shape of the topology and returns the record of its dictionaries, contents and apertures
+		name = prefix+str(counter[0])+".brep"
+		counter[0] += 1
+		self.writeShape(topology, name)
+		keys, values = getKeysAndValues(topology.GetDictionary())
+		record = {"brep": name, "dictionary": [keys, values], "subTopologyDictionaries": subTopologyDictionaries(topology)}
+		contents = topologyContents(topology)
+		if len(contents) > 0:
+			record["contents"] = [self.record(aContent, prefix, counter) for aContent in contents]
+		apertures = topologyApertures(topology)
+		if len(apertures) > 0:
+			record["apertures"] = [{"host": subTopologyType, "index": i, "aperture": self.record(anAperture, prefix, counter)} for subTopologyType, i, anAperture in apertures]
+		return record
+
+	def add(self, topology, key=None):
+		# Returns the index of the new entry. The key defaults to that index and does not need to be unique
+		index = len(self.entries)
+		if key == None:
+			key = str(index)
+		prefix = "entries/"+str(index)+"/"
+		record = self.record(topology, prefix, [0])
+		self.zip.writestr(prefix+"record.json", json.dumps(record))
+		self.entries.append({"key": str(key), "type": topology.GetTypeAsString(), "record": prefix+"record.json"})
+		return index
+
+	def close(self):
+		# Writes the table of contents and moves the finished archive to its path
+		if self.zip == None:
+			return
+		try:
+			self.zip.writestr(indexName, json.dumps({"format": archiveFormat, "version": archiveVersion, "binary": self.binary, "entries": self.entries}))
+			self.zip.close()
+			self.zip = None
+			os.replace(self.archivePath, self.path)
+		finally:
+			self.abort()
+
+	def abort(self):
+		# Discards the archive without writing its table of contents
+		if self.zip != None:
+			self.zip.close()
+			self.zip = None
+		for aPath in [self.archivePath, self.temporaryPath]:
+			if os.path.exists(aPath):
+				os.remove(aPath)
+
+class ArchiveReader:
+	# Opens an archive and reads its table of contents. Entries are loaded on request by index or by key
+	def __init__(self, path):
+		self.path = path
+		self.zip = zipfile.ZipFile(path, "r")
+		try:
+			index = json.loads(self.zip.read(indexName))
+		except KeyError:
+			self.zip.close()
+			raise Exception("Error: The following file is not a topology archive: "+str(path))
+		if index.get("format") != archiveFormat or index.get("version", 0) > archiveVersion:
+			self.zip.close()
+			raise Exception("Error: The following file is not a supported topology archive: "+str(path))
+		self.entries = index["entries"]
+		self.indicesByKey = {}
+		for i, anEntry in enumerate(self.entries):
+			self.indicesByKey.setdefault(anEntry["key"], []).append(i)
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *args):
+		self.close()
+
+	def __len__(self):
+		return len(self.entries)
+
+	def keys(self):
+		return [anEntry["key"] for anEntry in self.entries]
+
+	def types(self):
+		return [anEntry["type"] for anEntry in self.entries]
+
+	def readShape(self, name, temporaryPath):
+		with self.zip.open(name) as source, open(temporaryPath, "wb") as target:
+			shutil.copyfileobj(source, target)
+		return topologyByBRepFile(temporaryPath)
+
+	def topologyByRecord(self, record, temporaryPath):
+		topology = self.readShape(record["brep"], temporaryPath)
+		contents = [self.topologyByRecord(aRecord, temporaryPath) for aRecord in record.get("contents", [])]
+		if len(contents) > 0:
+			stl_contents = cppyy.gbl.std.list[topologic.Topology.Ptr]()
+			for aContent in contents:
+				stl_contents.push_back(aContent)
+			topology = fixTopologyClass(topology.AddContents(stl_contents, 0))
+		for anAperture in record.get("apertures", []):
+			host = apertureHost(topology, anAperture["host"], anAperture["index"])
+			context = topologic.Context.ByTopologyParameters(host, 0.5, 0.5, 0.5)
+			_ = topologic.Aperture.ByTopologyContext(self.topologyByRecord(anAperture["aperture"], temporaryPath), context)
+		keys, values = record["dictionary"]
+		if len(keys) > 0:
+			_ = topology.SetDictionary(dictionaryByKeysValues(keys, values))
+		setSubTopologyDictionaries(topology, record["subTopologyDictionaries"])
+		return topology
+
+	def load(self, index):
+		if index < 0 or index >= len(self.entries):
+			raise Exception("Error: The archive has no entry at index "+str(index))
+		record = json.loads(self.zip.read(self.entries[index]["record"]))
+		fd, temporaryPath = tempfile.mkstemp(suffix=".brep")
+		os.close(fd)
+		try:
+			return self.topologyByRecord(record, temporaryPath)
+		finally:
+			os.remove(temporaryPath)
+
+	def loadByKey(self, key):
+		# Returns the topologies of every entry with the key, in archive order
+		return [self.load(i) for i in self.indicesByKey.get(str(key), [])]
+
+	def close(self):
+		if self.zip != None:
+			self.zip.close()
+			self.zip = None
+
+def exportArchive(topologies, path, keys=None, binary=False, compress=True):
+	with ArchiveWriter(path, binary, compress) as writer:
+		for i, aTopology in enumerate(topologies):
+			writer.add(aTopology, keys[i] if keys != None and i < len(keys) else None)
+	return True
@@ -0,0 +1,184 @@
+# Reads and writes BRep files through OCCT directly instead of through one Python string per file. This module must not import bpy
+
+import os
+import gzip
+import shutil
+import tempfile
+
+import topologic
+from topologic import Vertex, Edge, Wire, Face, Shell, Cell, CellComplex, Cluster, Topology
+import cppyy
+
+try:
+	import zstandard
+except:
+	zstandard = None
+
+occtLibrary = None
+binaryLibrary = None
+chunkSize = 1 << 20
+gzipMagic = b"\x1f\x8b"
+zstandardMagic = b"\x28\xb5\x2f\xfd"
+binaryMagic = b"Open CASCADE Topology"
+compressionTypes = ["None", "GZip", "Zstandard"]
+
+def classByType(argument):
+	switcher = {
+		1: Vertex,
+		2: Edge,
+		4: Wire,
+		8: Face,
+		16: Shell,
+		32: Cell,
+		64: CellComplex,
+		128: Cluster }
+	return switcher.get(argument, Topology)
+
+def fixTopologyClass(topology):
+  topology.__class__ = classByType(topology.GetType())
+  return topology
+
+def loadOcctLibrary():
+	# Returns the cppyy namespace with the OCCT BRep classes, or False if their headers are not available
+	global occtLibrary
+	if occtLibrary == None:
+		try:
+			for aHeader in ["TopoDS_Shape.hxx", "TopoDS_Iterator.hxx", "BRep_Builder.hxx", "BRepTools.hxx"]:
+				cppyy.include(aHeader)
+			occtLibrary = cppyy.gbl
+		except:
+			occtLibrary = False
+	return occtLibrary
+
+def loadBinaryLibrary():
+	# Returns the cppyy namespace with OCCT's BinTools, or False if its header is not available
+	global binaryLibrary
+	if binaryLibrary == None:
+		binaryLibrary = False
+		if loadOcctLibrary() != False:
+			try:
+				cppyy.include("BinTools.hxx")
+				binaryLibrary = cppyy.gbl
+			except:
+				pass
+	return binaryLibrary
+
+def compressedWriter(path, compression):
+	if compression == "GZip":
+		return gzip.open(path, "wb")
+	elif compression == "Zstandard":
+		if zstandard == None:
+			raise Exception("Error: Zstandard compression needs the zstandard Python package")
+		return zstandard.ZstdCompressor().stream_writer(open(path, "wb"), closefd=True)
+	return open(path, "wb")
+
+def compressionOf(path):
+	# Detects the compression from the first bytes of the file
+	with open(path, "rb") as f:
+		head = f.read(4)
+	if head.startswith(gzipMagic):
+		return "GZip"
+	elif head.startswith(zstandardMagic):
+		return "Zstandard"
+	return "None"
+
+def compressedReader(path):
+	compression = compressionOf(path)
+	if compression == "GZip":
+		return gzip.open(path, "rb")
+	elif compression == "Zstandard":
+		if zstandard == None:
+			raise Exception("Error: Reading a Zstandard compressed file needs the zstandard Python package")
+		return zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+	return open(path, "rb")
+
+def temporaryPathNear(path):
+	fd, temporaryPath = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(os.path.abspath(path)))
+	os.close(fd)
+	return temporaryPath
+
+def topologyByOcctShape(shape):
+	return fixTopologyClass(topologic.Topology.ByOcctShape(shape, ""))
+
+def readShape(path):
+	# Reads an uncompressed text or binary BRep file
+	occt = loadOcctLibrary()
+	with open(path, "rb") as f:
+		isBinary = f.read(len(binaryMagic)) == binaryMagic
+	shape = occt.TopoDS_Shape()
+	if isBinary:
+		if loadBinaryLibrary() == False:
+			raise Exception("Error: Reading a binary BRep needs OCCT's BinTools")
+		status = occt.BinTools.Read(shape, str(path))
+	else:
+		status = occt.BRepTools.Read(shape, str(path), occt.BRep_Builder())
+	if not status:
+		raise Exception("Error: Could not read a BRep from the following file: "+str(path))
+	return shape
+
+def shapeByBRepFile(path):
+	# OCCT parses the file itself, so the text never becomes a Python string
+	# Compressed files are first decompressed in chunks to a temporary file next to the input
+	if compressionOf(path) == "None":
+		return readShape(path)
+	temporaryPath = temporaryPathNear(path)
+	try:
+		with compressedReader(path) as source, open(temporaryPath, "wb") as target:
+			shutil.copyfileobj(source, target, chunkSize)
+		return readShape(temporaryPath)
+	finally:
+		os.remove(temporaryPath)
+
+def writeShape(shape, path, binary):
+	occt = loadOcctLibrary()
+	if binary:
+		if loadBinaryLibrary() == False:
+			raise Exception("Error: Writing a binary BRep needs OCCT's BinTools")
+		status = occt.BinTools.Write(shape, str(path))
+	else:
+		status = occt.BRepTools.Write(shape, str(path))
+	if not status:
+		raise Exception("Error: Could not write a BRep to the following file: "+str(path))
+
+def exportTopology(topology, path, binary=False, compression="None"):
+	# OCCT writes the shape to disk itself. A compressed file is written to a temporary file first and then compressed in chunks
+	if compression not in compressionTypes:
+		raise Exception("Error: Unknown compression type: "+str(compression))
+	if loadOcctLibrary() == False:
+		if binary:
+			raise Exception("Error: Writing a binary BRep needs OCCT's BRepTools")
+		with compressedWriter(path, compression) as f:
+			f.write(str(topology.String()).encode("utf-8"))
+		return
+	if compression == "None":
+		writeShape(topology.GetOcctShape(), path, binary)
+		return
+	temporaryPath = temporaryPathNear(path)
+	try:
+		writeShape(topology.GetOcctShape(), temporaryPath, binary)
+		with open(temporaryPath, "rb") as source, compressedWriter(path, compression) as target:
+			shutil.copyfileobj(source, target, chunkSize)
+	finally:
+		os.remove(temporaryPath)
+
+def topologyByBRepFile(path):
+	if loadOcctLibrary() == False:
+		with compressedReader(path) as f:
+			return fixTopologyClass(topologic.Topology.ByString(f.read().decode("utf-8")))
+	return topologyByOcctShape(shapeByBRepFile(path))
+
+def topologiesByBRepFile(path):
+	# Yields the members of the top-level compound one at a time, or the only shape if the file does not hold a compound
+	# The shape data of the file is shared by its members, so each member only adds its own Topology wrapper
+	occt = loadOcctLibrary()
+	if occt == False:
+		yield topologyByBRepFile(path)
+		return
+	shape = shapeByBRepFile(path)
+	if shape.ShapeType() != occt.TopAbs_COMPOUND:
+		yield topologyByOcctShape(shape)
+		return
+	iterator = occt.TopoDS_Iterator(shape)
+	while iterator.More():
+		yield topologyByOcctShape(iterator.Value())
+		iterator.Next()
@@ -0,0 +1,255 @@
+# Boolean operations shared by Topology.Boolean and its worker processes. This module must not import bpy
+
+import topologic
+from topologic import Vertex, Edge, Wire, Face, Shell, Cell, CellComplex, Cluster, Topology, Dictionary
+import cppyy
+
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.DictionaryTransfer')
+from topologicsverchok.nodes.Topologic.DictionaryTransfer import transferDictionaries
+
+def classByType(argument):
+	switcher = {
+		1: Vertex,
+		2: Edge,
+		4: Wire,
+		8: Face,
+		16: Shell,
+		32: Cell,
+		64: CellComplex,
+		128: Cluster }
+	return switcher.get(argument, Topology)
+
+def fixTopologyClass(topology):
+  topology.__class__ = classByType(topology.GetType())
+  return topology
+
+def highestDimension(topology):
+	if (topology.GetType() == topologic.Cluster.Type()):
+		cellComplexes = cppyy.gbl.std.list[topologic.CellComplex.Ptr]()
+		_ = topology.CellComplexes(cellComplexes)
+		if len(cellComplexes) > 0:
+			return topologic.CellComplex.Type()
+		cells = cppyy.gbl.std.list[topologic.Cell.Ptr]()
+		_ = topology.Cells(cells)
+		if len(cells) > 0:
+			return topologic.Cell.Type()
+		shells = cppyy.gbl.std.list[topologic.Shell.Ptr]()
+		_ = topology.Shells(shells)
+		if len(shells) > 0:
+			return topologic.Shell.Type()
+		faces = cppyy.gbl.std.list[topologic.Face.Ptr]()
+		_ = topology.Faces(faces)
+		if len(faces) > 0:
+			return topologic.Face.Type()
+		wires = cppyy.gbl.std.list[topologic.Wire.Ptr]()
+		_ = topology.Wires(wires)
+		if len(wires) > 0:
+			return topologic.Wire.Type()
+		edges = cppyy.gbl.std.list[topologic.Edge.Ptr]()
+		_ = topology.Edges(edges)
+		if len(edges) > 0:
+			return topologic.Edge.Type()
+		vertices = cppyy.gbl.std.list[topologic.Vertex.Ptr]()
+		_ = topology.Vertices(vertices)
+		if len(vertices) > 0:
+			return topologic.Vertex.Type()
+	else:
+		return(topology.GetType())
+
+def promote(item): #Fix Clusters with single entities
+	resultingTopologies = []
+	topCC = cppyy.gbl.std.list[topologic.CellComplex.Ptr]()
+	_ = item.CellComplexes(topCC)
+	topCC = list(topCC)
+	topCells = cppyy.gbl.std.list[topologic.Cell.Ptr]()
+	_ = item.Cells(topCells)
+	topCells = list(topCells)
+	topShells = cppyy.gbl.std.list[topologic.Shell.Ptr]()
+	_ = item.Shells(topShells)
+	topShells = list(topShells)
+	topFaces = cppyy.gbl.std.list[topologic.Face.Ptr]()
+	_ = item.Faces(topFaces)
+	topFaces = list(topFaces)
+	topWires = cppyy.gbl.std.list[topologic.Wire.Ptr]()
+	_ = item.Wires(topWires)
+	topWires = list(topWires)
+	topEdges = cppyy.gbl.std.list[topologic.Edge.Ptr]()
+	_ = item.Edges(topEdges)
+	topEdges = list(topEdges)
+	topVertices = cppyy.gbl.std.list[topologic.Vertex.Ptr]()
+	_ = item.Vertices(topVertices)
+	topVertices = list(topVertices)
+	if len(topCC) == 1:
+		cc = topCC[0]
+		ccVertices = cppyy.gbl.std.list[topologic.Vertex.Ptr]()
+		_ = cc.Vertices(ccVertices)
+		ccVertices = list(ccVertices)
+		if len(topVertices) == len(ccVertices):
+			resultingTopologies.append(cc)
+	if len(topCC) == 0 and len(topCells) == 1:
+		cell = topCells[0]
+		ccVertices = cppyy.gbl.std.list[topologic.Vertex.Ptr]()
+		_ = cell.Vertices(ccVertices)
+		ccVertices = list(ccVertices)
+		if len(topVertices) == len(ccVertices):
+			resultingTopologies.append(cell)
+	if len(topCC) == 0 and len(topCells) == 0 and len(topShells) == 1:
+		shell = topShells[0]
+		ccVertices = cppyy.gbl.std.list[topologic.Vertex.Ptr]()
+		_ = shell.Vertices(ccVertices)
+		ccVertices = list(ccVertices)
+		if len(topVertices) == len(ccVertices):
+			resultingTopologies.append(shell)
+	if len(topCC) == 0 and len(topCells) == 0 and len(topShells) == 0 and len(topFaces) == 1:
+		face = topFaces[0]
+		ccVertices = cppyy.gbl.std.list[topologic.Vertex.Ptr]()
+		_ = face.Vertices(ccVertices)
+		ccVertices = list(ccVertices)
+		if len(topVertices) == len(ccVertices):
+			resultingTopologies.append(face)
+	if len(topCC) == 0 and len(topCells) == 0 and len(topShells) == 0 and len(topFaces) == 0 and len(topWires) == 1:
+		wire = topWires[0]
+		ccVertices = cppyy.gbl.std.list[topologic.Vertex.Ptr]()
+		_ = wire.Vertices(ccVertices)
+		ccVertices = list(ccVertices)
+		if len(topVertices) == len(ccVertices):
+			resultingTopologies.append(wire)
+	if len(topCC) == 0 and len(topCells) == 0 and len(topShells) == 0 and len(topFaces) == 0 and len(topWires) == 0 and len(topEdges) == 1:
+		edge = topEdges[0]
+		ccVertices = cppyy.gbl.std.list[topologic.Vertex.Ptr]()
+		_ = wire.Vertices(ccVertices)
+		ccVertices = list(ccVertices)
+		if len(topVertices) == len(ccVertices):
+			resultingTopologies.append(edge)
+	if len(topCC) == 0 and len(topCells) == 0 and len(topShells) == 0 and len(topFaces) == 0 and len(topWires) == 0 and len(topEdges) == 0 and len(topVertices) == 1:
+		vertex = topVertices[0]
+		resultingTopologies.append(vertex)
+	if len(resultingTopologies) == 1:
+		return resultingTopologies[0]
+	return item
+
+def processItem(item):
+	topologyA = item[0]
+	topologyB = item[1]
+	operation = item[2]
+	tranDict = item[3]
+	tolerance = item[4]
+	topologyC = None
+	try:
+		if operation == "Union":
+			topologyC = topologyA.Union(topologyB, False)
+		elif operation == "Difference":
+			topologyC = topologyA.Difference(topologyB, False)
+		elif operation == "Intersect":
+			topologyC = topologyA.Intersect(topologyB, False)
+		elif operation == "SymDif":
+			topologyC = topologyA.XOR(topologyB, False)
+		elif operation == "Merge":
+			topologyC = topologyA.Merge(topologyB, False)
+		elif operation == "Slice":
+			topologyC = topologyA.Slice(topologyB, False)
+		elif operation == "Impose":
+			topologyC = topologyA.Impose(topologyB, False)
+		elif operation == "Imprint":
+			topologyC = topologyA.Imprint(topologyB, False)
+		else:
+			raise Exception("ERROR: (Topologic>Topology.Boolean) invalid boolean operation name: "+operation)
+		if topologyC:
+			topologyC = fixTopologyClass(topologyC)
+		else:
+			return None
+	except:
+		raise Exception("ERROR: (Topologic>Topology.Boolean) operation failed.")
+		topologyC = None
+	topologyC = promote(topologyC)
+	if tranDict == True:
+		sourceVertices = []
+		sourceEdges = []
+		sourceFaces = []
+		sourceCells = []
+		hidimA = highestDimension(topologyA)
+		hidimB = highestDimension(topologyB)
+		hidimC = highestDimension(topologyC)
+		verticesA = cppyy.gbl.std.list[topologic.Vertex.Ptr]()
+		if topologyA.Type() == topologic.Vertex.Type():
+			verticesA.push_back(topologyA)
+		elif hidimA >= topologic.Vertex.Type():
+			_ = topologyA.Vertices(verticesA)
+			for aVertex in verticesA:
+				sourceVertices.append(aVertex)
+		verticesB = cppyy.gbl.std.list[topologic.Vertex.Ptr]()
+		if topologyB.Type() == topologic.Vertex.Type():
+			verticesB.push_back(topologyB)
+		elif hidimB >= topologic.Vertex.Type():
+			_ = topologyB.Vertices(verticesB)
+			for aVertex in verticesB:
+				sourceVertices.append(aVertex)
+		sinkVertices = cppyy.gbl.std.list[topologic.Vertex.Ptr]()
+		if topologyC.Type() == topologic.Vertex.Type():
+			sinkVertices.push_back(topologyC)
+		elif hidimC >= topologic.Vertex.Type():
+			_ = topologyC.Vertices(sinkVertices)
+		_ = transferDictionaries(sourceVertices, sinkVertices, tolerance)
+		if topologyA.Type() == topologic.Edge.Type():
+			sourceEdges.append(topologyA)
+		elif hidimA >= topologic.Edge.Type():
+			edgesA = cppyy.gbl.std.list[topologic.Edge.Ptr]()
+			_ = topologyA.Edges(edgesA)
+			for anEdge in edgesA:
+				sourceEdges.append(anEdge)
+		if topologyB.Type() == topologic.Edge.Type():
+			sourceEdges.append(topologyB)
+		elif hidimB >= topologic.Edge.Type():
+			edgesB = cppyy.gbl.std.list[topologic.Edge.Ptr]()
+			_ = topologyB.Edges(edgesB)
+			for anEdge in edgesB:
+				sourceEdges.append(anEdge)
+		sinkEdges = cppyy.gbl.std.list[topologic.Edge.Ptr]()
+		if topologyC.Type() == topologic.Edge.Type():
+			sinkEdges.push_back(topologyC)
+		elif hidimC >= topologic.Edge.Type():
+			_ = topologyC.Edges(sinkEdges)
+		_ = transferDictionaries(sourceEdges, sinkEdges, tolerance)
+
+		if topologyA.Type() == topologic.Face.Type():
+			sourceFaces.append(topologyA)
+		elif hidimA >= topologic.Face.Type():
+			facesA = cppyy.gbl.std.list[topologic.Face.Ptr]()
+			_ = topologyA.Faces(facesA)
+			for aFace in facesA:
+				sourceFaces.append(aFace)
+		if topologyB.Type() == topologic.Face.Type():
+			sourceFaces.append(topologyB)
+		elif hidimB >= topologic.Face.Type():
+			facesB = cppyy.gbl.std.list[topologic.Face.Ptr]()
+			_ = topologyB.Faces(facesB)
+			for aFace in facesB:
+				sourceFaces.append(aFace)
+		sinkFaces = cppyy.gbl.std.list[topologic.Face.Ptr]()
+		if topologyC.Type() == topologic.Face.Type():
+			sinkFaces.push_back(topologyC)
+		elif hidimC >= topologic.Face.Type():
+			_ = topologyC.Faces(sinkFaces)
+		_ = transferDictionaries(sourceFaces, sinkFaces, tolerance)
+		if topologyA.Type() == topologic.Cell.Type():
+			sourceCells.append(topologyA)
+		elif hidimA >= topologic.Cell.Type():
+			cellsA = cppyy.gbl.std.list[topologic.Cell.Ptr]()
+			_ = topologyA.Cells(cellsA)
+			for aCell in cellsA:
+				sourceCells.append(aCell)
+		if topologyB.Type() == topologic.Cell.Type():
+			sourceCells.append(topologyB)
+		elif hidimB >= topologic.Cell.Type():
+			cellsB = cppyy.gbl.std.list[topologic.Cell.Ptr]()
+			_ = topologyB.Cells(cellsB)
+			for aCell in cellsB:
+				sourceCells.append(aCell)
+		sinkCells = cppyy.gbl.std.list[topologic.Cell.Ptr]()
+		if topologyC.Type() == topologic.Cell.Type():
+			sinkCells.push_back(topologyC)
+		elif hidimC >= topologic.Cell.Type():
+			_ = topologyC.Cells(sinkCells)
+		_ = transferDictionaries(sourceCells, sinkCells, tolerance)
+	return topologyC
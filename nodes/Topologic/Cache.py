@@ -0,0 +1,128 @@
+# Content-addressed result cache with an in-memory LRU tier and an optional on-disk tier. This module must not import bpy
+# Cached values must be JSON serialisable (for example the output of Parallel.pack)
+
+import os
+import json
+import hashlib
+import collections
+
+def digest(*parts):
+	h = hashlib.sha256()
+	for aPart in parts:
+		h.update(str(aPart).encode("utf-8"))
+		h.update(b"\0")
+	return h.hexdigest()
+
+class ResultCache:
+	def __init__(self, maxEntries=256, directory="", maxDiskSize=0):
+		self.memory = collections.OrderedDict()
+		self.maxEntries = maxEntries
+		self.directory = ""
+		self.maxDiskSize = maxDiskSize
+		self.diskSize = None
+		self.hits = 0
+		self.misses = 0
+		self.configure(maxEntries, directory, maxDiskSize)
+
+	def configure(self, maxEntries, directory, maxDiskSize):
+		# maxDiskSize is in bytes. An empty directory disables the on-disk tier
+		self.maxEntries = max(maxEntries, 0)
+		self.maxDiskSize = max(maxDiskSize, 0)
+		directory = os.path.abspath(os.path.expanduser(directory)) if directory else ""
+		if directory != self.directory:
+			self.directory = directory
+			self.diskSize = None
+		while len(self.memory) > self.maxEntries:
+			self.memory.popitem(last=False)
+
+	def resetCounters(self):
+		self.hits = 0
+		self.misses = 0
+
+	def clear(self):
+		self.memory.clear()
+		if self.directory and os.path.isdir(self.directory):
+			for aPath, _ in self.diskEntries():
+				try:
+					os.remove(aPath)
+				except OSError:
+					pass
+		self.diskSize = None
+		self.resetCounters()
+
+	def get(self, key):
+		# Returns (True, value) on a hit and (False, None) on a miss
+		if key in self.memory:
+			self.memory.move_to_end(key)
+			self.hits += 1
+			return True, self.memory[key]
+		if self.directory:
+			path = self.diskPath(key)
+			try:
+				with open(path, "r", encoding="utf-8") as f:
+					value = json.load(f)
+				os.utime(path)
+			except (OSError, ValueError):
+				pass
+			else:
+				self.putInMemory(key, value)
+				self.hits += 1
+				return True, value
+		self.misses += 1
+		return False, None
+
+	def put(self, key, value):
+		self.putInMemory(key, value)
+		if not self.directory:
+			return
+		try:
+			os.makedirs(self.directory, exist_ok=True)
+			path = self.diskPath(key)
+			temporaryPath = path+".tmp"
+			with open(temporaryPath, "w", encoding="utf-8") as f:
+				json.dump(value, f)
+			os.replace(temporaryPath, path)
+		except (OSError, TypeError, ValueError):
+			return
+		if self.diskSize != None:
+			self.diskSize += os.path.getsize(path)
+		self.trimDisk()
+
+	def putInMemory(self, key, value):
+		if self.maxEntries < 1:
+			return
+		self.memory[key] = value
+		self.memory.move_to_end(key)
+		while len(self.memory) > self.maxEntries:
+			self.memory.popitem(last=False)
+
+	def diskPath(self, key):
+		return os.path.join(self.directory, key+".json")
+
+	def diskEntries(self):
+		entries = []
+		for aName in os.listdir(self.directory):
+			if aName.endswith(".json"):
+				aPath = os.path.join(self.directory, aName)
+				try:
+					entries.append((aPath, os.stat(aPath)))
+				except OSError:
+					pass
+		return entries
+
+	def trimDisk(self):
+		# Evicts the least recently used files until the on-disk tier fits in maxDiskSize
+		if self.maxDiskSize < 1:
+			return
+		if self.diskSize != None and self.diskSize <= self.maxDiskSize:
+			return
+		entries = sorted(self.diskEntries(), key=lambda anEntry: anEntry[1].st_mtime)
+		self.diskSize = sum(anEntry[1].st_size for anEntry in entries)
+		for aPath, aStat in entries:
+			if self.diskSize <= self.maxDiskSize:
+				break
+			try:
+				os.remove(aPath)
+				self.diskSize -= aStat.st_size
+			except OSError:
+				pass
@@ -7,15 +7,9 @@ import topologic
 from topologic import Vertex, Edge, Wire, Face, Shell, Cell, CellComplex, Cluster, Topology
 import cppyy
 
-# From https://stackabuse.com/python-how-to-flatten-list-of-lists/
-def flatten(element):
-	returnList = []
-	if isinstance(element, list) == True:
-		for anItem in element:
-			returnList = returnList + flatten(anItem)
-	else:
-		returnList = [element]
-	return returnList
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.Replication')
+from topologicsverchok.nodes.Topologic.Replication import flatten
 
 def classByType(argument):
 	switcher = {
@@ -9,16 +9,6 @@ import cppyy
 import time
 import warnings
 
-# From https://stackabuse.com/python-how-to-flatten-list-of-lists/
-def flatten(element):
-	returnList = []
-	if isinstance(element, list) == True:
-		for anItem in element:
-			returnList = returnList + flatten(anItem)
-	else:
-		returnList = [element]
-	return returnList
-
 def classByType(argument):
 	switcher = {
 		1: Vertex,
@@ -1,5 +1,5 @@
 import bpy
-from bpy.props import StringProperty, FloatProperty
+from bpy.props import StringProperty, FloatProperty, BoolProperty, IntProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode
 import sys
@@ -10,15 +10,11 @@ import topologic
 from topologic import Vertex, Edge, Wire, Face, Shell, Cell, CellComplex, Cluster, Topology, Graph, Dictionary, Attribute, AttributeManager, VertexUtility, EdgeUtility, WireUtility, ShellUtility, CellUtility, TopologyUtility
 import cppyy
 
-# From https://stackabuse.com/python-how-to-flatten-list-of-lists/
-def flatten(element):
-	returnList = []
-	if isinstance(element, list) == True:
-		for anItem in element:
-			returnList = returnList + flatten(anItem)
-	else:
-		returnList = [element]
-	return returnList
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.Replication')
+importlib.import_module('topologicsverchok.nodes.Topologic.IFCImport')
+from topologicsverchok.nodes.Topologic.Replication import flatten
+from topologicsverchok.nodes.Topologic.IFCImport import productShapes, inProductOrder, filterProducts, classNames, clipBoxByInput
 
 def edgesByVertices(vertices):
 	edges = []
@@ -37,23 +33,10 @@ def edgesByVertices(vertices):
 	edges.push_back(e1)
 	return edges
 
-def processItem(item, tol):
-	settings = ifcopenshell.geom.settings()
-	settings.set(settings.USE_BREP_DATA,True)
-	settings.set(settings.SEW_SHELLS,True)
-	settings.set(settings.USE_WORLD_COORDS,True)
-
+def processItem(item, tol, filters=([], [], [], None), parallel=False, threads=0):
 	ifc_file = ifcopenshell.open(item)
-	products = ifc_file.by_type('IfcProduct')
-	output = []
-	for p in products:
-		try:
-			cr = ifcopenshell.geom.create_shape(settings, p)
-			brep = cr.geometry.brep_data
-			output.append(brep)
-		except:
-			continue
-	return output
+	products = filterProducts(ifc_file, ifc_file.by_type('IfcProduct'), *filters)
+	return inProductOrder(products, productShapes(ifc_file, products, parallel, threads))
 
 '''
 def processItem(item, tol):
@@ -91,15 +74,15 @@ def processItem(item, tol):
 		build_cc = Topology.Merge(build_cc, cc)
 	return build_cc
 '''
-def recur(input, tol):
+def recur(input, tol, filters, parallel, threads):
 	output = []
 	if input == None:
 		return []
 	if isinstance(input[0], list):
 		for anItem in input:
-			output.append(recur(anItem, tol))
+			output.append(recur(anItem, tol, filters, parallel, threads))
 	else:
-		output = processItem(input, tol)
+		output = processItem(input, tol, filters, parallel, threads)
 	return output
 
 class SvCellComplexByIFC(bpy.types.Node, SverchCustomTreeNode):
@@ -110,18 +93,44 @@ class SvCellComplexByIFC(bpy.types.Node, SverchCustomTreeNode):
 	bl_idname = 'SvCellComplexByIFC'
 	bl_label = 'CellComplex.ByIFC'
 	Tol: FloatProperty(name='Tol', default=0.0001, precision=4, update=updateNode)
+	Parallel: BoolProperty(name="Parallel", description="Create the product geometries with ifcopenshell's multi-core geometry iterator", default=False, update=updateNode)
+	Threads: IntProperty(name="Threads", description="Number of geometry threads. 0 uses one per CPU core", default=0, min=0, update=updateNode)
+	IncludeClasses: StringProperty(name="Include Classes", description="Comma separated IFC classes to import. Empty imports every IfcProduct", default="", update=updateNode)
+	ExcludeClasses: StringProperty(name="Exclude Classes", description="Comma separated IFC classes to skip", default="", update=updateNode)
+	Storeys: StringProperty(name="Storeys", description="Comma separated names or GlobalIds of the storeys to import. Empty imports every storey", default="", update=updateNode)
 
 	def sv_init(self, context):
 		self.inputs.new('SvStringsSocket', 'IFC File Path')
 		self.inputs.new('SvStringsSocket', 'Tol').prop_name='Tol'
+		self.inputs.new('SvStringsSocket', 'Include Classes').prop_name = 'IncludeClasses'
+		self.inputs.new('SvStringsSocket', 'Exclude Classes').prop_name = 'ExcludeClasses'
+		self.inputs.new('SvStringsSocket', 'Storeys').prop_name = 'Storeys'
+		self.inputs.new('SvStringsSocket', 'Clip Box')
 		self.outputs.new('SvStringsSocket', 'CellComplex')
 
+	def draw_buttons(self, context, layout):
+		layout.prop(self, "Parallel")
+		if self.Parallel:
+			layout.prop(self, "Threads")
+
+	def productFilters(self):
+		# Nodes created before the filter inputs were added do not have them
+		if 'Include Classes' not in self.inputs:
+			return [], [], [], None
+		includeClasses = classNames(flatten(self.inputs['Include Classes'].sv_get(deepcopy=False)))
+		excludeClasses = classNames(flatten(self.inputs['Exclude Classes'].sv_get(deepcopy=False)))
+		storeys = classNames(flatten(self.inputs['Storeys'].sv_get(deepcopy=False)))
+		clipBox = None
+		if self.inputs['Clip Box'].is_linked:
+			clipBox = clipBoxByInput(flatten(self.inputs['Clip Box'].sv_get(deepcopy=False)))
+		return includeClasses, excludeClasses, storeys, clipBox
+
 	def process(self):
 		if not any(socket.is_linked for socket in self.outputs):
 			return
 		inputs = self.inputs['IFC File Path'].sv_get(deepcopy=False)[0]
 		tol = self.inputs['Tol'].sv_get(deepcopy=False, default=0.0001)[0][0]
-		cellComplexes = recur(inputs, tol)
+		cellComplexes = recur(inputs, tol, self.productFilters(), self.Parallel, self.Threads)
 		self.outputs['CellComplex'].sv_set(flatten(cellComplexes))
 
 def register():
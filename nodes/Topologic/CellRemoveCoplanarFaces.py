@@ -11,6 +11,10 @@ from numpy import dot
 import math
 import time
 
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.Replication')
+from topologicsverchok.nodes.Topologic.Replication import flatten
+
 #from https://stackoverflow.com/questions/24467972/calculate-area-of-polygon-given-x-y-coordinates
 
 #unit normal vector of plane defined by points a, b, and c
@@ -50,16 +54,6 @@ def angle(a, b):
 	arccosInput = -1.0 if arccosInput < -1.0 else arccosInput
 	return math.degrees(math.acos(arccosInput))
 
-# From https://stackabuse.com/python-how-to-flatten-list-of-lists/
-def flatten(element):
-	returnList = []
-	if isinstance(element, list) == True:
-		for anItem in element:
-			returnList = returnList + flatten(anItem)
-	else:
-		returnList = [element]
-	return returnList
-
 def removeFace(face, faces):
 	for aFace in faces:
 		if topologic.Topology.IsSame(aFace, face):
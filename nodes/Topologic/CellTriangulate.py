@@ -6,15 +6,9 @@ from sverchok.data_structure import updateNode
 import topologic
 import cppyy
 
-# From https://stackabuse.com/python-how-to-flatten-list-of-lists/
-def flatten(element):
-	returnList = []
-	if isinstance(element, list) == True:
-		for anItem in element:
-			returnList = returnList + flatten(anItem)
-	else:
-		returnList = [element]
-	return returnList
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.Replication')
+from topologicsverchok.nodes.Topologic.Replication import flatten
 
 def triangulateFace(face):
 	faceTriangles = cppyy.gbl.std.list[topologic.Face.Ptr]()
@@ -0,0 +1,198 @@
+# Betweenness, closeness, harmonic and eigenvector centrality of the vertices of a graph snapshot. This module must not import bpy
+# The shortest path measures are sums over source vertices. Sampled modes use a random subset of the sources and scale the
+# sums up, and the sources can be split between worker processes since each source is searched independently
+
+import os
+import math
+import heapq
+import random
+import tempfile
+import numpy
+
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.Parallel')
+from topologicsverchok.nodes.Topologic.Parallel import processItemsInParallel
+
+measures = ["Betweenness", "Closeness", "Harmonic", "Eigenvector"]
+
+def adjacencyByArrays(indptr, indices, edgeIds):
+	return [list(zip(indices[indptr[i]:indptr[i+1]], edgeIds[indptr[i]:indptr[i+1]])) for i in range(len(indptr)-1)]
+
+def searchFromSource(adjacency, weights, source):
+	# Brandes' single source stage. Returns the vertices in order of non-decreasing distance, their distances,
+	# their shortest path predecessors and the number of shortest paths from the source to each of them
+	# weights is None for an unweighted (breadth-first) search
+	count = len(adjacency)
+	distances = [-1.0]*count
+	sigma = [0]*count
+	predecessors = [[] for i in range(count)]
+	order = []
+	distances[source] = 0.0
+	sigma[source] = 1
+	if weights == None:
+		frontier = [source]
+		while frontier:
+			nextFrontier = []
+			for i in frontier:
+				order.append(i)
+				d = distances[i]+1
+				for j, _ in adjacency[i]:
+					if distances[j] < 0:
+						distances[j] = d
+						nextFrontier.append(j)
+					if distances[j] == d:
+						sigma[j] += sigma[i]
+						predecessors[j].append(i)
+			frontier = nextFrontier
+		return order, distances, predecessors, sigma
+	done = [False]*count
+	heap = [(0.0, source)]
+	while heap:
+		d, i = heapq.heappop(heap)
+		if done[i]:
+			continue
+		done[i] = True
+		order.append(i)
+		for j, e in adjacency[i]:
+			nd = d+weights[e]
+			if distances[j] < 0 or nd < distances[j]:
+				distances[j] = nd
+				sigma[j] = sigma[i]
+				predecessors[j] = [i]
+				heapq.heappush(heap, (nd, j))
+			elif nd == distances[j] and not done[j]:
+				sigma[j] += sigma[i]
+				predecessors[j].append(i)
+	return order, distances, predecessors, sigma
+
+def betweennessSums(adjacency, weights, sources):
+	# The dependency of every vertex accumulated over the sources (Brandes' algorithm)
+	betweenness = [0.0]*len(adjacency)
+	for aSource in sources:
+		order, distances, predecessors, sigma = searchFromSource(adjacency, weights, aSource)
+		delta = [0.0]*len(adjacency)
+		for j in reversed(order):
+			for i in predecessors[j]:
+				delta[i] += sigma[i]/sigma[j]*(1.0+delta[j])
+			if j != aSource:
+				betweenness[j] += delta[j]
+	return betweenness
+
+def distanceSums(adjacency, weights, sources):
+	# For every vertex: the sum of its distances to the sources that reach it, the number of those sources and the sum of the inverse distances
+	# The graph is undirected, so the distance from a source to a vertex is also the distance from the vertex to the source
+	count = len(adjacency)
+	sums = [0.0]*count
+	reached = [0]*count
+	inverseSums = [0.0]*count
+	# Unreached vertices have a distance of -1. Vertices reached through zero weight edges count as reached at distance 0,
+	# but add nothing to the sum of the inverse distances
+	for aSource in sources:
+		_, distances, _, _ = searchFromSource(adjacency, weights, aSource)
+		for j, d in enumerate(distances):
+			if j == aSource or d < 0:
+				continue
+			sums[j] += d
+			reached[j] += 1
+			if d > 0:
+				inverseSums[j] += 1.0/d
+	return [sums, reached, inverseSums]
+
+# The graph a worker process last loaded: (path, adjacency, weights). Every chunk of one computation names the same file
+workerGraph = [None, None, None]
+
+def graphByFile(path):
+	# Loads the CSR arrays written by sourceSums once per worker process and computation
+	if workerGraph[0] != path:
+		with numpy.load(path, allow_pickle=False) as arrays:
+			adjacency = adjacencyByArrays(arrays["indptr"].tolist(), arrays["indices"].tolist(), arrays["edgeIds"].tolist())
+			weights = arrays["weights"].tolist() if bool(arrays["weighted"]) else None
+		workerGraph[:] = [path, adjacency, weights]
+	return workerGraph[1], workerGraph[2]
+
+def centralityChunk(item):
+	# Runs in a worker process. item is [measure, path of the graph arrays, sources]
+	measure, path, sources = item
+	adjacency, weights = graphByFile(path)
+	if measure == "Betweenness":
+		return betweennessSums(adjacency, weights, sources)
+	return distanceSums(adjacency, weights, sources)
+
+def sourceSums(snapshot, measure, weights, sources, parallel, workers):
+	if not parallel or len(sources) < 2:
+		adjacency = snapshot.adjacency()
+		if measure == "Betweenness":
+			return betweennessSums(adjacency, weights, sources)
+		return distanceSums(adjacency, weights, sources)
+	# A few chunks per worker keep the workers busy when some sources reach more of the graph than others
+	# The graph goes to the workers once, as a temporary file that each of them loads, and the chunks only carry sources
+	chunkCount = min(len(sources), (workers if workers > 0 else (os.cpu_count() or 1))*4)
+	chunks = [sources[i::chunkCount] for i in range(chunkCount)]
+	fd, path = tempfile.mkstemp(suffix=".npz")
+	os.close(fd)
+	try:
+		numpy.savez(path, indptr=snapshot.indptr, indices=snapshot.indices, edgeIds=snapshot.edgeIds, weights=numpy.array(weights if weights != None else [], dtype=numpy.float64), weighted=numpy.array(weights != None))
+		results = processItemsInParallel(centralityChunk, [[measure, path, aChunk] for aChunk in chunks], workers)
+	finally:
+		os.remove(path)
+	if measure == "Betweenness":
+		return numpy.sum(numpy.array(results, dtype=numpy.float64), axis=0).tolist()
+	return [numpy.sum(numpy.array([aResult[k] for aResult in results], dtype=numpy.float64), axis=0).tolist() for k in range(3)]
+
+def eigenvectorCentrality(snapshot, edgeKey, maxIterations=1000, tolerance=1e-8):
+	# Power iteration on A+I, which has the same leading eigenvector as the adjacency matrix A but also converges on bipartite graphs
+	# Returns unit length scores. Edge weights scale the adjacency if edgeKey is given
+	count = snapshot.vertexCount()
+	if count == 0:
+		return numpy.zeros(0)
+	rows = numpy.repeat(numpy.arange(count), numpy.diff(snapshot.indptr))
+	slotWeights = snapshot.edgeWeights(edgeKey)[snapshot.edgeIds] if snapshot.edgeCount() > 0 else numpy.zeros(0)
+	x = numpy.full(count, 1.0/math.sqrt(count))
+	for i in range(maxIterations):
+		y = x+numpy.bincount(rows, weights=slotWeights*x[snapshot.indices], minlength=count)
+		norm = numpy.linalg.norm(y)
+		if norm == 0:
+			return y
+		y /= norm
+		if numpy.abs(y-x).sum() < count*tolerance:
+			return y
+		x = y
+	raise Exception("Error: Eigenvector centrality did not converge in "+str(maxIterations)+" iterations")
+
+def centrality(snapshot, measure, edgeKey="", normalize=True, samples=0, seed=0, parallel=False, workers=0):
+	# Returns one score per vertex of the snapshot
+	# samples > 0 estimates the shortest path measures from that many randomly chosen sources instead of all of them
+	if measure not in measures:
+		raise Exception("Error: Unknown centrality measure: "+str(measure))
+	if measure == "Eigenvector":
+		return eigenvectorCentrality(snapshot, edgeKey).tolist()
+	count = snapshot.vertexCount()
+	sources = list(range(count))
+	if samples > 0 and samples < count:
+		sources = sorted(random.Random(seed).sample(sources, samples))
+	scale = (count/len(sources)) if len(sources) > 0 else 0
+	weights = snapshot.edgeWeights(edgeKey).tolist() if snapshot.isWeighted(edgeKey) else None
+	sums = sourceSums(snapshot, measure, weights, sources, parallel, workers)
+	if measure == "Betweenness":
+		# Every path of an undirected graph is found from both of its ends
+		scores = numpy.array(sums, dtype=numpy.float64)*scale/2.0
+		if normalize and count > 2:
+			scores *= 2.0/((count-1)*(count-2))
+		return scores.tolist()
+	distanceTotals, reached, inverseTotals = [numpy.array(aList, dtype=numpy.float64)*scale for aList in sums]
+	if weights == None and snapshot.edgeCount() > 0:
+		# A breadth-first search counts edges. Every edge weighs the same, so distances are that many steps of that weight
+		step = float(snapshot.edgeWeights(edgeKey)[0])
+		distanceTotals *= step
+		inverseTotals /= step
+	if measure == "Harmonic":
+		if normalize and count > 1:
+			return (inverseTotals/(count-1)).tolist()
+		return inverseTotals.tolist()
+	# Closeness uses the Wasserman and Faust form, which compares vertices of different components fairly
+	scores = numpy.zeros(count)
+	nonZero = distanceTotals > 0
+	scores[nonZero] = reached[nonZero]/distanceTotals[nonZero]
+	if normalize and count > 1:
+		scores *= reached/(count-1)
+	return scores.tolist()
@@ -0,0 +1,101 @@
+# Transfers the dictionaries of source topologies to the sink topologies that contain their selectors. This module must not import bpy
+# Shared by Topology.Boolean, Topology.BooleanReduce, Topology.SetDictionaries and Topology.TransferDictionaries
+
+import topologic
+import cppyy
+
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.SpatialIndex')
+importlib.import_module('topologicsverchok.nodes.Topologic.Selector')
+importlib.import_module('topologicsverchok.nodes.Topologic.Parallel')
+from topologicsverchok.nodes.Topologic.SpatialIndex import TopologyIndex
+from topologicsverchok.nodes.Topologic.Selector import relevantSelector
+from topologicsverchok.nodes.Topologic.Parallel import attributeByValue
+
+def getValueAtKey(dict, key):
+	returnValue = None
+	try:
+		returnValue = str((cppyy.bind_object(dict.ValueAtKey(key).Value(), "std::string")))
+	except:
+		returnValue = None
+	return returnValue
+
+def getKeys(item):
+	stl_keys = item.Keys()
+	returnList = []
+	copyKeys = stl_keys.__class__(stl_keys) #wlav suggested workaround. Make a copy first
+	for x in copyKeys:
+		k = x.c_str()
+		returnList.append(k)
+	return returnList
+
+def topologyContains(topology, vertex, tol):
+	contains = False
+	if topology.GetType() == topologic.Vertex.Type():
+		try:
+			contains = (topologic.VertexUtility.Distance(topology, vertex) <= tol)
+		except:
+			contains = False
+		return contains
+	elif topology.GetType() == topologic.Edge.Type():
+		try:
+			_ = topologic.EdgeUtility.ParameterAtPoint(topology, vertex)
+			contains = True
+		except:
+			contains = False
+		return contains
+	elif topology.GetType() == topologic.Face.Type():
+		return topologic.FaceUtility.IsInside(topology, vertex, tol)
+	elif topology.GetType() == topologic.Cell.Type():
+		return (topologic.CellUtility.Contains(topology, vertex, tol) == 0)
+	return False
+
+def transferDictionaries(sources, sinks, tol, useCenterOfMass=False, keepTypes=False):
+	# Each sink gets the keys of every source that contains its selector. Without keepTypes the values of a key are
+	# joined as one comma separated string. With keepTypes they keep their type and several values become a list
+	sourceIndex = TopologyIndex(sources, tol)
+	for sink in sinks:
+		sinkKeys = []
+		sinkValues = []
+		iv = relevantSelector(sink, useCenterOfMass=useCenterOfMass)
+		for source in sourceIndex.candidates(iv):
+			if topologyContains(source, iv, tol):
+				d = source.GetDictionary()
+				if d == None:
+					continue
+				sourceKeys = getKeys(d)
+				for aSourceKey in sourceKeys:
+					if aSourceKey not in sinkKeys:
+						sinkKeys.append(aSourceKey)
+						sinkValues.append("")
+				for aSourceKey in sourceKeys:
+					keyIndex = sinkKeys.index(aSourceKey)
+					k = cppyy.gbl.std.string(aSourceKey)
+					if keepTypes:
+						sourceValue = d.ValueAtKey(k).Value()
+						if (isinstance(sourceValue, cppyy.gbl.std.string)):
+							sourceValue = sourceValue.c_str()
+					else:
+						sourceValue = getValueAtKey(d, k)
+					if sourceValue == None:
+						continue
+					if sinkValues[keyIndex] == "":
+						sinkValues[keyIndex] = sourceValue
+					elif not keepTypes:
+						sinkValues[keyIndex] = sinkValues[keyIndex]+","+sourceValue
+					elif isinstance(sinkValues[keyIndex], list):
+						sinkValues[keyIndex].append(sourceValue)
+					else:
+						sinkValues[keyIndex] = [sinkValues[keyIndex], sourceValue]
+		if len(sinkKeys) > 0 and len(sinkValues) > 0:
+			stlKeys = cppyy.gbl.std.list[cppyy.gbl.std.string]()
+			for aKey in sinkKeys:
+				stlKeys.push_back(aKey)
+			stlValues = cppyy.gbl.std.list[topologic.Attribute.Ptr]()
+			for aValue in sinkValues:
+				if keepTypes:
+					stlValues.push_back(attributeByValue(aValue))
+				else:
+					stlValues.push_back(topologic.StringAttribute(aValue))
+			newDict = topologic.Dictionary.ByKeysValues(stlKeys, stlValues)
+			_ = sink.SetDictionary(newDict)
@@ -0,0 +1,187 @@
+# Diameter and eccentricities of a graph snapshot from a few searches instead of one per vertex. This module must not import bpy
+# The eccentricity of a vertex is its largest finite distance and the diameter is the largest eccentricity, so a graph with
+# several components has the diameter of its widest component. Every search tightens a lower and an upper bound of the
+# eccentricity of every vertex it reaches. The diameter of a component is bounded by a 4-sweep (two double sweeps) and then
+# made exact with iFUB, which searches from the vertices farthest from the centre of the 4-sweep until no unsearched vertex
+# can beat the best eccentricity found. Exact eccentricities search from the vertices whose bounds are loosest until all
+# bounds meet (the BoundingDiameters algorithm of Takes and Kosters). Both stop early on a time limit and report the bounds
+
+import math
+import time
+import heapq
+import numpy
+
+def search(adjacency, weights, source):
+	# Returns the distances from the source to the vertices of its component, in order of non-decreasing distance, and
+	# the predecessor of each of them on a shortest path. weights is None for a breadth-first search that counts edges
+	predecessors = {source: -1}
+	if weights == None:
+		distances = {source: 0}
+		frontier = [source]
+		d = 0
+		while frontier:
+			d += 1
+			nextFrontier = []
+			for i in frontier:
+				for j, _ in adjacency[i]:
+					if j not in distances:
+						distances[j] = d
+						predecessors[j] = i
+						nextFrontier.append(j)
+			frontier = nextFrontier
+		return distances, predecessors
+	distances = {}
+	tentative = {source: 0.0}
+	heap = [(0.0, source)]
+	while heap:
+		d, i = heapq.heappop(heap)
+		if i in distances:
+			continue
+		distances[i] = d
+		for j, e in adjacency[i]:
+			nd = d+weights[e]
+			if j not in distances and nd < tentative.get(j, math.inf):
+				tentative[j] = nd
+				predecessors[j] = i
+				heapq.heappush(heap, (nd, j))
+	return distances, predecessors
+
+def middleVertex(distances, predecessors, target):
+	# The vertex halfway along the shortest path from the source of the search to the target
+	half = distances[target]*0.5
+	v = target
+	while distances[v] > half:
+		v = predecessors[v]
+	return v
+
+class EccentricityBounds:
+	# Lower and upper bounds of the eccentricity of every vertex of a snapshot, tightened by every search
+	def __init__(self, snapshot, edgeKey="", timeLimit=0):
+		count = snapshot.vertexCount()
+		self.adjacency = snapshot.adjacency()
+		self.degrees = snapshot.degrees().tolist()
+		weights = snapshot.edgeWeights(edgeKey)
+		if numpy.any(weights < 0):
+			raise Exception("Error: The eccentricity cannot be found with negative edge weights")
+		# Edges of equal weight are searched breadth first and the number of edges is scaled by their weight
+		self.step = 1
+		self.weights = None
+		if len(weights) > 0 and numpy.all(weights == weights[0]):
+			if edgeKey:
+				self.step = float(weights[0])
+		elif len(weights) > 0:
+			self.weights = weights.tolist()
+		self.lower = [0]*count
+		self.upper = [math.inf]*count
+		self.deadline = time.time()+timeLimit if timeLimit > 0 else None
+		self.searches = 0
+
+	def timeUp(self):
+		return self.deadline != None and time.time() > self.deadline
+
+	def settled(self, i):
+		return self.upper[i]-self.lower[i] <= 1e-9*max(1.0, self.upper[i])
+
+	def search(self, source):
+		# Searches from the source and returns its distances, its predecessors and its eccentricity
+		distances, predecessors = search(self.adjacency, self.weights, source)
+		self.searches += 1
+		eccentricity = next(reversed(distances.values()))
+		lower = self.lower
+		upper = self.upper
+		for i, d in distances.items():
+			lower[i] = max(lower[i], d, eccentricity-d)
+			upper[i] = min(upper[i], eccentricity+d)
+		return distances, predecessors, eccentricity
+
+	def sweeps(self, source, count=2):
+		# Runs double sweeps from the source and returns the component of the source, the bounds of its diameter and the
+		# distances from the last centre, the middle of the longest path found
+		distances, _, eccentricity = self.search(source)
+		component = list(distances)
+		lower = eccentricity
+		upper = 2*eccentricity
+		for aSweep in range(count):
+			if len(component) < 3 or lower >= upper or self.timeUp():
+				break
+			far = next(reversed(distances))
+			farDistances, farPredecessors, farEccentricity = self.search(far)
+			lower = max(lower, farEccentricity)
+			centre = middleVertex(farDistances, farPredecessors, next(reversed(farDistances)))
+			distances, _, eccentricity = self.search(centre)
+			lower = max(lower, eccentricity)
+			upper = min(upper, 2*eccentricity)
+		return component, lower, upper, distances
+
+	def componentDiameter(self, source, approximate=False):
+		# Returns the component of the source and the lower and upper bounds of its diameter. They are equal once it is exact
+		component, lower, upper, distances = self.sweeps(source)
+		if len(component) < 3:
+			return component, lower, lower
+		if approximate:
+			return component, lower, upper
+		# iFUB: every unsearched vertex lies within r of the centre, so any path between two of them is at most 2r long
+		for v, r in reversed(list(distances.items())):
+			upper = min(upper, max(lower, 2*r))
+			if lower >= upper or self.timeUp():
+				return component, lower, upper
+			if self.upper[v] <= lower:
+				continue
+			lower = max(lower, self.search(v)[2])
+		return component, lower, lower
+
+	def componentEccentricities(self, component):
+		# Searches from the unsettled vertex with the highest upper bound and from the one with the lowest lower bound in turn
+		candidates = [i for i in component if not self.settled(i)]
+		high = True
+		while len(candidates) > 0 and not self.timeUp():
+			if high:
+				v = max(candidates, key=lambda i: (self.upper[i], self.degrees[i]))
+			else:
+				v = min(candidates, key=lambda i: (self.lower[i], -self.degrees[i]))
+			high = not high
+			_ = self.search(v)
+			candidates = [i for i in candidates if not self.settled(i)]
+
+	def scaled(self, value):
+		return value*self.step if self.step != 1 else value
+
+def graphDiameter(snapshot, edgeKey="", approximate=False, timeLimit=0):
+	# Returns (lower, upper, exact). The approximate mode stops after the 4-sweep of every component
+	# A time limit in seconds stops the search early, but every component is searched from at least once
+	bounds = EccentricityBounds(snapshot, edgeKey, timeLimit)
+	lower = 0
+	upper = 0
+	visited = [False]*snapshot.vertexCount()
+	for i in range(snapshot.vertexCount()):
+		if visited[i]:
+			continue
+		if bounds.timeUp():
+			component, _, eccentricity = bounds.search(i)
+			componentLower, componentUpper = eccentricity, 2*eccentricity
+		else:
+			component, componentLower, componentUpper = bounds.componentDiameter(i, approximate)
+		for j in component:
+			visited[j] = True
+		lower = max(lower, componentLower)
+		upper = max(upper, componentUpper)
+	return bounds.scaled(lower), bounds.scaled(upper), lower >= upper
+
+def graphEccentricities(snapshot, edgeKey="", approximate=False, timeLimit=0):
+	# Returns (lower bounds, upper bounds, exact) of the eccentricity of every vertex. They are equal where it is exact
+	# The approximate mode stops after the 4-sweep of every component
+	bounds = EccentricityBounds(snapshot, edgeKey, timeLimit)
+	visited = [False]*snapshot.vertexCount()
+	for i in range(snapshot.vertexCount()):
+		if visited[i]:
+			continue
+		if bounds.timeUp():
+			component = list(bounds.search(i)[0])
+		else:
+			component = bounds.sweeps(i)[0]
+			if not approximate:
+				bounds.componentEccentricities(component)
+		for j in component:
+			visited[j] = True
+	exact = all(bounds.settled(i) for i in range(snapshot.vertexCount()))
+	return [bounds.scaled(v) for v in bounds.lower], [bounds.scaled(v) for v in bounds.upper], exact
@@ -5,90 +5,10 @@ from sverchok.data_structure import updateNode
 
 import topologic
 import cppyy
-# From https://stackabuse.com/python-how-to-flatten-list-of-lists/
-def flatten(element):
-	returnList = []
-	if isinstance(element, list) == True:
-		for anItem in element:
-			returnList = returnList + flatten(anItem)
-	else:
-		returnList = [element]
-	return returnList
 
-def repeat(list):
-	maxLength = len(list[0])
-	for aSubList in list:
-		newLength = len(aSubList)
-		if newLength > maxLength:
-			maxLength = newLength
-	for anItem in list:
-		if (len(anItem) > 0):
-			itemToAppend = anItem[-1]
-		else:
-			itemToAppend = None
-		for i in range(len(anItem), maxLength):
-			anItem.append(itemToAppend)
-	return list
-
-# From https://stackoverflow.com/questions/34432056/repeat-elements-of-list-between-each-other-until-we-reach-a-certain-length
-def onestep(cur,y,base):
-    # one step of the iteration
-    if cur is not None:
-        y.append(cur)
-        base.append(cur)
-    else:
-        y.append(base[0])  # append is simplest, for now
-        base = base[1:]+[base[0]]  # rotate
-    return base
-
-def iterate(list):
-	maxLength = len(list[0])
-	returnList = []
-	for aSubList in list:
-		newLength = len(aSubList)
-		if newLength > maxLength:
-			maxLength = newLength
-	for anItem in list:
-		for i in range(len(anItem), maxLength):
-			anItem.append(None)
-		y=[]
-		base=[]
-		for cur in anItem:
-			base = onestep(cur,y,base)
-			# print(base,y)
-		returnList.append(y)
-	return returnList
-
-def trim(list):
-	minLength = len(list[0])
-	returnList = []
-	for aSubList in list:
-		newLength = len(aSubList)
-		if newLength < minLength:
-			minLength = newLength
-	for anItem in list:
-		anItem = anItem[:minLength]
-		returnList.append(anItem)
-	return returnList
-
-# Adapted from https://stackoverflow.com/questions/533905/get-the-cartesian-product-of-a-series-of-lists
-def lace(ar_list):
-    if not ar_list:
-        yield []
-    else:
-        for a in ar_list[0]:
-            for prod in lace(ar_list[1:]):
-                yield [a,]+prod
-
-def transposeList(l):
-	length = len(l[0])
-	returnList = []
-	for i in range(length):
-		tempRow = []
-		for j in range(len(l)):
-			tempRow.append(l[j][i])
-		returnList.append(tempRow)
-	return returnList
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.Replication')
+from topologicsverchok.nodes.Topologic.Replication import replicateInputs
 
 def processItem(item, tol):
 	sv = item[0]
@@ -137,17 +57,10 @@ class SvEdgeByStartVertexEndVertex(bpy.types.Node, SverchCustomTreeNode):
 		evList = self.inputs['EndVertex'].sv_get(deepcopy=True)
 		tolerance = self.inputs['Tolerance'].sv_get(deepcopy=False)[0][0]
 		inputs = []
-		if ((self.Lacing) == "Trim"):
-			inputs = trim([svList, evList])
-			inputs = transposeList(inputs)
-		elif ((self.Lacing) == "Iterate"):
-			inputs = iterate([svList, evList])
-			inputs = transposeList(inputs)
-		elif ((self.Lacing) == "Repeat"):
-			inputs = repeat([svList, evList])
-			inputs = transposeList(inputs)
-		elif ((self.Lacing) == "Lace"):
-			inputs = list(lace([svList, evList]))
+		if ((self.Lacing) == "Lace"):
+			inputs = replicateInputs([svList, evList], "Interlace")
+		else:
+			inputs = replicateInputs([svList, evList], self.Lacing)
 		outputs = []
 		for anInput in inputs:
 			anOutput = processItem(anInput, tolerance)
@@ -10,38 +10,82 @@ import time
 
 import importlib
 importlib.import_module('topologicsverchok.nodes.Topologic.Replication')
-from topologicsverchok.nodes.Topologic.Replication import flatten, repeat, onestep, iterate, trim, interlace, transposeList
+importlib.import_module('topologicsverchok.nodes.Topologic.GraphSnapshot')
+importlib.import_module('topologicsverchok.nodes.Topologic.Paths')
+from topologicsverchok.nodes.Topologic.Replication import flatten, replicateInputs
+from topologicsverchok.nodes.Topologic.GraphSnapshot import graphSnapshot
+from topologicsverchok.nodes.Topologic.Paths import allPaths, kShortestPaths, pathPage, pathWire, PathCosts
+
 replication = [("Default", "Default", "", 1),("Trim", "Trim", "", 2),("Iterate", "Iterate", "", 3),("Repeat", "Repeat", "", 4),("Interlace", "Interlace", "", 5)]
+methods = [("All", "All", "Every simple path, depth first", 1),("K-Shortest", "K-Shortest", "Simple paths in order of increasing cost (Yen)", 2)]
+
+def graphVertexIndex(snapshot, vertex):
+	i = snapshot.vertexIndex(vertex)
+	if i == None:
+		raise Exception("Error: The input Vertex ("+str(vertex.X())+", "+str(vertex.Y())+", "+str(vertex.Z())+") is not a Vertex of the Graph")
+	return i
 
-def processItem(item):
-	graph = item[0]
-	vertexA = item[1]
-	vertexB = item[2]
-	timeLimit = item[3]
-	paths = cppyy.gbl.std.list[topologic.Wire.Ptr]()
-	_ = graph.AllPaths(vertexA, vertexB, True, timeLimit, paths)
-	return list(paths)
+def processItem(item, method="All", withWires=True):
+	# Returns the Wires (or None), the vertex indices and the costs of the paths of the requested page
+	# Paths are generated lazily, so only the paths up to the end of the page are enumerated
+	graph, vertexA, vertexB, vertexKey, edgeKey, maxPaths, maxLength, page, pageSize, timeLimit, tolerance = item
+	snapshot = graphSnapshot(graph, tolerance)
+	source = graphVertexIndex(snapshot, vertexA)
+	target = graphVertexIndex(snapshot, vertexB)
+	if method == "K-Shortest":
+		paths = kShortestPaths(snapshot, source, target, edgeKey, vertexKey, maxLength, timeLimit)
+	else:
+		paths = allPaths(snapshot, source, target, maxLength, timeLimit)
+	paths = pathPage(paths, maxPaths, page, pageSize)
+	# All enumerates paths whatever the weights, so its costs are summed without the check for negative weights
+	costs = PathCosts(snapshot, edgeKey, vertexKey, allowNegative=(method != "K-Shortest"))
+	wires = [pathWire(snapshot, aPath) for aPath in paths] if withWires else None
+	return wires, paths, [costs.pathCost(aPath) for aPath in paths]
 
 
 class SvGraphAllPaths(bpy.types.Node, SverchCustomTreeNode):
 	"""
 	Triggers: Topologic
-	Tooltip: Outputs all the found Paths, within the allowed time limit in seconds, that connect the input Vertices within the input Graph
+	Tooltip: Outputs a page of the Paths, found within the allowed time limit in seconds, that connect the input Vertices within the input Graph
 	"""
 	bl_idname = 'SvGraphAllPaths'
 	bl_label = 'Graph.AllPaths'
 	Replication: EnumProperty(name="Replication", description="Replication", default="Default", items=replication, update=updateNode)
+	Method: EnumProperty(name="Method", description="Method", default="All", items=methods, update=updateNode)
+	VertexKey: StringProperty(name='VertexKey', update=updateNode)
+	EdgeKey: StringProperty(name='EdgeKey', update=updateNode)
+	MaxPaths: IntProperty(name="Max Paths", description="Stop after this many paths. 0 has no limit", default=0, min=0, update=updateNode)
+	MaxLength: IntProperty(name="Max Length", description="Largest number of edges of a path. 0 has no limit", default=0, min=0, update=updateNode)
+	Page: IntProperty(name="Page", default=0, min=0, update=updateNode)
+	PageSize: IntProperty(name="Page Size", description="Number of paths per page. 0 outputs every path", default=0, min=0, update=updateNode)
 	TimeLimit: IntProperty(name="Time Limit", default=10, min=1, update=updateNode)
+	ToleranceProp: FloatProperty(name="Tolerance", default=0.0001, precision=4, update=updateNode)
 
 	def sv_init(self, context):
 		self.inputs.new('SvStringsSocket', 'Graph')
 		self.inputs.new('SvStringsSocket', 'Vertex A')
 		self.inputs.new('SvStringsSocket', 'Vertex B')
+		self.inputs.new('SvStringsSocket', 'Vertex Key').prop_name='VertexKey'
+		self.inputs.new('SvStringsSocket', 'Edge Key').prop_name='EdgeKey'
+		self.inputs.new('SvStringsSocket', 'Max Paths').prop_name='MaxPaths'
+		self.inputs.new('SvStringsSocket', 'Max Length').prop_name='MaxLength'
+		self.inputs.new('SvStringsSocket', 'Page').prop_name='Page'
+		self.inputs.new('SvStringsSocket', 'Page Size').prop_name='PageSize'
 		self.inputs.new('SvStringsSocket', 'Time Limit').prop_name="TimeLimit"
+		self.inputs.new('SvStringsSocket', 'Tolerance').prop_name = 'ToleranceProp'
 		self.outputs.new('SvStringsSocket', 'Paths')
+		self.outputs.new('SvStringsSocket', 'Path Indices')
+		self.outputs.new('SvStringsSocket', 'Costs')
 
 	def draw_buttons(self, context, layout):
 		layout.prop(self, "Replication",text="")
+		layout.prop(self, "Method",text="")
+
+	def inputValues(self, name, default):
+		# Nodes created before this input was added do not have it and use the default
+		if name not in self.inputs:
+			return [default]
+		return flatten(self.inputs[name].sv_get(deepcopy=True))
 
 	def process(self):
 		start = time.time()
@@ -51,30 +95,27 @@ class SvGraphAllPaths(bpy.types.Node, SverchCustomTreeNode):
 		graphList = self.inputs['Graph'].sv_get(deepcopy=True)
 		vertexAList = self.inputs['Vertex A'].sv_get(deepcopy=True)
 		vertexBList = self.inputs['Vertex B'].sv_get(deepcopy=True)
-		timeLimitList = self.inputs['Time Limit'].sv_get(deepcopy=True)
 		graphList = flatten(graphList)
 		vertexAList = flatten(vertexAList)
 		vertexBList = flatten(vertexBList)
-		timeLimitList = flatten(timeLimitList)
-		inputs = [graphList, vertexAList, vertexBList, timeLimitList]
-		outputs = []
-		if ((self.Replication) == "Default"):
-			inputs = iterate(inputs)
-			inputs = transposeList(inputs)
-		elif ((self.Replication) == "Trim"):
-			inputs = trim(inputs)
-			inputs = transposeList(inputs)
-		elif ((self.Replication) == "Iterate"):
-			inputs = iterate(inputs)
-			inputs = transposeList(inputs)
-		elif ((self.Replication) == "Repeat"):
-			inputs = repeat(inputs)
-			inputs = transposeList(inputs)
-		elif ((self.Replication) == "Interlace"):
-			inputs = list(interlace(inputs))
+		inputs = [graphList, vertexAList, vertexBList]
+		for aName, aDefault in [('Vertex Key', self.VertexKey), ('Edge Key', self.EdgeKey), ('Max Paths', self.MaxPaths), ('Max Length', self.MaxLength), ('Page', self.Page), ('Page Size', self.PageSize), ('Time Limit', self.TimeLimit), ('Tolerance', self.ToleranceProp)]:
+			inputs.append(self.inputValues(aName, aDefault))
+		withWires = self.outputs['Paths'].is_linked
+		wireList = []
+		indexList = []
+		costList = []
+		inputs = replicateInputs(inputs, self.Replication)
 		for anInput in inputs:
-			outputs.append(processItem(anInput))
-		self.outputs['Paths'].sv_set(outputs)
+			wires, paths, costs = processItem(anInput, self.Method, withWires)
+			wireList.append(wires)
+			indexList.append(paths)
+			costList.append(costs)
+		self.outputs['Paths'].sv_set(wireList if withWires else [])
+		# Nodes created before these outputs were added do not have them
+		for name, values in [('Path Indices', indexList), ('Costs', costList)]:
+			if name in self.outputs:
+				self.outputs[name].sv_set(values)
 		end = time.time()
 		print("Graph All Paths Operation consumed "+str(round(end - start,4))+" seconds")
 def register():
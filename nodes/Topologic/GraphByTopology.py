@@ -8,90 +8,11 @@ from topologic import Vertex, Edge, Wire, Face, Shell, Cell, CellComplex, Cluste
 import cppyy
 import time
 
-# From https://stackabuse.com/python-how-to-flatten-list-of-lists/
-def flatten(element):
-	returnList = []
-	if isinstance(element, list) == True:
-		for anItem in element:
-			returnList = returnList + flatten(anItem)
-	else:
-		returnList = [element]
-	return returnList
-
-def repeat(list):
-	maxLength = len(list[0])
-	for aSubList in list:
-		newLength = len(aSubList)
-		if newLength > maxLength:
-			maxLength = newLength
-	for anItem in list:
-		if (len(anItem) > 0):
-			itemToAppend = anItem[-1]
-		else:
-			itemToAppend = None
-		for i in range(len(anItem), maxLength):
-			anItem.append(itemToAppend)
-	return list
-
-# From https://stackoverflow.com/questions/34432056/repeat-elements-of-list-between-each-other-until-we-reach-a-certain-length
-def onestep(cur,y,base):
-    # one step of the iteration
-    if cur is not None:
-        y.append(cur)
-        base.append(cur)
-    else:
-        y.append(base[0])  # append is simplest, for now
-        base = base[1:]+[base[0]]  # rotate
-    return base
-
-def iterate(list):
-	maxLength = len(list[0])
-	returnList = []
-	for aSubList in list:
-		newLength = len(aSubList)
-		if newLength > maxLength:
-			maxLength = newLength
-	for anItem in list:
-		for i in range(len(anItem), maxLength):
-			anItem.append(None)
-		y=[]
-		base=[]
-		for cur in anItem:
-			base = onestep(cur,y,base)
-		returnList.append(y)
-	return returnList
-
-def trim(list):
-	minLength = len(list[0])
-	returnList = []
-	for aSubList in list:
-		newLength = len(aSubList)
-		if newLength < minLength:
-			minLength = newLength
-	for anItem in list:
-		anItem = anItem[:minLength]
-		returnList.append(anItem)
-	return returnList
-
-# Adapted from https://stackoverflow.com/questions/533905/get-the-cartesian-product-of-a-series-of-lists
-def interlace(ar_list):
-    if not ar_list:
-        yield []
-    else:
-        for a in ar_list[0]:
-            for prod in interlace(ar_list[1:]):
-                yield [a,]+prod
-
-def transposeList(l):
-	length = len(l[0])
-	returnList = []
-	for i in range(length):
-		tempRow = []
-		for j in range(len(l)):
-			tempRow.append(l[j][i])
-		returnList.append(tempRow)
-	return returnList
-
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.Replication')
+importlib.import_module('topologicsverchok.nodes.Topologic.Selector')
+from topologicsverchok.nodes.Topologic.Replication import flatten, replicateInputs
+from topologicsverchok.nodes.Topologic.Selector import internalVertex, cellInternalVertex, faceInternalVertex, centerOfMass, shapeHash
 
 def classByType(argument):
 	switcher = {
@@ -109,54 +30,6 @@ def fixTopologyClass(topology):
   topology.__class__ = classByType(topology.GetType())
   return topology
 
-def internalVertex(topology, tolerance):
-	topology = fixTopologyClass(topology)
-	vst = None
-	classType = topology.GetType()
-	if classType == 64: #CellComplex
-		tempCells = cppyy.gbl.std.list[topologic.Cell.Ptr]()
-		_ = topology.Cells(tempCells)
-		tempCell = tempCells.front()
-		vst = topologic.CellUtility.InternalVertex(tempCell, tolerance)
-	elif classType == 32: #Cell
-		vst = topologic.CellUtility.InternalVertex(topology, tolerance)
-	elif classType == 16: #Shell
-		tempFaces = cppyy.gbl.std.list[topologic.Face.Ptr]()
-		_ = topology.Faces(tempFaces)
-		tempFace = tempFaces.front()
-		vst = topologic.FaceUtility.InternalVertex(tempFace, tolerance)
-	elif classType == 8: #Face
-		vst = topologic.FaceUtility.InternalVertex(topology, tolerance)
-	elif classType == 4: #Wire
-		if topology.IsClosed():
-			internalBoundaries = cppyy.gbl.std.list[topologic.Wire.Ptr]()
-			tempFace = topologic.Face.ByExternalInternalBoundaries(topology, internalBoundaries)
-			vst = topologic.FaceUtility.InternalVertex(tempFace, tolerance)
-		else:
-			tempEdges = cppyy.gbl.std.list[topologic.Edge.Ptr]()
-			_ = topology.Edges(tempEdges)
-			vst = topologic.EdgeUtility.PointAtParameter(tempVertex.front(), 0.5)
-	elif classType == 2: #Edge
-		vst = topologic.EdgeUtility.PointAtParameter(topology, 0.5)
-	elif classType == 1: #Vertex
-		vst = topology
-	else:
-		vst = topology.CenterOfMass()
-	return vst
-
-def relevantSelector(topology):
-	returnVertex = None
-	if topology.GetType() == topologic.Vertex.Type():
-		return topology
-	elif topology.GetType() == topologic.Edge.Type():
-		return topologic.EdgeUtility.PointAtParameter(topology, 0.5)
-	elif topology.GetType() == topologic.Face.Type():
-		return topologic.FaceUtility.InternalVertex(topology)
-	elif topology.GetType() == topologic.Cell.Type():
-		return topologic.CellUtility.InternalVertex(topology)
-	else:
-		return topology.CenterOfMass()
-
 def topologyContains(topology, vertex, tol):
 	contains = False
 	if topology.GetType() == topologic.Vertex.Type():
@@ -276,6 +149,53 @@ def mergeDictionaries(sources):
 		return newDict
 	return None
 
+def faceIncidence(cells):
+	# Returns the faces of the cells, for each face the indices of the cells that share it and for each cell the indices of its faces
+	# Faces are matched by shape hash and IsSame in a single pass over the faces of each cell
+	faces = []
+	faceCells = []
+	cellFaces = []
+	buckets = {}
+	for i in range(len(cells)):
+		cellFaces.append([])
+		stlFaces = cppyy.gbl.std.list[topologic.Face.Ptr]()
+		_ = cells[i].Faces(stlFaces)
+		for aFace in stlFaces:
+			bucket = buckets.setdefault(shapeHash(aFace), [])
+			index = None
+			for k in bucket:
+				if faces[k].IsSame(aFace):
+					index = k
+					break
+			if index == None:
+				index = len(faces)
+				faces.append(aFace)
+				faceCells.append([])
+				bucket.append(index)
+			if i not in faceCells[index]:
+				faceCells[index].append(i)
+				cellFaces[i].append(index)
+	return faces, faceCells, cellFaces
+
+def sharedFacesByCellPair(faceCells):
+	# Maps each pair of cell indices (i < j) to the indices of the faces they share
+	pairs = {}
+	for k in range(len(faceCells)):
+		sharingCells = sorted(faceCells[k])
+		for a in range(len(sharingCells)):
+			for b in range(a+1, len(sharingCells)):
+				pairs.setdefault((sharingCells[a], sharingCells[b]), []).append(k)
+	return pairs
+
+def representativeVertex(topology, useInternalVertex, tolerance):
+	# Returns the vertex that stands for the topology in the graph, carrying the topology's dictionary
+	if useInternalVertex == True:
+		v = internalVertex(topology, tolerance)
+	else:
+		v = centerOfMass(topology)
+	_ = v.SetDictionary(topology.GetDictionary())
+	return v
+
 def processCellComplex(item):
 	topology = item[0]
 	direct = item[1]
@@ -289,170 +209,71 @@ def processCellComplex(item):
 	graph = None
 	edges = cppyy.gbl.std.list[topologic.Edge.Ptr]()
 	vertices = cppyy.gbl.std.list[topologic.Vertex.Ptr]()
-	cellmat = []
-	if direct == True:
-		cells = cppyy.gbl.std.list[topologic.Cell.Ptr]()
-		_ = topology.Cells(cells)
-		cells = list(cells)
-		# Create a matrix of zeroes
-		for i in range(len(cells)):
-			cellRow = []
-			for j in range(len(cells)):
-				cellRow.append(0)
-			cellmat.append(cellRow)
-		for i in range(len(cells)):
-			for j in range(len(cells)):
-				if (i != j) and cellmat[i][j] == 0:
-					cellmat[i][j] = 1
-					cellmat[j][i] = 1
-					sharedt = cppyy.gbl.std.list[topologic.Topology.Ptr]()
-					cells[i].SharedTopologies(cells[j], 8, sharedt)
-					sharedt = list(sharedt)
-					if len(sharedt) > 0:
-						if useInternalVertex == True:
-							v1 = topologic.CellUtility.InternalVertex(cells[i], tolerance)
-							v2 = topologic.CellUtility.InternalVertex(cells[j], tolerance)
-						else:
-							v1 = cells[i].CenterOfMass()
-							v2 = cells[j].CenterOfMass()
-						e = topologic.Edge.ByStartVertexEndVertex(v1, v2)
-						mDict = mergeDictionaries(sharedt)
-						if mDict:
-							e.SetDictionary(mDict)
-						edges.push_back(e)
-	if directApertures == True:
-		cellmat = []
-		cells = cppyy.gbl.std.list[topologic.Cell.Ptr]()
-		_ = topology.Cells(cells)
-		cells = list(cells)
-		# Create a matrix of zeroes
-		for i in range(len(cells)):
-			cellRow = []
-			for j in range(len(cells)):
-				cellRow.append(0)
-			cellmat.append(cellRow)
-		for i in range(len(cells)):
-			for j in range(len(cells)):
-				if (i != j) and cellmat[i][j] == 0:
-					cellmat[i][j] = 1
-					cellmat[j][i] = 1
-					sharedt = cppyy.gbl.std.list[topologic.Topology.Ptr]()
-					cells[i].SharedTopologies(cells[j], 8, sharedt)
-					sharedt = list(sharedt)
-					if len(sharedt) > 0:
-						apertureExists = False
-						for x in sharedt:
-							apList = cppyy.gbl.std.list[topologic.Aperture.Ptr]()
-							_ = x.Apertures(ap)
-							apList = list(ap)
-							if len(apList) > 0:
-								apTopList = []
-								for ap in apList:
-									apTopList.append(ap.Topology())
-								apertureExists = True
-								break
-						if apertureExists:
-							if useInternalVertex == True:
-								v1 = topologic.CellUtility.InternalVertex(cells[i], tolerance)
-								v2 = topologic.CellUtility.InternalVertex(cells[j], tolerance)
-							else:
-								v1 = cells[i].CenterOfMass()
-								v2 = cells[j].CenterOfMass()
-							e = topologic.Edge.ByStartVertexEndVertex(v1, v2)
-							mDict = mergeDictionaries(apTopList)
-							if mDict:
-								e.SetDictionary(mDict)
-							edges.push_back(e)
-
 	cells = cppyy.gbl.std.list[topologic.Cell.Ptr]()
 	_ = topology.Cells(cells)
-	if (viaSharedTopologies == True) or (viaSharedApertures == True) or (toExteriorTopologies == True) or (toExteriorApertures == True):
-		for aCell in cells:
-			if useInternalVertex == True:
-				vCell = topologic.CellUtility.InternalVertex(aCell, tolerance)
-			else:
-				vCell = aCell.CenterOfMass()
-			_ = vCell.SetDictionary(aCell.GetDictionary())
-			vertices.push_back(vCell)
-			faces = cppyy.gbl.std.list[topologic.Face.Ptr]()
-			_ = aCell.Faces(faces)
-			sharedTopologies = []
-			exteriorTopologies = []
-			sharedApertures = []
-			exteriorApertures = []
-			for aFace in faces:
-				cells = cppyy.gbl.std.list[topologic.Cell.Ptr]()
-				_ = aFace.Cells(cells)
-				cells = list(cells)
-				if len(cells) > 1:
-					sharedTopologies.append(aFace)
-					apertures = cppyy.gbl.std.list[topologic.Aperture.Ptr]()
-					_ = aFace.Apertures(apertures)
-					for anAperture in apertures:
-						sharedApertures.append(anAperture)
-				else:
-					exteriorTopologies.append(aFace)
-					apertures = cppyy.gbl.std.list[topologic.Aperture.Ptr]()
-					_ = aFace.Apertures(apertures)
-					for anAperture in apertures:
-						exteriorApertures.append(anAperture)
-			if viaSharedTopologies:
-				for sharedTopology in sharedTopologies:
-					if useInternalVertex == True:
-						vst = internalVertex(sharedTopology, tolerance)
-					else:
-						vst = sharedTopology.CenterOfMass()
-					_ = vst.SetDictionary(sharedTopology.GetDictionary())
-					vertices.push_back(vst)
-					edges.push_back(topologic.Edge.ByStartVertexEndVertex(vCell, vst))
-			if viaSharedApertures:
-				for sharedAperture in sharedApertures:
-					if useInternalVertex == True:
-						vst = internalVertex(sharedAperture.Topology(), tolerance)
-					else:
-						vst = sharedAperture.Topology().CenterOfMass()
-					_ = vst.SetDictionary(sharedAperture.Topology().GetDictionary())
-					vertices.push_back(vst)
-					edges.push_back(topologic.Edge.ByStartVertexEndVertex(vCell, vst))
-			if toExteriorTopologies:
-				for exteriorTopology in exteriorTopologies:
-					if useInternalVertex == True:
-						vst = internalVertex(exteriorTopology, tolerance)
-					else:
-						vst = exteriorTopology.CenterOfMass()
-					_ = vst.SetDictionary(exteriorTopology.GetDictionary())
-					vertices.push_back(vst)
-					edges.push_back(topologic.Edge.ByStartVertexEndVertex(vCell, vst))
-			if toExteriorApertures:
-				for exteriorAperture in exteriorApertures:
-					extTop = exteriorAperture.Topology()
-					if useInternalVertex == True:
-						vst = internalVertex(extTop, tolerance)
-					else:
-						vst = exteriorAperture.Topology().CenterOfMass()
-					_ = vst.SetDictionary(exteriorAperture.Topology().GetDictionary())
-					vertices.push_back(vst)
-					edges.push_back(topologic.Edge.ByStartVertexEndVertex(vCell, vst))
+	cells = list(cells)
+	# One vertex per cell, shared by every edge that reaches the cell, so the graph needs no SelfMerge to weld them
+	cellVertices = [representativeVertex(aCell, useInternalVertex, tolerance) for aCell in cells]
+	faces, faceCells, cellFaces = faceIncidence(cells)
+	faceApertures = {}
+	def aperturesOf(k):
+		if k not in faceApertures:
+			apertures = cppyy.gbl.std.list[topologic.Aperture.Ptr]()
+			_ = faces[k].Apertures(apertures)
+			faceApertures[k] = list(apertures)
+		return faceApertures[k]
+	if (direct == True) or (directApertures == True):
+		pairs = sharedFacesByCellPair(faceCells)
+		if direct == True:
+			for i, j in sorted(pairs):
+				e = topologic.Edge.ByStartVertexEndVertex(cellVertices[i], cellVertices[j])
+				mDict = mergeDictionaries([faces[k] for k in pairs[(i, j)]])
+				if mDict:
+					e.SetDictionary(mDict)
+				edges.push_back(e)
+		if directApertures == True:
+			for i, j in sorted(pairs):
+				apTopList = None
+				for k in pairs[(i, j)]:
+					apList = aperturesOf(k)
+					if len(apList) > 0:
+						apTopList = [ap.Topology() for ap in apList]
+						break
+				if apTopList != None:
+					e = topologic.Edge.ByStartVertexEndVertex(cellVertices[i], cellVertices[j])
+					mDict = mergeDictionaries(apTopList)
+					if mDict:
+						e.SetDictionary(mDict)
+					edges.push_back(e)
 
-	for aCell in cells:
-		if useInternalVertex == True:
-			vCell = internalVertex(aCell, tolerance)
-		else:
-			vCell = aCell.CenterOfMass()
-		_ = vCell.SetDictionary(aCell.GetDictionary())
+	if (viaSharedTopologies == True) or (viaSharedApertures == True) or (toExteriorTopologies == True) or (toExteriorApertures == True):
+		# Faces and apertures shared by two cells get one vertex that both cells connect to
+		faceVertices = {}
+		apertureVertices = {}
+		for i in range(len(cells)):
+			vCell = cellVertices[i]
+			for k in cellFaces[i]:
+				isShared = len(faceCells[k]) > 1
+				if (isShared and viaSharedTopologies) or (not isShared and toExteriorTopologies):
+					if k not in faceVertices:
+						faceVertices[k] = representativeVertex(faces[k], useInternalVertex, tolerance)
+						vertices.push_back(faceVertices[k])
+					edges.push_back(topologic.Edge.ByStartVertexEndVertex(vCell, faceVertices[k]))
+				if (isShared and viaSharedApertures) or (not isShared and toExteriorApertures):
+					if k not in apertureVertices:
+						apertureVertices[k] = [representativeVertex(anAperture.Topology(), useInternalVertex, tolerance) for anAperture in aperturesOf(k)]
+						for vst in apertureVertices[k]:
+							vertices.push_back(vst)
+					for vst in apertureVertices[k]:
+						edges.push_back(topologic.Edge.ByStartVertexEndVertex(vCell, vst))
+
+	for vCell in cellVertices:
 		vertices.push_back(vCell)
 	finalTopologies = cppyy.gbl.std.list[topologic.Topology.Ptr]()
 	if len(list(edges)) > 0:
 		for e in edges:
 			finalTopologies.push_back(e)
 	if len(list(vertices)) > 0:
-		for v in vertices:
-			finalTopologies.push_back(v)
-		cluster = topologic.Cluster.ByTopologies(finalTopologies)
-		cluster = cluster.SelfMerge()
-		graph = topologic.Graph.ByTopology(cluster, True, False, False, False, False, False, tolerance)
-		return graph
-	elif len(list(vertices)) > 0:
 		for v in vertices:
 			finalTopologies.push_back(v)
 		cluster = topologic.Cluster.ByTopologies(finalTopologies)
@@ -471,9 +292,9 @@ def processCell(item):
 	edges = cppyy.gbl.std.list[topologic.Edge.Ptr]()
 
 	if useInternalVertex == True:
-		vCell = topologic.CellUtility.InternalVertex(cell, tolerance)
+		vCell = cellInternalVertex(cell, tolerance)
 	else:
-		vCell = cell.CenterOfMass()
+		vCell = centerOfMass(cell)
 
 	if (toExteriorTopologies == True) or (toExteriorApertures == True):
 		vertices.push_back(vCell)
@@ -492,7 +313,7 @@ def processCell(item):
 					if useInternalVertex == True:
 						vst = internalVertex(exteriorTopology, tolerance)
 					else:
-						vst = exteriorTopology.CenterOfMass()
+						vst = centerOfMass(exteriorTopology)
 					_ = vst.SetDictionary(exteriorTopology.GetDictionary())
 					vertices.push_back(vst)
 					edges.push_back(topologic.Edge.ByStartVertexEndVertex(vCell, vst))
@@ -502,7 +323,7 @@ def processCell(item):
 					if useInternalVertex == True:
 						vst = internalVertex(extTop, tolerance)
 					else:
-						vst = exteriorAperture.Topology().CenterOfMass()
+						vst = centerOfMass(exteriorAperture.Topology())
 					_ = vst.SetDictionary(exteriorAperture.Topology().GetDictionary())
 					vertices.push_back(vst)
 					edges.push_back(topologic.Edge.ByStartVertexEndVertex(vCell, vst))
@@ -556,11 +377,11 @@ def processShell(item):
 					sharedt = list(sharedt)
 					if len(sharedt) > 0:
 						if useInternalVertex == True:
-							v1 = topologic.FaceUtility.InternalVertex(topFaces[i], tolerance)
-							v2 = topologic.FaceUtility.InternalVertex(topFaces[j], tolerance)
+							v1 = faceInternalVertex(topFaces[i], tolerance)
+							v2 = faceInternalVertex(topFaces[j], tolerance)
 						else:
-							v1 = topFaces[i].CenterOfMass()
-							v2 = topFaces[j].CenterOfMass()
+							v1 = centerOfMass(topFaces[i])
+							v2 = centerOfMass(topFaces[j])
 						e = topologic.Edge.ByStartVertexEndVertex(v1, v2)
 						mDict = mergeDictionaries(sharedt)
 						if mDict:
@@ -598,11 +419,11 @@ def processShell(item):
 							for ap in apList:
 								apTopList.append(ap.Topology())
 							if useInternalVertex == True:
-								v1 = topologic.FaceUtility.InternalVertex(topFaces[i], tolerance)
-								v2 = topologic.FaceUtility.InternalVertex(topFaces[j], tolerance)
+								v1 = faceInternalVertex(topFaces[i], tolerance)
+								v2 = faceInternalVertex(topFaces[j], tolerance)
 							else:
-								v1 = topFaces[i].CenterOfMass()
-								v2 = topFaces[j].CenterOfMass()
+								v1 = centerOfMass(topFaces[i])
+								v2 = centerOfMass(topFaces[j])
 							e = topologic.Edge.ByStartVertexEndVertex(v1, v2)
 							mDict = mergeDictionaries(apTopList)
 							if mDict:
@@ -614,9 +435,9 @@ def processShell(item):
 	if (viaSharedTopologies == True) or (viaSharedApertures == True) or (toExteriorTopologies == True) or (toExteriorApertures == True):
 		for aFace in topFaces:
 			if useInternalVertex == True:
-				vFace = topologic.FaceUtility.InternalVertex(aFace, tolerance)
+				vFace = faceInternalVertex(aFace, tolerance)
 			else:
-				vFace = aFace.CenterOfMass()
+				vFace = centerOfMass(aFace)
 			_ = vFace.SetDictionary(aFace.GetDictionary())
 			vertices.push_back(vFace)
 			fEdges = cppyy.gbl.std.list[topologic.Edge.Ptr]()
@@ -646,7 +467,7 @@ def processShell(item):
 					if useInternalVertex == True:
 						vst = internalVertex(sharedTopology, tolerance)
 					else:
-						vst = sharedTopology.CenterOfMass()
+						vst = centerOfMass(sharedTopology)
 					_ = vst.SetDictionary(sharedTopology.GetDictionary())
 					vertices.push_back(vst)
 					edges.push_back(topologic.Edge.ByStartVertexEndVertex(vFace, vst))
@@ -655,7 +476,7 @@ def processShell(item):
 					if useInternalVertex == True:
 						vst = internalVertex(sharedAperture.Topology(), tolerance)
 					else:
-						vst = sharedAperture.Topology().CenterOfMass()
+						vst = centerOfMass(sharedAperture.Topology())
 					_ = vst.SetDictionary(sharedAperture.Topology().GetDictionary())
 					vertices.push_back(vst)
 					edges.push_back(topologic.Edge.ByStartVertexEndVertex(vFace, vst))
@@ -664,7 +485,7 @@ def processShell(item):
 					if useInternalVertex == True:
 						vst = internalVertex(exteriorTopology, tolerance)
 					else:
-						vst = exteriorTopology.CenterOfMass()
+						vst = centerOfMass(exteriorTopology)
 					_ = vst.SetDictionary(exteriorTopology.GetDictionary())
 					vertices.push_back(vst)
 					edges.push_back(topologic.Edge.ByStartVertexEndVertex(vFace, vst))
@@ -674,7 +495,7 @@ def processShell(item):
 					if useInternalVertex == True:
 						vst = internalVertex(extTop, tolerance)
 					else:
-						vst = exteriorAperture.Topology().CenterOfMass()
+						vst = centerOfMass(exteriorAperture.Topology())
 					_ = vst.SetDictionary(exteriorAperture.Topology().GetDictionary())
 					vertices.push_back(vst)
 					edges.push_back(topologic.Edge.ByStartVertexEndVertex(vFace, vst))
@@ -683,7 +504,7 @@ def processShell(item):
 		if useInternalVertex == True:
 			vFace = internalVertex(aFace, tolerance)
 		else:
-			vFace = aFace.CenterOfMass()
+			vFace = centerOfMass(aFace)
 		_ = vFace.SetDictionary(aFace.GetDictionary())
 		vertices.push_back(vFace)
 	finalTopologies = cppyy.gbl.std.list[topologic.Topology.Ptr]()
@@ -716,9 +537,9 @@ def processFace(item):
 	edges = cppyy.gbl.std.list[topologic.Edge.Ptr]()
 
 	if useInternalVertex == True:
-		vFace = topologic.FaceUtility.InternalVertex(face, tolerance)
+		vFace = faceInternalVertex(face, tolerance)
 	else:
-		vFace = face.CenterOfMass()
+		vFace = centerOfMass(face)
 	_ = vFace.SetDictionary(face.GetDictionary())
 
 	if (toExteriorTopologies == True) or (toExteriorApertures == True):
@@ -738,7 +559,7 @@ def processFace(item):
 					if useInternalVertex == True:
 						vst = internalVertex(exteriorTopology, tolerance)
 					else:
-						vst = exteriorTopology.CenterOfMass()
+						vst = centerOfMass(exteriorTopology)
 					_ = vst.SetDictionary(exteriorTopology.GetDictionary())
 					vertices.push_back(vst)
 					edges.push_back(topologic.Edge.ByStartVertexEndVertex(vFace, vst))
@@ -748,7 +569,7 @@ def processFace(item):
 					if useInternalVertex == True:
 						vst = internalVertex(extTop, tolerance)
 					else:
-						vst = exteriorAperture.Topology().CenterOfMass()
+						vst = centerOfMass(exteriorAperture.Topology())
 					_ = vst.SetDictionary(exteriorAperture.Topology().GetDictionary())
 					vertices.push_back(vst)
 					edges.push_back(topologic.Edge.ByStartVertexEndVertex(vFace, vst))
@@ -804,11 +625,11 @@ def processWire(item):
 						try:
 							v1 = topologic.EdgeUtility.PointAtParameter(topEdges[i], 0.5)
 						except:
-							v1 = topEdges[j].CenterOfMass()
+							v1 = centerOfMass(topEdges[j])
 						try:
 							v2 = topologic.EdgeUtility.PointAtParameter(topEdges[j], 0.5)
 						except:
-							v2 = topEdges[j].CenterOfMass()
+							v2 = centerOfMass(topEdges[j])
 						e = topologic.Edge.ByStartVertexEndVertex(v1, v2)
 						mDict = mergeDictionaries(sharedt)
 						if mDict:
@@ -845,11 +666,11 @@ def processWire(item):
 							try:
 								v1 = topologic.EdgeUtility.PointAtParameter(topEdges[i], 0.5)
 							except:
-								v1 = topEdges[j].CenterOfMass()
+								v1 = centerOfMass(topEdges[j])
 							try:
 								v2 = topologic.EdgeUtility.PointAtParameter(topEdges[j], 0.5)
 							except:
-								v2 = topEdges[j].CenterOfMass()
+								v2 = centerOfMass(topEdges[j])
 							e = topologic.Edge.ByStartVertexEndVertex(v1, v2)
 							mDict = mergeDictionaries(ap.Topology())
 							if mDict:
@@ -863,7 +684,7 @@ def processWire(item):
 			try:
 				vEdge = topologic.EdgeUtility.PointAtParameter(anEdge, 0.5)
 			except:
-				vEdge = anEdge.CenterOfMass()
+				vEdge = centerOfMass(anEdge)
 			_ = vEdge.SetDictionary(anEdge.GetDictionary())
 			vertices.push_back(vEdge)
 			vertices = cppyy.gbl.std.list[topologic.Vertex.Ptr]()
@@ -897,7 +718,7 @@ def processWire(item):
 					if useInternalVertex == True:
 						vst = internalVertex(sharedAperture.Topology(), tolerance)
 					else:
-						vst = sharedAperture.Topology().CenterOfMass()
+						vst = centerOfMass(sharedAperture.Topology())
 					_ = vst.SetDictionary(sharedAperture.GetDictionary())
 					vertices.push_back(vst)
 					edges.push_back(topologic.Edge.ByStartVertexEndVertex(vEdge, vst))
@@ -911,7 +732,7 @@ def processWire(item):
 					if useInternalVertex == True:
 						vst = internalVertex(extTop, tolerance)
 					else:
-						vst = exteriorAperture.Topology().CenterOfMass()
+						vst = centerOfMass(exteriorAperture.Topology())
 					_ = vst.SetDictionary(exteriorAperture.Topology().GetDictionary())
 					vertices.push_back(vst)
 					edges.push_back(topologic.Edge.ByStartVertexEndVertex(vEdge, vst))
@@ -920,7 +741,7 @@ def processWire(item):
 		try:
 			vEdge = topologic.EdgeUtility.PointAtParameter(anEdge, 0.5)
 		except:
-			vEdge = anEdge.CenterOfMass()
+			vEdge = centerOfMass(anEdge)
 		_ = vEdge.SetDictionary(anEdge.GetDictionary())
 		vertices.push_back(vEdge)
 	finalTopologies = cppyy.gbl.std.list[topologic.Topology.Ptr]()
@@ -956,9 +777,9 @@ def processEdge(item):
 		try:
 			vEdge = topologic.EdgeUtility.PointAtParameter(edge, 0.5)
 		except:
-			vEdge = edge.CenterOfMass()
+			vEdge = centerOfMass(edge)
 	else:
-		vEdge = edge.CenterOfMass()
+		vEdge = centerOfMass(edge)
 	_ = vEdge.SetDictionary(edge.GetDictionary())
 
 	if (toExteriorTopologies == True) or (toExteriorApertures == True):
@@ -978,7 +799,7 @@ def processEdge(item):
 					if useInternalVertex == True:
 						vst = internalVertex(exteriorTopology, tolerance)
 					else:
-						vst = exteriorTopology.CenterOfMass()
+						vst = centerOfMass(exteriorTopology)
 					vertices.push_back(vst)
 					edges.push_back(topologic.Edge.ByStartVertexEndVertex(vEdge, vst))
 			if toExteriorApertures:
@@ -987,7 +808,7 @@ def processEdge(item):
 					if useInternalVertex == True:
 						vst = internalVertex(extTop, tolerance)
 					else:
-						vst = exteriorAperture.Topology().CenterOfMass()
+						vst = centerOfMass(exteriorAperture.Topology())
 					_ = vst.SetDictionary(exteriorAperture.Topology().GetDictionary())
 					vertices.push_back(vst)
 					edges.push_back(topologic.Edge.ByStartVertexEndVertex(vEdge, vst))
@@ -1097,19 +918,9 @@ class SvGraphByTopology(bpy.types.Node, SverchCustomTreeNode):
 		inputs = [topologyList, directList, directAperturesList, viaSharedTopologiesList, viaSharedAperturesList, toExteriorTopologiesList, toExteriorAperturesList, useInternalVertexList, toleranceList]
 		outputs = []
 		if ((self.Replication) == "Default"):
-			inputs = repeat(inputs)
-			inputs = transposeList(inputs)
-		elif ((self.Replication) == "Trim"):
-			inputs = trim(inputs)
-			inputs = transposeList(inputs)
-		elif ((self.Replication) == "Iterate"):
-			inputs = iterate(inputs)
-			inputs = transposeList(inputs)
-		elif ((self.Replication) == "Repeat"):
-			inputs = repeat(inputs)
-			inputs = transposeList(inputs)
-		elif ((self.Replication) == "Interlace"):
-			inputs = list(interlace(inputs))
+			inputs = replicateInputs(inputs, "Repeat")
+		else:
+			inputs = replicateInputs(inputs, self.Replication)
 		for anInput in inputs:
 			outputs.append(processItem(anInput))
 		self.outputs['Graph'].sv_set(outputs)
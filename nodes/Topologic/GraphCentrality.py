@@ -0,0 +1,95 @@
+import bpy
+from bpy.props import StringProperty, BoolProperty, FloatProperty, IntProperty, EnumProperty
+from sverchok.node_tree import SverchCustomTreeNode
+from sverchok.data_structure import updateNode
+
+import topologic
+from topologic import Vertex, Edge, Wire, Face, Shell, Cell, CellComplex, Cluster, Topology, Graph
+import cppyy
+import time
+
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.Replication')
+importlib.import_module('topologicsverchok.nodes.Topologic.GraphSnapshot')
+importlib.import_module('topologicsverchok.nodes.Topologic.Centrality')
+from topologicsverchok.nodes.Topologic.Replication import flatten
+from topologicsverchok.nodes.Topologic.GraphSnapshot import graphSnapshot
+from topologicsverchok.nodes.Topologic.Centrality import centrality
+
+def processItem(graph, measure, edgeKey, key, tolerance, normalize, samples, seed, parallel, workers):
+	# Writes the score of every vertex to its dictionary at the key and returns the vertices and their scores
+	snapshot = graphSnapshot(graph, tolerance)
+	scores = centrality(snapshot, measure, edgeKey, normalize, samples, seed, parallel, workers)
+	snapshot.setVertexColumn(key, scores)
+	return snapshot.vertices, scores
+
+centralityMeasures = [("Betweenness", "Betweenness", "", 1),("Closeness", "Closeness", "", 2),("Harmonic", "Harmonic", "", 3),("Eigenvector", "Eigenvector", "", 4)]
+
+class SvGraphCentrality(bpy.types.Node, SverchCustomTreeNode):
+	"""
+	Triggers: Topologic
+	Tooltip: Computes the betweenness, closeness, harmonic or eigenvector centrality of the Vertices of the input Graph and stores it in their Dictionaries
+	"""
+	bl_idname = 'SvGraphCentrality'
+	bl_label = 'Graph.Centrality'
+	Measure: EnumProperty(name="Measure", description="Centrality measure", default="Betweenness", items=centralityMeasures, update=updateNode)
+	EdgeKey: StringProperty(name='EdgeKey', description="Dictionary key of the edge weights. Leave empty to count every edge as 1", update=updateNode)
+	Key: StringProperty(name='Key', description="Dictionary key to store the centrality at. Leave empty to use the name of the measure", update=updateNode)
+	ToleranceProp: FloatProperty(name="Tolerance", default=0.0001, precision=4, update=updateNode)
+	Normalize: BoolProperty(name="Normalize", default=True, update=updateNode)
+	Samples: IntProperty(name="Samples", description="Estimate the shortest path measures from this many random source vertices. 0 uses every vertex", default=0, min=0, update=updateNode)
+	Seed: IntProperty(name="Seed", description="Seed of the random choice of source vertices", default=0, min=0, update=updateNode)
+	Parallel: BoolProperty(name="Parallel", description="Split the source vertices between a pool of worker processes", default=False, update=updateNode)
+	Workers: IntProperty(name="Workers", description="Number of worker processes. 0 uses one per CPU core", default=0, min=0, update=updateNode)
+
+	def sv_init(self, context):
+		self.inputs.new('SvStringsSocket', 'Graph')
+		self.inputs.new('SvStringsSocket', 'Edge Key').prop_name='EdgeKey'
+		self.inputs.new('SvStringsSocket', 'Key').prop_name='Key'
+		self.inputs.new('SvStringsSocket', 'Tolerance').prop_name = 'ToleranceProp'
+		self.outputs.new('SvStringsSocket', 'Graph')
+		self.outputs.new('SvStringsSocket', 'Vertices')
+		self.outputs.new('SvStringsSocket', 'Values')
+
+	def draw_buttons(self, context, layout):
+		layout.prop(self, "Measure", text="")
+		layout.prop(self, "Normalize")
+		if self.Measure != "Eigenvector":
+			layout.prop(self, "Samples")
+			if self.Samples > 0:
+				layout.prop(self, "Seed")
+			layout.prop(self, "Parallel")
+			if self.Parallel:
+				layout.prop(self, "Workers")
+
+	def process(self):
+		start = time.time()
+		if not any(socket.is_linked for socket in self.outputs):
+			return
+		if not self.inputs['Graph'].is_linked:
+			for anOutput in self.outputs:
+				anOutput.sv_set([])
+			return
+		graphList = flatten(self.inputs['Graph'].sv_get(deepcopy=False))
+		edgeKey = flatten(self.inputs['Edge Key'].sv_get(deepcopy=False))[0]
+		key = flatten(self.inputs['Key'].sv_get(deepcopy=False))[0]
+		if not key:
+			key = self.Measure
+		tolerance = flatten(self.inputs['Tolerance'].sv_get(deepcopy=False))[0]
+		vertexList = []
+		valueList = []
+		for aGraph in graphList:
+			vertices, values = processItem(aGraph, self.Measure, edgeKey, key, tolerance, self.Normalize, self.Samples, self.Seed, self.Parallel, self.Workers)
+			vertexList.append(vertices)
+			valueList.append(values)
+		self.outputs['Graph'].sv_set(graphList)
+		self.outputs['Vertices'].sv_set(vertexList)
+		self.outputs['Values'].sv_set(valueList)
+		end = time.time()
+		print("Graph.Centrality Operation consumed "+str(round(end - start,4))+" seconds")
+
+def register():
+	bpy.utils.register_class(SvGraphCentrality)
+
+def unregister():
+	bpy.utils.unregister_class(SvGraphCentrality)
@@ -1,5 +1,5 @@
 import bpy
-from bpy.props import StringProperty, BoolProperty
+from bpy.props import StringProperty, BoolProperty, FloatProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode
 
@@ -8,41 +8,89 @@ from topologic import Vertex, Edge, Wire, Face, Shell, Cell, CellComplex, Cluste
 import cppyy
 import time
 
-# From https://stackabuse.com/python-how-to-flatten-list-of-lists/
-def flatten(element):
-	returnList = []
-	if isinstance(element, list) == True:
-		for anItem in element:
-			returnList = returnList + flatten(anItem)
-	else:
-		returnList = [element]
-	return returnList
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.Replication')
+importlib.import_module('topologicsverchok.nodes.Topologic.GraphSnapshot')
+importlib.import_module('topologicsverchok.nodes.Topologic.Eccentricity')
+from topologicsverchok.nodes.Topologic.Replication import flatten
+from topologicsverchok.nodes.Topologic.GraphSnapshot import graphSnapshot
+from topologicsverchok.nodes.Topologic.Eccentricity import graphDiameter, graphEccentricities
 
-def processItem(item):
-	return item.Diameter()
+def processItem(item, edgeKey="", approximate=False, timeLimit=0, tolerance=0.0001, withEccentricities=False):
+	# Returns the diameter, its upper bound, whether it is exact, the vertices and their eccentricities (or None)
+	# The diameter is a lower bound unless it is exact, as are the eccentricities
+	snapshot = graphSnapshot(item, tolerance)
+	if snapshot.vertexCount() == 0:
+		return 0, 0, True, [], ([] if withEccentricities else None)
+	if withEccentricities:
+		lower, upper, exact = graphEccentricities(snapshot, edgeKey, approximate, timeLimit)
+		return max(lower), max(upper), exact, snapshot.vertices, lower
+	lower, upper, exact = graphDiameter(snapshot, edgeKey, approximate, timeLimit)
+	return lower, upper, exact, snapshot.vertices, None
 
 class SvGraphDiameter(bpy.types.Node, SverchCustomTreeNode):
 	"""
 	Triggers: Topologic
-	Tooltip: Outputs the diameter of the input Graph
+	Tooltip: Outputs the diameter of the input Graph and the eccentricity of its Vertices
 	"""
 	bl_idname = 'SvGraphDiameter'
 	bl_label = 'Graph.Diameter'
+	EdgeKey: StringProperty(name='EdgeKey', description="Dictionary key of the edge weights. Leave empty to count every edge as 1", update=updateNode)
+	TimeLimit: FloatProperty(name="Time Limit", description="Time limit in seconds. The bounds found so far are output when it runs out. 0 has no limit", default=0, min=0, update=updateNode)
+	ToleranceProp: FloatProperty(name="Tolerance", default=0.0001, precision=4, update=updateNode)
+	Approximate: BoolProperty(name="Approximate", description="Stop after four sweeps of every component. The Diameter is then a lower bound", default=False, update=updateNode)
+
 	def sv_init(self, context):
 		self.inputs.new('SvStringsSocket', 'Graph')
+		self.inputs.new('SvStringsSocket', 'Edge Key').prop_name='EdgeKey'
+		self.inputs.new('SvStringsSocket', 'Time Limit').prop_name='TimeLimit'
+		self.inputs.new('SvStringsSocket', 'Tolerance').prop_name = 'ToleranceProp'
 		self.outputs.new('SvStringsSocket', 'Diameter')
+		self.outputs.new('SvStringsSocket', 'Upper Bound')
+		self.outputs.new('SvStringsSocket', 'Exact')
+		self.outputs.new('SvStringsSocket', 'Vertices')
+		self.outputs.new('SvStringsSocket', 'Eccentricities')
+
+	def draw_buttons(self, context, layout):
+		layout.prop(self, "Approximate")
+
+	def inputValue(self, name, default):
+		# Nodes created before this input was added do not have it and use the default
+		if name not in self.inputs:
+			return default
+		return flatten(self.inputs[name].sv_get(deepcopy=False))[0]
 
 	def process(self):
 		start = time.time()
 		if not any(socket.is_linked for socket in self.outputs):
 			return
-
+		if not self.inputs['Graph'].is_linked:
+			for anOutput in self.outputs:
+				anOutput.sv_set([])
+			return
 		inputs = self.inputs['Graph'].sv_get(deepcopy=False)
 		inputs = flatten(inputs)
-		outputs = []
+		edgeKey = self.inputValue('Edge Key', self.EdgeKey)
+		timeLimit = self.inputValue('Time Limit', self.TimeLimit)
+		tolerance = self.inputValue('Tolerance', self.ToleranceProp)
+		withEccentricities = ('Eccentricities' in self.outputs) and self.outputs['Eccentricities'].is_linked
+		diameters = []
+		upperBounds = []
+		exactList = []
+		vertexList = []
+		eccentricityList = []
 		for anInput in inputs:
-			outputs.append(processItem(anInput))
-		self.outputs['Diameter'].sv_set(outputs)
+			diameter, upperBound, exact, vertices, eccentricities = processItem(anInput, edgeKey, self.Approximate, timeLimit, tolerance, withEccentricities)
+			diameters.append(diameter)
+			upperBounds.append(upperBound)
+			exactList.append(exact)
+			vertexList.append(vertices)
+			eccentricityList.append(eccentricities)
+		self.outputs['Diameter'].sv_set(diameters)
+		# Nodes created before these outputs were added do not have them
+		for name, values in [('Upper Bound', upperBounds), ('Exact', exactList), ('Vertices', vertexList), ('Eccentricities', eccentricityList if withEccentricities else [])]:
+			if name in self.outputs:
+				self.outputs[name].sv_set(values)
 		end = time.time()
 		print("Graph Diameter Operation consumed "+str(round(end - start,2))+" seconds")
 
@@ -0,0 +1,106 @@
+import bpy
+from bpy.props import StringProperty, BoolProperty, FloatProperty, EnumProperty
+from sverchok.node_tree import SverchCustomTreeNode
+from sverchok.data_structure import updateNode
+
+import topologic
+from topologic import Vertex, Edge, Wire, Face, Shell, Cell, CellComplex, Cluster, Topology, Graph
+import cppyy
+import time
+
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.Replication')
+importlib.import_module('topologicsverchok.nodes.Topologic.GraphSnapshot')
+from topologicsverchok.nodes.Topologic.Replication import flatten
+from topologicsverchok.nodes.Topologic.GraphSnapshot import graphSnapshot
+
+def vertexIndices(snapshot, vertices):
+	returnList = []
+	for aVertex in vertices:
+		i = snapshot.vertexIndex(aVertex)
+		if i == None:
+			raise Exception("Error: The input Vertex ("+str(aVertex.X())+", "+str(aVertex.Y())+", "+str(aVertex.Z())+") is not a Vertex of the Graph")
+		returnList.append(i)
+	return returnList
+
+def processItem(graph, sources, targets, vertexKey, edgeKey, tolerance, withPredecessors):
+	# Returns the distance matrix, the predecessors (or None) and the graph indices of the sources and of the targets
+	# Without sources every vertex is a source and without targets every vertex is a target
+	snapshot = graphSnapshot(graph, tolerance)
+	sourceIndices = vertexIndices(snapshot, sources) if len(sources) > 0 else list(range(snapshot.vertexCount()))
+	targetIndices = vertexIndices(snapshot, targets) if len(targets) > 0 else list(range(snapshot.vertexCount()))
+	matrix, predecessors = snapshot.distanceMatrix(sourceIndices, targetIndices, edgeKey, vertexKey, withPredecessors)
+	return matrix, predecessors, sourceIndices, targetIndices
+
+class SvGraphDistanceMatrix(bpy.types.Node, SverchCustomTreeNode):
+	"""
+	Triggers: Topologic
+	Tooltip: Outputs the shortest path costs from every input source Vertex to every input target Vertex within the input Graph
+	"""
+	bl_idname = 'SvGraphDistanceMatrix'
+	bl_label = 'Graph.DistanceMatrix'
+	VertexKey: StringProperty(name='VertexKey', update=updateNode)
+	EdgeKey: StringProperty(name='EdgeKey', update=updateNode)
+	ToleranceProp: FloatProperty(name="Tolerance", default=0.0001, precision=4, update=updateNode)
+	OutputNumPy: BoolProperty(name="NumPy", description="Output the distance matrix and the predecessors as NumPy arrays", default=False, update=updateNode)
+
+	def sv_init(self, context):
+		self.inputs.new('SvStringsSocket', 'Graph')
+		self.inputs.new('SvStringsSocket', 'Sources')
+		self.inputs.new('SvStringsSocket', 'Targets')
+		self.inputs.new('SvStringsSocket', 'Vertex Key').prop_name='VertexKey'
+		self.inputs.new('SvStringsSocket', 'Edge Key').prop_name='EdgeKey'
+		self.inputs.new('SvStringsSocket', 'Tolerance').prop_name = 'ToleranceProp'
+		self.outputs.new('SvStringsSocket', 'Distance Matrix')
+		self.outputs.new('SvStringsSocket', 'Predecessors')
+		self.outputs.new('SvStringsSocket', 'Source Indices')
+		self.outputs.new('SvStringsSocket', 'Target Indices')
+
+	def draw_buttons(self, context, layout):
+		layout.prop(self, "OutputNumPy")
+
+	def process(self):
+		start = time.time()
+		if not any(socket.is_linked for socket in self.outputs):
+			return
+		if not self.inputs['Graph'].is_linked:
+			for anOutput in self.outputs:
+				anOutput.sv_set([])
+			return
+		graphList = flatten(self.inputs['Graph'].sv_get(deepcopy=False))
+		sources = []
+		targets = []
+		if self.inputs['Sources'].is_linked:
+			sources = flatten(self.inputs['Sources'].sv_get(deepcopy=False))
+		if self.inputs['Targets'].is_linked:
+			targets = flatten(self.inputs['Targets'].sv_get(deepcopy=False))
+		vertexKey = flatten(self.inputs['Vertex Key'].sv_get(deepcopy=False))[0]
+		edgeKey = flatten(self.inputs['Edge Key'].sv_get(deepcopy=False))[0]
+		tolerance = flatten(self.inputs['Tolerance'].sv_get(deepcopy=False))[0]
+		withPredecessors = self.outputs['Predecessors'].is_linked
+		matrices = []
+		predecessorList = []
+		sourceIndexList = []
+		targetIndexList = []
+		for aGraph in graphList:
+			matrix, predecessors, sourceIndices, targetIndices = processItem(aGraph, sources, targets, vertexKey, edgeKey, tolerance, withPredecessors)
+			if self.OutputNumPy:
+				matrices.append(matrix)
+				predecessorList.append(predecessors)
+			else:
+				matrices.append(matrix.tolist())
+				predecessorList.append(predecessors.tolist() if withPredecessors else None)
+			sourceIndexList.append(sourceIndices)
+			targetIndexList.append(targetIndices)
+		self.outputs['Distance Matrix'].sv_set(matrices)
+		self.outputs['Predecessors'].sv_set(predecessorList if withPredecessors else [])
+		self.outputs['Source Indices'].sv_set(sourceIndexList)
+		self.outputs['Target Indices'].sv_set(targetIndexList)
+		end = time.time()
+		print("Graph.DistanceMatrix Operation consumed "+str(round(end - start,4))+" seconds")
+
+def register():
+	bpy.utils.register_class(SvGraphDistanceMatrix)
+
+def unregister():
+	bpy.utils.unregister_class(SvGraphDistanceMatrix)
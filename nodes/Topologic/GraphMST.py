@@ -10,6 +10,12 @@ import cppyy
 import time
 from collections import defaultdict
 
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.Replication')
+importlib.import_module('topologicsverchok.nodes.Topologic.GraphSnapshot')
+from topologicsverchok.nodes.Topologic.Replication import flatten, replicateInputs
+from topologicsverchok.nodes.Topologic.GraphSnapshot import graphSnapshot
+
 #Class to represent a graph 
 class Graph: 
 
@@ -93,90 +99,6 @@ class Graph:
 		# print the contents of result[] to display the built MST 
 		return result
 
-# From https://stackabuse.com/python-how-to-flatten-list-of-lists/
-def flatten(element):
-	returnList = []
-	if isinstance(element, list) == True:
-		for anItem in element:
-			returnList = returnList + flatten(anItem)
-	else:
-		returnList = [element]
-	return returnList
-
-def repeat(list):
-	maxLength = len(list[0])
-	for aSubList in list:
-		newLength = len(aSubList)
-		if newLength > maxLength:
-			maxLength = newLength
-	for anItem in list:
-		if (len(anItem) > 0):
-			itemToAppend = anItem[-1]
-		else:
-			itemToAppend = None
-		for i in range(len(anItem), maxLength):
-			anItem.append(itemToAppend)
-	return list
-
-# From https://stackoverflow.com/questions/34432056/repeat-elements-of-list-between-each-other-until-we-reach-a-certain-length
-def onestep(cur,y,base):
-    # one step of the iteration
-    if cur is not None:
-        y.append(cur)
-        base.append(cur)
-    else:
-        y.append(base[0])  # append is simplest, for now
-        base = base[1:]+[base[0]]  # rotate
-    return base
-
-def iterate(list):
-	maxLength = len(list[0])
-	returnList = []
-	for aSubList in list:
-		newLength = len(aSubList)
-		if newLength > maxLength:
-			maxLength = newLength
-	for anItem in list:
-		for i in range(len(anItem), maxLength):
-			anItem.append(None)
-		y=[]
-		base=[]
-		for cur in anItem:
-			base = onestep(cur,y,base)
-		returnList.append(y)
-	return returnList
-
-def trim(list):
-	minLength = len(list[0])
-	returnList = []
-	for aSubList in list:
-		newLength = len(aSubList)
-		if newLength < minLength:
-			minLength = newLength
-	for anItem in list:
-		anItem = anItem[:minLength]
-		returnList.append(anItem)
-	return returnList
-
-# Adapted from https://stackoverflow.com/questions/533905/get-the-cartesian-product-of-a-series-of-lists
-def interlace(ar_list):
-    if not ar_list:
-        yield []
-    else:
-        for a in ar_list[0]:
-            for prod in interlace(ar_list[1:]):
-                yield [a,]+prod
-
-def transposeList(l):
-	length = len(l[0])
-	returnList = []
-	for i in range(length):
-		tempRow = []
-		for j in range(len(l)):
-			tempRow.append(l[j][i])
-		returnList.append(tempRow)
-	return returnList
-
 def classByType(argument):
 	switcher = {
 		1: Vertex,
@@ -193,49 +115,16 @@ def fixTopologyClass(topology):
   topology.__class__ = classByType(topology.GetType())
   return topology
 
-def valueAtKey(item, key):
-	fv = None
-	try:
-		v = item.ValueAtKey(key).Value()
-	except:
-		raise Exception("Error: Could not retrieve a Value at the specified key ("+key+")")
-	if (isinstance(v, int) or (isinstance(v, float))):
-		fv = v
-	else:
-		raise Exception("Error: Value is not a float or an int")
-	return float(fv)
-
-def vertexIndex(v, vertices, tolerance):
-	i = 0
-	for aVertex in vertices:
-		if topologic.VertexUtility.Distance(v, aVertex) < tolerance:
-			return i
-		i = i + 1
-	return None
-
 def processItem(item):
 	#This code is contributed by Neelam Yadav 
 	graph = item[0]
 	edgeKey = item[1]
 	tolerance = item[2]
-	vertices = cppyy.gbl.std.list[topologic.Vertex.Ptr]()
-	_ = graph.Vertices(vertices)
-	pyvertices = list(vertices)
-	edges = cppyy.gbl.std.list[topologic.Edge.Ptr]()
-	_ = graph.Edges(vertices, tolerance, edges)
-	g = Graph(len(vertices))
-	for anEdge in edges:
-		sv = anEdge.StartVertex()
-		svi = vertexIndex(sv, vertices, tolerance)
-		ev = anEdge.EndVertex()
-		evi = vertexIndex(ev, vertices, tolerance)
-		edgeDict = anEdge.GetDictionary()
-		weight = 1
-		if (edgeDict):
-			try:
-				weight = valueAtKey(edgeDict,edgeKey)
-			except:
-				weight = 1
+	snapshot = graphSnapshot(graph, tolerance)
+	pyvertices = snapshot.vertices
+	g = Graph(snapshot.vertexCount())
+	weights = snapshot.edgeWeights(edgeKey, 1.0, False).tolist()
+	for svi, evi, weight in zip(snapshot.edgeStarts.tolist(), snapshot.edgeEnds.tolist(), weights):
 		g.addEdge(svi, evi, weight) 
 
 	graphEdges = g.KruskalMST() # Get the Minimum Spanning Tree
@@ -298,19 +187,9 @@ class SvGraphMST(bpy.types.Node, SverchCustomTreeNode):
 		inputs = [graphList, edgeKeyList, toleranceList]
 		outputs = []
 		if ((self.Replication) == "Default"):
-			inputs = repeat(inputs)
-			inputs = transposeList(inputs)
-		elif ((self.Replication) == "Trim"):
-			inputs = trim(inputs)
-			inputs = transposeList(inputs)
-		elif ((self.Replication) == "Iterate"):
-			inputs = iterate(inputs)
-			inputs = transposeList(inputs)
-		elif ((self.Replication) == "Repeat"):
-			inputs = repeat(inputs)
-			inputs = transposeList(inputs)
-		elif ((self.Replication) == "Interlace"):
-			inputs = list(interlace(inputs))
+			inputs = replicateInputs(inputs, "Repeat")
+		else:
+			inputs = replicateInputs(inputs, self.Replication)
 		for anInput in inputs:
 			outputs.append(processItem(anInput))
 		self.outputs['MST'].sv_set(outputs)
@@ -10,7 +10,8 @@ import time
 
 import importlib
 importlib.import_module('topologicsverchok.nodes.Topologic.Replication')
-from topologicsverchok.nodes.Topologic.Replication import flatten, repeat, onestep, iterate, trim, interlace, transposeList
+from topologicsverchok.nodes.Topologic.Replication import flatten, replicateInputs
+
 replication = [("Default", "Default", "", 1),("Trim", "Trim", "", 2),("Iterate", "Iterate", "", 3),("Repeat", "Repeat", "", 4),("Interlace", "Interlace", "", 5)]
 
 def processItem(item):
@@ -50,20 +51,7 @@ class SvGraphPath(bpy.types.Node, SverchCustomTreeNode):
 		vertexBList = flatten(vertexBList)
 		inputs = [graphList, vertexAList, vertexBList]
 		outputs = []
-		if ((self.Replication) == "Default"):
-			inputs = iterate(inputs)
-			inputs = transposeList(inputs)
-		elif ((self.Replication) == "Trim"):
-			inputs = trim(inputs)
-			inputs = transposeList(inputs)
-		elif ((self.Replication) == "Iterate"):
-			inputs = iterate(inputs)
-			inputs = transposeList(inputs)
-		elif ((self.Replication) == "Repeat"):
-			inputs = repeat(inputs)
-			inputs = transposeList(inputs)
-		elif ((self.Replication) == "Interlace"):
-			inputs = list(interlace(inputs))
+		inputs = replicateInputs(inputs, self.Replication)
 		for anInput in inputs:
 			outputs.append(processItem(anInput))
 		self.outputs['Path'].sv_set(outputs)
@@ -1,5 +1,5 @@
 import bpy
-from bpy.props import IntProperty, StringProperty, BoolProperty, EnumProperty
+from bpy.props import IntProperty, StringProperty, BoolProperty, FloatProperty, EnumProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode
 
@@ -10,34 +10,47 @@ import time
 
 import importlib
 importlib.import_module('topologicsverchok.nodes.Topologic.Replication')
-from topologicsverchok.nodes.Topologic.Replication import flatten, repeat, onestep, iterate, trim, interlace, transposeList
+importlib.import_module('topologicsverchok.nodes.Topologic.GraphSnapshot')
+importlib.import_module('topologicsverchok.nodes.Topologic.Paths')
+from topologicsverchok.nodes.Topologic.Replication import flatten, replicateInputs
+from topologicsverchok.nodes.Topologic.GraphSnapshot import graphSnapshot
+from topologicsverchok.nodes.Topologic.Paths import shortestPaths, pathPage, pathWire
+
 replication = [("Default", "Default", "", 1),("Trim", "Trim", "", 2),("Iterate", "Iterate", "", 3),("Repeat", "Repeat", "", 4),("Interlace", "Interlace", "", 5)]
 
-def processItem(item):
-	topology = None
-	graph = item[0]
-	vertexA = item[1]
-	vertexB = item[2]
-	vertexKey = item[3]
-	edgeKey = item[4]
-	timeLimit = item[5]
-	print("Graph Shortest Paths - Time Limit: "+str(timeLimit))
-	paths = cppyy.gbl.std.list[topologic.Wire.Ptr]()
-	_ = graph.ShortestPaths(vertexA, vertexB, vertexKey, edgeKey, True, timeLimit, paths)
-	return list(paths)
+def graphVertexIndex(snapshot, vertex):
+	i = snapshot.vertexIndex(vertex)
+	if i == None:
+		raise Exception("Error: The input Vertex ("+str(vertex.X())+", "+str(vertex.Y())+", "+str(vertex.Z())+") is not a Vertex of the Graph")
+	return i
+
+def processItem(item, withWires=True):
+	# Returns the Wires (or None) and the vertex indices of the requested page of at most maxPaths of the paths that tie
+	# for the lowest cost. Paths are generated lazily, so only the paths up to the end of the page are found
+	graph, vertexA, vertexB, vertexKey, edgeKey, maxPaths, page, pageSize, timeLimit, tolerance = item
+	snapshot = graphSnapshot(graph, tolerance)
+	source = graphVertexIndex(snapshot, vertexA)
+	target = graphVertexIndex(snapshot, vertexB)
+	paths = pathPage(shortestPaths(snapshot, source, target, edgeKey, vertexKey, timeLimit), maxPaths, page, pageSize)
+	wires = [pathWire(snapshot, aPath) for aPath in paths] if withWires else None
+	return wires, paths
 
 
 class SvGraphShortestPaths(bpy.types.Node, SverchCustomTreeNode):
 	"""
 	Triggers: Topologic
-	Tooltip: Creates a list of Wires that represents the shortest paths between the two input Graph Vertices found within the time limit in seconds
+	Tooltip: Creates a list of Wires that represents a page of the shortest paths, up to the maximum number of paths, between the two input Graph Vertices found within the time limit in seconds
 	"""
 	bl_idname = 'SvGraphShortestPaths'
 	bl_label = 'Graph.ShortestPaths'
 	VertexKey: StringProperty(name='VertexKey', update=updateNode)
 	EdgeKey: StringProperty(name='EdgeKey', update=updateNode)
 	Replication: EnumProperty(name="Replication", description="Replication", default="Default", items=replication, update=updateNode)
+	MaxPaths: IntProperty(name="Max Paths", description="Stop after this many paths. 0 has no limit", default=0, min=0, update=updateNode)
+	Page: IntProperty(name="Page", default=0, min=0, update=updateNode)
+	PageSize: IntProperty(name="Page Size", description="Number of paths per page. 0 outputs every path", default=0, min=0, update=updateNode)
 	TimeLimit: IntProperty(name="Time Limit", default=10, min=1, update=updateNode)
+	ToleranceProp: FloatProperty(name="Tolerance", default=0.0001, precision=4, update=updateNode)
 
 	def sv_init(self, context):
 		self.inputs.new('SvStringsSocket', 'Graph')
@@ -45,50 +58,66 @@ class SvGraphShortestPaths(bpy.types.Node, SverchCustomTreeNode):
 		self.inputs.new('SvStringsSocket', 'Vertex B')
 		self.inputs.new('SvStringsSocket', 'Vertex Key').prop_name='VertexKey'
 		self.inputs.new('SvStringsSocket', 'Edge Key').prop_name='EdgeKey'
+		self.inputs.new('SvStringsSocket', 'Max Paths').prop_name='MaxPaths'
+		self.inputs.new('SvStringsSocket', 'Page').prop_name='Page'
+		self.inputs.new('SvStringsSocket', 'Page Size').prop_name='PageSize'
 		self.inputs.new('SvStringsSocket', 'Time Limit').prop_name="TimeLimit"
+		self.inputs.new('SvStringsSocket', 'Tolerance').prop_name = 'ToleranceProp'
 		self.outputs.new('SvStringsSocket', 'Wires')
+		self.outputs.new('SvStringsSocket', 'Path Indices')
 
 	def draw_buttons(self, context, layout):
 		layout.prop(self, "Replication",text="")
 
+	def inputValues(self, name, default):
+		# Nodes created before this input was added do not have it and use the default
+		if name not in self.inputs:
+			return [default]
+		return self.inputs[name].sv_get(deepcopy=True)
+
 	def process(self):
 		start = time.time()
 		if not any(socket.is_linked for socket in self.outputs):
 			return
 		if not any(socket.is_linked for socket in self.inputs):
-			self.outputs['Topology'].sv_set([])
+			for anOutput in self.outputs:
+				anOutput.sv_set([])
 			return
 		graphList = self.inputs['Graph'].sv_get(deepcopy=True)
 		vertexAList = self.inputs['Vertex A'].sv_get(deepcopy=True)
 		vertexBList = self.inputs['Vertex B'].sv_get(deepcopy=True)
 		vertexKeyList = self.inputs['Vertex Key'].sv_get(deepcopy=True)
 		edgeKeyList = self.inputs['Edge Key'].sv_get(deepcopy=True)
+		maxPathsList = self.inputValues('Max Paths', self.MaxPaths)
+		pageList = self.inputValues('Page', self.Page)
+		pageSizeList = self.inputValues('Page Size', self.PageSize)
 		timeLimitList = self.inputs['Time Limit'].sv_get(deepcopy=True)
+		toleranceList = self.inputValues('Tolerance', self.ToleranceProp)
 		graphList = flatten(graphList)
 		vertexAList = flatten(vertexAList)
 		vertexBList = flatten(vertexBList)
 		vertexKeyList = flatten(vertexKeyList)
 		edgeKeyList = flatten(edgeKeyList)
+		maxPathsList = flatten(maxPathsList)
+		pageList = flatten(pageList)
+		pageSizeList = flatten(pageSizeList)
 		timeLimitList = flatten(timeLimitList)
-		inputs = [graphList, vertexAList, vertexBList, vertexKeyList, edgeKeyList, timeLimitList]
-		outputs = []
+		toleranceList = flatten(toleranceList)
+		inputs = [graphList, vertexAList, vertexBList, vertexKeyList, edgeKeyList, maxPathsList, pageList, pageSizeList, timeLimitList, toleranceList]
+		withWires = self.outputs['Wires'].is_linked
+		wireList = []
+		indexList = []
 		if ((self.Replication) == "Default"):
-			inputs = repeat(inputs)
-			inputs = transposeList(inputs)
-		elif ((self.Replication) == "Trim"):
-			inputs = trim(inputs)
-			inputs = transposeList(inputs)
-		elif ((self.Replication) == "Iterate"):
-			inputs = iterate(inputs)
-			inputs = transposeList(inputs)
-		elif ((self.Replication) == "Repeat"):
-			inputs = repeat(inputs)
-			inputs = transposeList(inputs)
-		elif ((self.Replication) == "Interlace"):
-			inputs = list(interlace(inputs))
+			inputs = replicateInputs(inputs, "Repeat")
+		else:
+			inputs = replicateInputs(inputs, self.Replication)
 		for anInput in inputs:
-			outputs.append(processItem(anInput))
-		self.outputs['Wires'].sv_set(outputs)
+			wires, paths = processItem(anInput, withWires)
+			wireList.append(wires)
+			indexList.append(paths)
+		self.outputs['Wires'].sv_set(wireList if withWires else [])
+		if 'Path Indices' in self.outputs:
+			self.outputs['Path Indices'].sv_set(indexList)
 		end = time.time()
 		print("Graph ShortestPaths Operation consumed "+str(round(end - start,2))+" seconds")
 
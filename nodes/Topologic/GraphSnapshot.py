@@ -0,0 +1,327 @@
+# Compressed sparse row (CSR) snapshot of a topologic Graph for the graph analysis nodes. This module must not import bpy
+# A snapshot numbers the vertices of the graph 0..N-1, keeps their coordinates and the edges as NumPy arrays and reads
+# dictionary values into columns on first use. Snapshots are cached per graph, so a tree of analysis nodes reading the
+# same graph derives its connectivity (graph.Edges with tolerance-based vertex matching) once
+
+import math
+import heapq
+import collections
+import numpy
+
+import topologic
+import cppyy
+
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.SpatialIndex')
+importlib.import_module('topologicsverchok.nodes.Topologic.Parallel')
+from topologicsverchok.nodes.Topologic.SpatialIndex import VertexHash
+from topologicsverchok.nodes.Topologic.Parallel import getKeysAndValues, dictionaryByKeysValues
+
+maxSnapshots = 16
+snapshots = collections.OrderedDict()
+
+def numericValue(d, key):
+	# Returns the value at the key as a float, or None if the dictionary has no numeric value at the key
+	if d == None:
+		return None
+	try:
+		v = d.ValueAtKey(key).Value()
+	except:
+		return None
+	if isinstance(v, (int, float)) and not isinstance(v, bool):
+		return float(v)
+	return None
+
+def attributeValue(d, key):
+	# Returns the value at the key as a Python value, or None if the dictionary has no value at the key
+	if d == None:
+		return None
+	try:
+		v = d.ValueAtKey(key).Value()
+	except:
+		return None
+	if isinstance(v, (int, float)):
+		return v
+	elif isinstance(v, cppyy.gbl.std.string):
+		return v.c_str()
+	returnList = []
+	for i in v:
+		if isinstance(i.Value(), cppyy.gbl.std.string):
+			returnList.append(i.Value().c_str())
+		else:
+			returnList.append(i.Value())
+	return returnList
+
+class GraphSnapshot:
+	def __init__(self, graph, tolerance):
+		self.tolerance = tolerance
+		vertices = cppyy.gbl.std.list[topologic.Vertex.Ptr]()
+		_ = graph.Vertices(vertices)
+		self.vertices = list(vertices)
+		self.coordinates = numpy.array([(v.X(), v.Y(), v.Z()) for v in self.vertices], dtype=numpy.float64).reshape(-1, 3)
+		self.vertexHash = VertexHash(tolerance)
+		for x, y, z in self.coordinates.tolist():
+			_ = self.vertexHash.add(x, y, z)
+		edges = cppyy.gbl.std.list[topologic.Edge.Ptr]()
+		_ = graph.Edges(vertices, tolerance, edges)
+		self.edges = []
+		starts = []
+		ends = []
+		for anEdge in edges:
+			i = self.vertexHash.findVertex(anEdge.StartVertex())
+			j = self.vertexHash.findVertex(anEdge.EndVertex())
+			if i == None or j == None:
+				continue
+			self.edges.append(anEdge)
+			starts.append(i)
+			ends.append(j)
+		self.edgeStarts = numpy.array(starts, dtype=numpy.int64)
+		self.edgeEnds = numpy.array(ends, dtype=numpy.int64)
+		# Every edge appears in the rows of both of its ends. edgeIds gives the edge of every CSR slot
+		rows = numpy.concatenate((self.edgeStarts, self.edgeEnds))
+		columns = numpy.concatenate((self.edgeEnds, self.edgeStarts))
+		edgeIds = numpy.concatenate((numpy.arange(len(starts)), numpy.arange(len(starts))))
+		order = numpy.argsort(rows, kind="stable")
+		self.indices = columns[order]
+		self.edgeIds = edgeIds[order]
+		self.indptr = numpy.zeros(len(self.vertices)+1, dtype=numpy.int64)
+		numpy.cumsum(numpy.bincount(rows, minlength=len(self.vertices)), out=self.indptr[1:])
+		self.adjacencyLists = None
+		self.vertexColumns = {}
+		self.edgeColumns = {}
+		self.weightColumns = {}
+
+	def clearColumns(self):
+		# Drops the values read from the dictionaries of the vertices and edges
+		self.vertexColumns = {}
+		self.edgeColumns = {}
+		self.weightColumns = {}
+
+	def vertexCount(self):
+		return len(self.vertices)
+
+	def edgeCount(self):
+		return len(self.edges)
+
+	def vertexIndex(self, vertex):
+		# Returns the index of the graph vertex within the tolerance of the vertex, or None
+		return self.vertexHash.findVertex(vertex)
+
+	def neighbours(self, i):
+		return self.indices[self.indptr[i]:self.indptr[i+1]]
+
+	def degrees(self):
+		return numpy.diff(self.indptr)
+
+	def adjacency(self):
+		# Returns, per vertex, a list of (neighbour, edge) pairs. Pure Python traversals index lists faster than NumPy arrays
+		if self.adjacencyLists == None:
+			indptr = self.indptr.tolist()
+			indices = self.indices.tolist()
+			edgeIds = self.edgeIds.tolist()
+			self.adjacencyLists = [list(zip(indices[indptr[i]:indptr[i+1]], edgeIds[indptr[i]:indptr[i+1]])) for i in range(len(self.vertices))]
+		return self.adjacencyLists
+
+	def vertexColumn(self, key):
+		# The value of every vertex at the key, None where a vertex has none
+		if key not in self.vertexColumns:
+			self.vertexColumns[key] = [attributeValue(v.GetDictionary(), key) for v in self.vertices]
+		return self.vertexColumns[key]
+
+	def setVertexColumn(self, key, values):
+		# Writes one value per vertex at the key, keeping the other keys of each vertex dictionary
+		for aVertex, aValue in zip(self.vertices, values):
+			keys, oldValues = getKeysAndValues(aVertex.GetDictionary())
+			if key in keys:
+				oldValues[keys.index(key)] = aValue
+			else:
+				keys.append(key)
+				oldValues.append(aValue)
+			_ = aVertex.SetDictionary(dictionaryByKeysValues(keys, oldValues))
+		self.vertexColumns[key] = list(values)
+		self.weightColumns.pop(("Vertex", key), None)
+
+	def edgeColumn(self, key):
+		# The value of every edge at the key, None where an edge has none
+		if key not in self.edgeColumns:
+			self.edgeColumns[key] = [attributeValue(e.GetDictionary(), key) for e in self.edges]
+		return self.edgeColumns[key]
+
+	def edgeLengths(self):
+		return numpy.linalg.norm(self.coordinates[self.edgeEnds]-self.coordinates[self.edgeStarts], axis=1)
+
+	def edgeWeights(self, key, default=1.0, useLength=True):
+		# The numeric value of every edge at the key. Edges without one weigh default or, if useLength is True and the key
+		# is "Length", their length. An empty key gives every edge a weight of 1
+		if not key:
+			return numpy.ones(len(self.edges), dtype=numpy.float64)
+		columnKey = (key, default, useLength and key.lower() == "length")
+		if columnKey not in self.weightColumns:
+			weights = numpy.array([numericValue(e.GetDictionary(), key) for e in self.edges], dtype=numpy.float64).reshape(-1)
+			missing = numpy.isnan(weights)
+			if columnKey[2]:
+				weights[missing] = self.edgeLengths()[missing]
+			else:
+				weights[missing] = default
+			self.weightColumns[columnKey] = weights
+		return self.weightColumns[columnKey]
+
+	def vertexWeights(self, key):
+		# The numeric value of every vertex at the key, 0 where a vertex has none. An empty key gives every vertex 0
+		if not key:
+			return numpy.zeros(len(self.vertices), dtype=numpy.float64)
+		columnKey = ("Vertex", key)
+		if columnKey not in self.weightColumns:
+			weights = numpy.array([numericValue(v.GetDictionary(), key) for v in self.vertices], dtype=numpy.float64).reshape(-1)
+			weights[numpy.isnan(weights)] = 0
+			self.weightColumns[columnKey] = weights
+		return self.weightColumns[columnKey]
+
+	def isWeighted(self, edgeKey, vertexKey=""):
+		# False if every edge costs the same and no vertex costs anything, in which case a breadth-first search finds the shortest paths
+		edgeWeights = self.edgeWeights(edgeKey)
+		if len(edgeWeights) > 0 and not numpy.all(edgeWeights == edgeWeights[0]):
+			return True
+		return bool(numpy.any(self.vertexWeights(vertexKey) != 0))
+
+	def shortestPathTree(self, source, edgeKey="", vertexKey=""):
+		# Returns (distances, predecessors) from the source to every vertex: infinity and -1 where a vertex cannot be reached
+		# A path costs the weights of its edges plus the weights of the vertices it enters
+		# Unweighted graphs are searched breadth first, weighted graphs with Dijkstra's algorithm
+		count = len(self.vertices)
+		adjacency = self.adjacency()
+		predecessors = [-1]*count
+		if not self.isWeighted(edgeKey, vertexKey):
+			edgeWeights = self.edgeWeights(edgeKey)
+			step = float(edgeWeights[0]) if len(edgeWeights) > 0 else 1.0
+			hops = [-1]*count
+			hops[source] = 0
+			frontier = [source]
+			while frontier:
+				nextFrontier = []
+				for i in frontier:
+					for j, _ in adjacency[i]:
+						if hops[j] < 0:
+							hops[j] = hops[i]+1
+							predecessors[j] = i
+							nextFrontier.append(j)
+				frontier = nextFrontier
+			return [h*step if h >= 0 else math.inf for h in hops], predecessors
+		edgeWeights = self.edgeWeights(edgeKey)
+		vertexWeights = self.vertexWeights(vertexKey)
+		if numpy.any(edgeWeights < 0) or numpy.any(vertexWeights < 0):
+			raise Exception("Error: Shortest paths cannot be found with negative edge or vertex weights")
+		edgeWeights = edgeWeights.tolist()
+		vertexWeights = vertexWeights.tolist()
+		distances = [math.inf]*count
+		distances[source] = 0.0
+		heap = [(0.0, source)]
+		while heap:
+			d, i = heapq.heappop(heap)
+			if d > distances[i]:
+				continue
+			for j, e in adjacency[i]:
+				nd = d+edgeWeights[e]+vertexWeights[j]
+				if nd < distances[j]:
+					distances[j] = nd
+					predecessors[j] = i
+					heapq.heappush(heap, (nd, j))
+		return distances, predecessors
+
+	def distanceMatrix(self, sources, targets=None, edgeKey="", vertexKey="", withPredecessors=False):
+		# Returns the (sources, targets) matrix of shortest path costs and, if withPredecessors is True, the (sources, vertices)
+		# matrix of predecessors. Each unique source is searched once whatever the number of targets
+		if targets == None:
+			targets = list(range(len(self.vertices)))
+		matrix = numpy.full((len(sources), len(targets)), math.inf, dtype=numpy.float64)
+		predecessors = numpy.full((len(sources), len(self.vertices)), -1, dtype=numpy.int64) if withPredecessors else None
+		trees = {}
+		targetIndices = numpy.array(targets, dtype=numpy.int64)
+		for row, aSource in enumerate(sources):
+			if aSource not in trees:
+				distances, tree = self.shortestPathTree(aSource, edgeKey, vertexKey)
+				trees[aSource] = (numpy.array(distances, dtype=numpy.float64), tree)
+			distances, tree = trees[aSource]
+			matrix[row] = distances[targetIndices]
+			if withPredecessors:
+				predecessors[row] = tree
+		return matrix, predecessors
+
+	def pathIndices(self, predecessors, source, target):
+		# Follows a row of predecessors back from the target. Returns the vertex indices from the source to the target, or [] if it cannot be reached
+		path = [target]
+		while path[-1] != source:
+			if predecessors[path[-1]] < 0:
+				return []
+			path.append(int(predecessors[path[-1]]))
+		path.reverse()
+		return path
+
+	def breadthFirstDistances(self, source):
+		# Returns the number of edges from the source to every vertex, -1 where a vertex cannot be reached
+		adjacency = self.adjacency()
+		distances = [-1]*len(self.vertices)
+		distances[source] = 0
+		frontier = [source]
+		d = 0
+		while frontier:
+			d += 1
+			nextFrontier = []
+			for i in frontier:
+				for j, _ in adjacency[i]:
+					if distances[j] < 0:
+						distances[j] = d
+						nextFrontier.append(j)
+			frontier = nextFrontier
+		return distances
+
+def graphSignature(graph):
+	# Cheap check that a cached snapshot still matches its graph: nodes such as Graph.AddEdge change the graph in place,
+	# and its vertices can be moved in place. Dictionary values are not part of it, see graphSnapshot
+	sequence = cppyy.gbl.std.list[int]()
+	_ = graph.DegreeSequence(sequence)
+	vertices = cppyy.gbl.std.list[topologic.Vertex.Ptr]()
+	_ = graph.Vertices(vertices)
+	return hash((tuple(sequence), tuple((v.X(), v.Y(), v.Z()) for v in vertices)))
+
+def graphAddress(graph):
+	# Sockets may hand over a new Python proxy of the same C++ graph, so the graph is identified by its C++ address
+	try:
+		return cppyy.addressof(graph)
+	except:
+		return id(graph)
+
+def graphSnapshot(graph, tolerance=0.0001):
+	# Returns the cached snapshot of the graph, building it if the graph has not been seen or has changed
+	# The entry keeps a reference to the graph so that its address is not reused while the entry exists
+	# Only the connectivity and the coordinates are reused. Dictionaries can be edited in place without changing the
+	# signature, so the columns read from them are dropped and read again by the node asking for the snapshot
+	key = (graphAddress(graph), tolerance)
+	signature = graphSignature(graph)
+	entry = snapshots.get(key)
+	if entry != None and entry[1] == signature:
+		snapshots.move_to_end(key)
+		entry[2].clearColumns()
+		return entry[2]
+	snapshot = GraphSnapshot(graph, tolerance)
+	snapshots[key] = (graph, signature, snapshot)
+	snapshots.move_to_end(key)
+	while len(snapshots) > maxSnapshots:
+		snapshots.popitem(last=False)
+	return snapshot
+
+class SnapshotResolver:
+	# Resolves the snapshot of each graph once per node evaluation. graphSignature reads every vertex of the graph, so a
+	# node replicating one graph over many cheap queries resolves it here instead of calling graphSnapshot per item
+	# The inputs of the evaluation keep their graphs alive, so their addresses are not reused while the resolver exists
+	def __init__(self):
+		self.resolved = {}
+
+	def snapshot(self, graph, tolerance=0.0001):
+		key = (graphAddress(graph), tolerance)
+		if key not in self.resolved:
+			self.resolved[key] = graphSnapshot(graph, tolerance)
+		return self.resolved[key]
+
+def clearSnapshots():
+	snapshots.clear()
@@ -0,0 +1,175 @@
+# IFC geometry extraction shared by the IFC import nodes. This module must not import bpy
+# The nodes make ifcopenshell importable (see their sys.path setup) before importing this module
+
+import os
+import hashlib
+import ifcopenshell
+import ifcopenshell.geom
+import ifcopenshell.util.unit
+import ifcopenshell.util.placement
+
+import topologic
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.SpatialIndex')
+from topologicsverchok.nodes.Topologic.SpatialIndex import boundingBox
+
+def geometrySettings():
+	settings = ifcopenshell.geom.settings()
+	settings.set(settings.USE_BREP_DATA,True)
+	settings.set(settings.SEW_SHELLS,True)
+	settings.set(settings.USE_WORLD_COORDS,True)
+	return settings
+
+def threadCount(threads):
+	if threads < 1:
+		return os.cpu_count() or 1
+	return threads
+
+def shapesSerially(settings, products):
+	# Yields (product, brepString) for every product whose geometry can be created
+	for p in products:
+		try:
+			cr = ifcopenshell.geom.create_shape(settings, p)
+			yield p, cr.geometry.brep_data
+		except:
+			continue
+
+def shapesConcurrently(settings, ifc_file, products, threads):
+	# Yields (product, brepString) as ifcopenshell's geometry iterator completes them on several threads
+	# Products without geometry are skipped by the iterator. The order follows completion, not the input order
+	if len(products) == 0:
+		return
+	iterator = ifcopenshell.geom.iterator(settings, ifc_file, threadCount(threads), include=products)
+	if not iterator.initialize():
+		return
+	while True:
+		shape = iterator.get()
+		try:
+			yield ifc_file.by_id(shape.id), shape.geometry.brep_data
+		except:
+			pass
+		if not iterator.next():
+			break
+
+def productShapes(ifc_file, products, parallel=False, threads=0):
+	# Yields (product, brepString) pairs, on several threads if parallel is True
+	settings = geometrySettings()
+	if parallel:
+		return shapesConcurrently(settings, ifc_file, list(products), threads)
+	return shapesSerially(settings, products)
+
+def inProductOrder(products, shapes):
+	# Collects the (product, value) pairs of a concurrent run and returns the values in the order of the products
+	positions = {}
+	for i, p in enumerate(products):
+		positions[p.id()] = i
+	pairs = [(positions.get(p.id(), len(positions)), value) for p, value in shapes]
+	pairs.sort(key=lambda aPair: aPair[0])
+	return [aPair[1] for aPair in pairs]
+
+def productStorey(product):
+	# Returns the IfcBuildingStorey that contains the product, directly or through the element that it is part of
+	visited = set()
+	while product != None and product.id() not in visited:
+		visited.add(product.id())
+		if product.is_a("IfcBuildingStorey"):
+			return product
+		parent = None
+		for aRelationship in (getattr(product, "ContainedInStructure", None) or []):
+			parent = aRelationship.RelatingStructure
+		if parent == None:
+			for aRelationship in (getattr(product, "Decomposes", None) or []):
+				parent = aRelationship.RelatingObject
+		product = parent
+	return None
+
+def productLocation(product, unitScale):
+	# Returns the world origin of the product's placement in metres, or None if it has no placement
+	if getattr(product, "ObjectPlacement", None) == None:
+		return None
+	try:
+		matrix = ifcopenshell.util.placement.get_local_placement(product.ObjectPlacement)
+	except:
+		return None
+	return (matrix[0][3]*unitScale, matrix[1][3]*unitScale, matrix[2][3]*unitScale)
+
+def filterProducts(ifc_file, products, includeClasses=[], excludeClasses=[], storeys=[], clipBox=None):
+	# Keeps the products that are (a subclass of) one of includeClasses, if any are given, and none of excludeClasses
+	# storeys are matched against the Name or GlobalId of the containing storey
+	# clipBox is (minX, minY, minZ, maxX, maxY, maxZ) in metres and is tested against the origin of each product's placement
+	# None of these tests need the product geometry, so they run before any shape is created
+	includeClasses = [aClass for aClass in includeClasses if aClass]
+	excludeClasses = [aClass for aClass in excludeClasses if aClass]
+	storeys = set(aStorey for aStorey in storeys if aStorey)
+	unitScale = ifcopenshell.util.unit.calculate_unit_scale(ifc_file) if clipBox != None else 1
+	returnList = []
+	for p in products:
+		if len(includeClasses) > 0 and not any(p.is_a(aClass) for aClass in includeClasses):
+			continue
+		if any(p.is_a(aClass) for aClass in excludeClasses):
+			continue
+		if len(storeys) > 0:
+			storey = productStorey(p)
+			if storey == None or (storey.Name not in storeys and storey.GlobalId not in storeys):
+				continue
+		if clipBox != None:
+			location = productLocation(p, unitScale)
+			if location == None:
+				continue
+			if any(location[i] < clipBox[i] or location[i] > clipBox[i+3] for i in range(3)):
+				continue
+		returnList.append(p)
+	return returnList
+
+def classNames(values):
+	# Accepts IFC class names one per item or separated by commas
+	returnList = []
+	for aValue in values:
+		if isinstance(aValue, str):
+			returnList += [aName.strip() for aName in aValue.split(",") if aName.strip()]
+	return returnList
+
+def clipBoxByInput(values):
+	# Accepts a Topology, whose bounding box is used, or six numbers (minX, minY, minZ, maxX, maxY, maxZ). Returns None for no clipping
+	values = [aValue for aValue in values if aValue != None]
+	if len(values) == 0:
+		return None
+	if isinstance(values[0], topologic.Topology):
+		return boundingBox(values[0], 0)
+	if len(values) >= 6:
+		return tuple(float(aValue) for aValue in values[:6])
+	return None
+
+def valueDigest(value, memo):
+	if isinstance(value, ifcopenshell.entity_instance):
+		return entityDigest(value, memo)
+	if isinstance(value, (tuple, list)):
+		h = hashlib.sha256(b"(")
+		for aValue in value:
+			h.update(valueDigest(aValue, memo))
+		return h.digest()
+	return hashlib.sha256(repr(value).encode("utf-8")).digest()
+
+def entityDigest(entity, memo):
+	# Digest of the entity's class and attribute values, following references but ignoring step ids,
+	# so that an unchanged entity gets the same digest after the file is exported again
+	# Owner histories change on every export without changing the geometry, so they are not followed
+	if entity.is_a("IfcOwnerHistory"):
+		return b"IfcOwnerHistory"
+	key = entity.id()
+	if key != 0 and key in memo:
+		return memo[key]
+	h = hashlib.sha256(entity.is_a().encode("utf-8"))
+	for i in range(len(entity)):
+		h.update(valueDigest(entity[i], memo))
+	d = h.digest()
+	if key != 0:
+		memo[key] = d
+	return d
+
+def productKey(product, memo):
+	# Identifies the product's geometry across imports: its GlobalId and a digest of its representation and placement
+	h = hashlib.sha256()
+	for aValue in (getattr(product, "Representation", None), getattr(product, "ObjectPlacement", None)):
+		h.update(valueDigest(aValue, memo))
+	return (product.GlobalId, h.hexdigest())
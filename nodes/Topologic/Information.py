@@ -0,0 +1,234 @@
+# Columnar export and import of the dictionaries of a topology and its sub-topologies. This module must not import bpy
+# A table has one row per topology with a dictionary: its type, the XYZ of its selector and a typed column per dictionary key
+# Importing resolves the selectors of all the rows of a type in one pass over a spatial index of the sub-topologies of that type
+
+import json
+import collections
+import numpy
+
+import topologic
+from topologic import Vertex, Edge, Wire, Face, Shell, Cell, CellComplex, Cluster, Topology
+import cppyy
+
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.Parallel')
+importlib.import_module('topologicsverchok.nodes.Topologic.Selector')
+importlib.import_module('topologicsverchok.nodes.Topologic.SpatialIndex')
+from topologicsverchok.nodes.Topologic.Parallel import getKeysAndValues, dictionaryByKeysValues, subTopologies
+from topologicsverchok.nodes.Topologic.Selector import relevantSelector
+from topologicsverchok.nodes.Topologic.SpatialIndex import TopologyIndex, VertexHash
+
+# Sub-topologies are visited from the highest to the lowest dimension, as Topology.DecodeInformation has always done
+subTopologyTypesByType = collections.OrderedDict([
+	(64, ("CellComplexes", CellComplex)),
+	(32, ("Cells", Cell)),
+	(16, ("Shells", Shell)),
+	(8, ("Faces", Face)),
+	(4, ("Wires", Wire)),
+	(2, ("Edges", Edge)),
+	(1, ("Vertices", Vertex))])
+columnKinds = ["int", "double", "string", "json"]
+# CSV text written with this header holds the values of each row as a JSON list. Without it, values are strings separated by |
+csvHeader = "Type,X,Y,Z,Keys,Values (JSON)"
+
+def topologyContains(topology, vertex, tolerance):
+	contains = False
+	if topology.GetType() == topologic.Vertex.Type():
+		try:
+			contains = (topologic.VertexUtility.Distance(topology, vertex) <= tolerance)
+		except:
+			contains = False
+		return contains
+	elif topology.GetType() == topologic.Edge.Type():
+		try:
+			_ = topologic.EdgeUtility.ParameterAtPoint(topology, vertex)
+			contains = True
+		except:
+			contains = False
+		return contains
+	elif topology.GetType() == topologic.Face.Type():
+		return topologic.FaceUtility.IsInside(topology, vertex, tolerance)
+	elif topology.GetType() == topologic.Cell.Type():
+		return (topologic.CellUtility.Contains(topology, vertex, tolerance) == 0)
+	try:
+		contains = (topologic.VertexUtility.Distance(vertex, topology) <= tolerance)
+	except:
+		contains = False
+	return contains
+
+def topologiesOfType(topology, topologyType):
+	# The topology itself if it is of the type, otherwise its sub-topologies of the type
+	if topology.GetType() == topologyType:
+		return [topology]
+	if topologyType not in subTopologyTypesByType or topologyType > topology.GetType():
+		return []
+	subTopologyType, subTopologyClass = subTopologyTypesByType[topologyType]
+	return subTopologies(topology, subTopologyType, subTopologyClass)
+
+def informationSources(topology):
+	# The topology followed by its sub-topologies of lower dimension
+	sources = [topology]
+	for topologyType in subTopologyTypesByType:
+		if topologyType < topology.GetType():
+			sources += topologiesOfType(topology, topologyType)
+	return sources
+
+def informationRows(topologies):
+	# Yields (type, (x, y, z), keys, values) for every topology, or sub-topology, that has a dictionary. Values keep their type
+	for aTopology in topologies:
+		for aSource in informationSources(aTopology):
+			d = aSource.GetDictionary()
+			if d == None:
+				continue
+			keys, values = getKeysAndValues(d)
+			if len(keys) == 0:
+				continue
+			selector = relevantSelector(aSource)
+			yield aSource.GetType(), (selector.X(), selector.Y(), selector.Z()), keys, values
+
+def columnKind(values):
+	# Columns that mix kinds, such as ints and doubles, are stored as JSON so that every value keeps its own type
+	if all(isinstance(v, int) and not isinstance(v, bool) for v in values):
+		return "int"
+	elif all(isinstance(v, float) for v in values):
+		return "double"
+	elif all(isinstance(v, str) for v in values):
+		return "string"
+	return "json"
+
+def informationTable(rows):
+	# Turns rows into columns: types (N,), selectors (N, 3) and, per key, a kind, a value array and a mask of the rows that have the key
+	types = []
+	selectors = []
+	columns = collections.OrderedDict()
+	for i, (topologyType, selector, keys, values) in enumerate(rows):
+		types.append(topologyType)
+		selectors.append(selector)
+		for aKey, aValue in zip(keys, values):
+			columns.setdefault(aKey, ([], []))
+			columns[aKey][0].append(i)
+			columns[aKey][1].append(aValue)
+	count = len(types)
+	table = {"types": numpy.array(types, dtype=numpy.int64), "selectors": numpy.array(selectors, dtype=numpy.float64).reshape(-1, 3), "columns": collections.OrderedDict()}
+	for aKey, (rowIndices, values) in columns.items():
+		kind = columnKind(values)
+		mask = numpy.zeros(count, dtype=bool)
+		mask[rowIndices] = True
+		if kind == "int":
+			array = numpy.zeros(count, dtype=numpy.int64)
+		elif kind == "double":
+			array = numpy.zeros(count, dtype=numpy.float64)
+		else:
+			if kind == "json":
+				values = [json.dumps(v) for v in values]
+			array = numpy.full(count, "", dtype=object)
+		array[rowIndices] = values
+		if array.dtype == object:
+			array = array.astype(str)
+		table["columns"][aKey] = (kind, array, mask)
+	return table
+
+def tableRows(table):
+	# The inverse of informationTable. Yields (type, (x, y, z), keys, values) with values of their original type
+	columns = []
+	for aKey, (kind, array, mask) in table["columns"].items():
+		if kind == "json":
+			values = [json.loads(v) if m else None for v, m in zip(array.tolist(), mask.tolist())]
+		else:
+			values = array.tolist()
+		columns.append((aKey, values, mask.tolist()))
+	types = table["types"].tolist()
+	selectors = table["selectors"].tolist()
+	for i in range(len(types)):
+		keys = []
+		values = []
+		for aKey, columnValues, mask in columns:
+			if mask[i]:
+				keys.append(aKey)
+				values.append(columnValues[i])
+		yield types[i], tuple(selectors[i]), keys, values
+
+def saveInformation(path, table):
+	# Writes the table to a NumPy .npz file. Every array has a plain dtype, so the file loads without pickle
+	arrays = {"types": table["types"], "selectors": table["selectors"]}
+	arrays["keys"] = numpy.array(list(table["columns"].keys()), dtype=str)
+	arrays["kinds"] = numpy.array([kind for kind, _, _ in table["columns"].values()], dtype=str)
+	for j, (kind, array, mask) in enumerate(table["columns"].values()):
+		arrays["values"+str(j)] = array
+		arrays["mask"+str(j)] = mask
+	numpy.savez_compressed(path, **arrays)
+
+def loadInformation(path):
+	with numpy.load(path, allow_pickle=False) as arrays:
+		table = {"types": arrays["types"], "selectors": arrays["selectors"].reshape(-1, 3), "columns": collections.OrderedDict()}
+		for j, (aKey, kind) in enumerate(zip(arrays["keys"].tolist(), arrays["kinds"].tolist())):
+			if kind not in columnKinds:
+				raise Exception("Error: Unknown column kind ("+kind+") in the following file: "+str(path))
+			table["columns"][aKey] = (kind, arrays["values"+str(j)], arrays["mask"+str(j)])
+	return table
+
+def informationCSV(rows):
+	lines = [csvHeader]
+	for topologyType, (x, y, z), keys, values in rows:
+		lines.append(str(topologyType)+","+"{:.4f}".format(x)+","+"{:.4f}".format(y)+","+"{:.4f}".format(z)+","+"|".join(keys)+","+json.dumps(values))
+	return "\n".join(lines)
+
+def csvRows(csvString):
+	# Yields (type, (x, y, z), keys, values). Values keep their type if the text has the JSON header and are strings otherwise
+	typed = False
+	for row in csvString.split("\n"):
+		if row == "": #Ignore empty lines
+			continue
+		if row[0].isdigit() == False: # Header
+			typed = typed or row.strip() == csvHeader
+			continue
+		columns = row.split(",", 5)
+		keys = columns[4].split("|")
+		if typed:
+			values = json.loads(columns[5])
+		else:
+			values = columns[5].split(",")[0].split("|")
+		yield int(columns[0]), (float(columns[1]), float(columns[2]), float(columns[3])), keys, values
+
+def resolveSelectors(sinks, selectors, tolerance):
+	# Returns, for every selector, the indices of the sinks that contain it
+	# Vertices are matched through a hash grid and other topologies through a bounding box tree, then the exact test
+	if len(sinks) == 0:
+		return [[] for aSelector in selectors]
+	if sinks[0].GetType() == topologic.Vertex.Type():
+		vertexHash = VertexHash(tolerance)
+		for aSink in sinks:
+			_ = vertexHash.addVertex(aSink)
+		returnList = []
+		for x, y, z in selectors:
+			index = vertexHash.find(x, y, z)
+			returnList.append([] if index == None else [index])
+		return returnList
+	topologyIndex = TopologyIndex(sinks, tolerance)
+	returnList = []
+	for x, y, z in selectors:
+		vertex = topologic.Vertex.ByCoordinates(x, y, z)
+		returnList.append([i for i in topologyIndex.candidateIndices(vertex) if topologyContains(sinks[i], vertex, tolerance)])
+	return returnList
+
+def encodeRows(topology, rows, tolerance):
+	# Sets the dictionaries of the rows on the sub-topologies that contain their selectors
+	# Each sink gets one dictionary with the keys of all the rows that select it. A later row overrides the values of an earlier one
+	rowsByType = collections.OrderedDict()
+	for topologyType, selector, keys, values in rows:
+		rowsByType.setdefault(topologyType, []).append((selector, keys, values))
+	for topologyType, typeRows in rowsByType.items():
+		sinks = topologiesOfType(topology, topologyType)
+		matches = resolveSelectors(sinks, [aRow[0] for aRow in typeRows], tolerance)
+		sinkDictionaries = collections.OrderedDict()
+		for (selector, keys, values), sinkIndices in zip(typeRows, matches):
+			for i in sinkIndices:
+				d = sinkDictionaries.setdefault(i, collections.OrderedDict())
+				for aKey, aValue in zip(keys, values):
+					d[aKey] = aValue
+		for i, d in sinkDictionaries.items():
+			_ = sinks[i].SetDictionary(dictionaryByKeysValues(list(d.keys()), list(d.values())))
+	return topology
+
+def encodeInformation(topology, table, tolerance):
+	return encodeRows(topology, tableRows(table), tolerance)
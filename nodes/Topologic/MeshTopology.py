@@ -0,0 +1,174 @@
+# Builds Topologic vertices, edges and faces from mesh arrays in bulk. This module must not import bpy
+# Faces are given as a flat array of vertex indices and an array of offsets: face i uses indices[offsets[i]:offsets[i+1]]
+# Every edge shared by several faces is built once and reused, so shared boundaries are also shared in the resulting topology
+
+import time
+import hashlib
+import itertools
+import collections
+import numpy
+
+import topologic
+from topologic import Vertex, Edge, Wire, Face, Shell, Cell, CellComplex, Cluster, Topology
+import cppyy
+
+# The kinds of topology topologyByFaces tries, in order, and the kind that worked for each mesh it has seen
+faceStrategies = ["Cell", "CellComplex", "Shell", "Cluster"]
+maxStrategies = 1024
+strategies = collections.OrderedDict()
+
+def classByType(argument):
+	switcher = {
+		1: Vertex,
+		2: Edge,
+		4: Wire,
+		8: Face,
+		16: Shell,
+		32: Cell,
+		64: CellComplex,
+		128: Cluster }
+	return switcher.get(argument, Topology)
+
+def fixTopologyClass(topology):
+	if topology == None:
+		return None
+	else:
+		topology.__class__ = classByType(topology.GetType())
+	return topology
+
+def vertexArray(vertices):
+	return numpy.asarray(vertices, dtype=numpy.float64).reshape(-1, 3)
+
+def flatFaces(faces, offsets=None):
+	# Accepts a list of index loops, a (F, k) array of equally sized faces, or a flat index array with its offsets
+	if offsets is not None:
+		indices = numpy.asarray(faces, dtype=numpy.int64).reshape(-1)
+		offsets = numpy.asarray(offsets, dtype=numpy.int64).reshape(-1)
+		if len(offsets) == 0 or offsets[0] != 0:
+			offsets = numpy.concatenate(([0], offsets))
+		if offsets[-1] != len(indices):
+			offsets = numpy.concatenate((offsets, [len(indices)]))
+		return indices, offsets
+	if isinstance(faces, numpy.ndarray) and faces.ndim == 2:
+		count, size = faces.shape
+		return faces.astype(numpy.int64).reshape(-1), numpy.arange(0, count*size+1, size, dtype=numpy.int64)
+	lengths = numpy.fromiter((len(aFace) for aFace in faces), dtype=numpy.int64, count=len(faces))
+	offsets = numpy.zeros(len(faces)+1, dtype=numpy.int64)
+	numpy.cumsum(lengths, out=offsets[1:])
+	indices = numpy.fromiter(itertools.chain.from_iterable(faces), dtype=numpy.int64, count=int(offsets[-1]))
+	return indices, offsets
+
+def faceEdgeEnds(indices, offsets):
+	# Returns the end vertex index of every face edge. Each loop is closed by connecting its last vertex to its first
+	following = numpy.arange(1, len(indices)+1, dtype=numpy.int64)
+	lengths = numpy.diff(offsets)
+	closing = offsets[1:][lengths > 0]-1
+	following[closing] = offsets[:-1][lengths > 0]
+	return indices[following]
+
+def uniqueEdges(starts, ends):
+	# Returns the unique undirected (start, end) index pairs and, for every input pair, the position of its unique edge
+	starts = numpy.asarray(starts, dtype=numpy.int64)
+	ends = numpy.asarray(ends, dtype=numpy.int64)
+	pairs = numpy.stack((numpy.minimum(starts, ends), numpy.maximum(starts, ends)), axis=1)
+	if len(pairs) == 0:
+		return pairs, numpy.zeros(0, dtype=numpy.int64)
+	unique, inverse = numpy.unique(pairs, axis=0, return_inverse=True)
+	return unique, inverse.reshape(-1)
+
+def verticesByArray(vertices):
+	topVerts = cppyy.gbl.std.vector[Vertex.Ptr]()
+	topVerts.reserve(len(vertices))
+	for x, y, z in vertexArray(vertices).tolist():
+		topVerts.push_back(Vertex.ByCoordinates(x, y, z))
+	return topVerts
+
+def edgesByPairs(pairs, topVerts):
+	# Degenerate pairs (both ends on the same vertex) have no edge and give None
+	edges = []
+	for i, j in pairs.tolist():
+		if i == j:
+			edges.append(None)
+		else:
+			edges.append(Edge.ByStartVertexEndVertex(topVerts[i], topVerts[j]))
+	return edges
+
+def facesByArrays(topVerts, indices, offsets):
+	# Returns a list with one Face per index loop, or None where the loop does not bound a face
+	ends = faceEdgeEnds(indices, offsets)
+	pairs, inverse = uniqueEdges(indices, ends)
+	edges = edgesByPairs(pairs, topVerts)
+	faces = []
+	inverse = inverse.tolist()
+	offsets = offsets.tolist()
+	for i in range(len(offsets)-1):
+		faceEdges = cppyy.gbl.std.list[Edge.Ptr]()
+		for k in inverse[offsets[i]:offsets[i+1]]:
+			if edges[k] != None:
+				faceEdges.push_back(edges[k])
+		try:
+			faces.append(Face.ByExternalBoundary(Wire.ByEdges(faceEdges)))
+		except:
+			faces.append(None)
+	return faces
+
+def edgesByIndexPairs(topVerts, edgeIndices):
+	# Returns one Edge per unique undirected index pair. Each Edge keeps the direction of the first pair that defines it
+	edgeIndices = numpy.asarray(edgeIndices, dtype=numpy.int64).reshape(-1, 2)
+	_, inverse = uniqueEdges(edgeIndices[:, 0], edgeIndices[:, 1])
+	edges = []
+	used = set()
+	for (i, j), k in zip(edgeIndices.tolist(), inverse.tolist()):
+		if k in used or i == j:
+			continue
+		used.add(k)
+		edges.append(Edge.ByStartVertexEndVertex(topVerts[i], topVerts[j]))
+	return edges
+
+def meshDigest(vertices, indices, offsets, tolerance):
+	h = hashlib.sha256()
+	h.update(vertexArray(vertices).tobytes())
+	h.update(numpy.asarray(indices, dtype=numpy.int64).tobytes())
+	h.update(numpy.asarray(offsets, dtype=numpy.int64).tobytes())
+	h.update(str(tolerance).encode("utf-8"))
+	return h.hexdigest()
+
+def topologyByFaceStrategy(faces, tolerance, strategy):
+	if strategy == "Cell":
+		return Cell.ByFaces(faces)
+	elif strategy == "CellComplex":
+		return CellComplex.ByFaces(faces, tolerance)
+	elif strategy == "Shell":
+		return Shell.ByFaces(faces)
+	return Cluster.ByTopologies(faces)
+
+def topologyByFaces(faces, tolerance, key=None, timings=None):
+	# Tries to build a Cell, then a CellComplex, then a Shell and finally a Cluster from the faces
+	# If key identifies a mesh seen before, the kind of topology that worked for it is tried first
+	# timings, if given, is filled with (strategy, seconds, succeeded) for every attempt
+	if len(faces) == 1:
+		return fixTopologyClass(faces.front())
+	order = list(faceStrategies)
+	if key != None and key in strategies:
+		order.remove(strategies[key])
+		order.insert(0, strategies[key])
+		strategies.move_to_end(key)
+	for aStrategy in order:
+		start = time.time()
+		try:
+			output = topologyByFaceStrategy(faces, tolerance, aStrategy)
+		except:
+			output = None
+		if timings != None:
+			timings.append((aStrategy, time.time()-start, output != None))
+		if output != None:
+			if key != None:
+				strategies[key] = aStrategy
+				while len(strategies) > maxStrategies:
+					strategies.popitem(last=False)
+			return fixTopologyClass(output)
+	print("ERROR: Could not create any topology from the input faces!")
+	return None
+
+def timingsString(timings):
+	return "  ".join(aStrategy+(": " if succeeded else " failed: ")+str(round(seconds, 2))+"s" for aStrategy, seconds, succeeded in timings)
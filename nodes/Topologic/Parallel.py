@@ -0,0 +1,195 @@
+# Runs a node's processItem in a pool of worker processes. This module must not import bpy
+# Topologies cross the process boundary as BRep strings with their dictionaries (and those of their sub-topologies) carried alongside
+# Contents, contexts and apertures are not transported
+
+import os
+import sys
+import types
+import importlib
+import itertools
+import multiprocessing
+import concurrent.futures
+
+import topologic
+from topologic import Vertex, Edge, Wire, Face, Shell, Cell, CellComplex, Cluster, Topology
+import cppyy
+
+transportTag = "TopologicTransport"
+subTopologyTypes = [("Vertices", Vertex), ("Edges", Edge), ("Wires", Wire), ("Faces", Face), ("Shells", Shell), ("Cells", Cell), ("CellComplexes", CellComplex)]
+
+def classByType(argument):
+	switcher = {
+		1: Vertex,
+		2: Edge,
+		4: Wire,
+		8: Face,
+		16: Shell,
+		32: Cell,
+		64: CellComplex,
+		128: Cluster }
+	return switcher.get(argument, Topology)
+
+def fixTopologyClass(topology):
+  topology.__class__ = classByType(topology.GetType())
+  return topology
+
+def getKeysAndValues(item):
+	stl_keys = item.Keys()
+	keys = []
+	values = []
+	copyKeys = stl_keys.__class__(stl_keys) #wlav suggested workaround. Make a copy first
+	for x in copyKeys:
+		k = x.c_str()
+		keys.append(k)
+	for key in keys:
+		fv = None
+		try:
+			v = item.ValueAtKey(key).Value()
+		except:
+			raise Exception("Error: Could not retrieve a Value at the specified key ("+key+")")
+		if (isinstance(v, int) or (isinstance(v, float))):
+			fv = v
+		elif (isinstance(v, cppyy.gbl.std.string)):
+			fv = v.c_str()
+		else:
+			tempList = []
+			for i in v:
+				if isinstance(i.Value(), cppyy.gbl.std.string):
+					tempList.append(i.Value().c_str())
+				else:
+					tempList.append(i.Value())
+			fv = tempList
+		values.append(fv)
+	return [keys, values]
+
+def attributeByValue(value):
+	if isinstance(value, bool):
+		return topologic.IntAttribute(int(value))
+	elif isinstance(value, int):
+		return topologic.IntAttribute(value)
+	elif isinstance(value, float):
+		return topologic.DoubleAttribute(value)
+	elif isinstance(value, str):
+		return topologic.StringAttribute(value)
+	elif isinstance(value, list):
+		l = cppyy.gbl.std.list[topologic.Attribute.Ptr]()
+		for v in value:
+			l.push_back(attributeByValue(v))
+		return topologic.ListAttribute(l)
+	raise Exception("Error: Value type is not supported. Supported types are: Boolean, Integer, Double, String, or List.")
+
+def dictionaryByKeysValues(keys, values):
+	stl_keys = cppyy.gbl.std.list[cppyy.gbl.std.string]()
+	stl_values = cppyy.gbl.std.list[topologic.Attribute.Ptr]()
+	for i in range(len(keys)):
+		stl_keys.push_back(keys[i])
+		stl_values.push_back(attributeByValue(values[i]))
+	return topologic.Dictionary.ByKeysValues(stl_keys, stl_values)
+
+def subTopologies(topology, subTopologyType, subTopologyClass):
+	stlList = cppyy.gbl.std.list[subTopologyClass.Ptr]()
+	_ = getattr(topology, subTopologyType)(stlList)
+	return list(stlList)
+
+def subTopologyDictionaries(topology):
+	# Returns {subTopologyType: [[index, keys, values], ...]} for the sub-topologies that have a dictionary
+	dictionaries = {}
+	for subTopologyType, subTopologyClass in subTopologyTypes:
+		entries = []
+		for i, aSubTopology in enumerate(subTopologies(topology, subTopologyType, subTopologyClass)):
+			keys, values = getKeysAndValues(aSubTopology.GetDictionary())
+			if len(keys) > 0:
+				entries.append([i, keys, values])
+		if len(entries) > 0:
+			dictionaries[subTopologyType] = entries
+	return dictionaries
+
+def setSubTopologyDictionaries(topology, dictionaries):
+	for subTopologyType, subTopologyClass in subTopologyTypes:
+		if subTopologyType not in dictionaries:
+			continue
+		members = subTopologies(topology, subTopologyType, subTopologyClass)
+		for i, keys, values in dictionaries[subTopologyType]:
+			_ = members[i].SetDictionary(dictionaryByKeysValues(keys, values))
+
+def topologyToTransport(topology):
+	return (transportTag, str(topology.String()), getKeysAndValues(topology.GetDictionary()), subTopologyDictionaries(topology))
+
+def topologyByTransport(transport):
+	_, brepString, dictionary, dictionaries = transport
+	topology = fixTopologyClass(topologic.Topology.ByString(brepString))
+	if len(dictionary[0]) > 0:
+		_ = topology.SetDictionary(dictionaryByKeysValues(dictionary[0], dictionary[1]))
+	setSubTopologyDictionaries(topology, dictionaries)
+	return topology
+
+def isTransport(item):
+	# Transports are tuples, or lists once they have been through JSON
+	return isinstance(item, (tuple, list)) and len(item) == 4 and item[0] == transportTag
+
+def pack(item):
+	if isinstance(item, (list, tuple)):
+		return [pack(anItem) for anItem in item]
+	elif isinstance(item, topologic.Topology):
+		return topologyToTransport(item)
+	return item
+
+def unpack(item):
+	if isTransport(item):
+		return topologyByTransport(item)
+	elif isinstance(item, list):
+		return [unpack(anItem) for anItem in item]
+	return item
+
+def importHeadless(moduleName):
+	# Importing the add-on package would run its __init__, which needs bpy. Register its parent packages as
+	# bare modules that point at the add-on folders so that the node helper modules can be imported on their own
+	parts = moduleName.split(".")
+	directory = os.path.dirname(os.path.realpath(__file__))
+	for i in range(1, len(parts)):
+		packageName = ".".join(parts[:i])
+		if packageName in sys.modules:
+			continue
+		package = types.ModuleType(packageName)
+		packageDirectory = directory
+		for j in range(len(parts)-1-i):
+			packageDirectory = os.path.dirname(packageDirectory)
+		package.__path__ = [packageDirectory]
+		sys.modules[packageName] = package
+	return importlib.import_module(moduleName)
+
+def processTransportItem(moduleName, functionName, item):
+	function = getattr(importHeadless(moduleName), functionName)
+	return pack(function(unpack(item)))
+
+executors = {}
+
+# Run by every worker process before it unpickles a task. The initializer has to be importable without the add-on package,
+# so the built-in exec runs this source, which loads this file under its package-qualified name through importHeadless
+workerBootstrap = """import importlib.util, sys
+spec = importlib.util.spec_from_file_location(moduleName, modulePath)
+module = importlib.util.module_from_spec(spec)
+sys.modules[moduleName] = module
+spec.loader.exec_module(module)
+module.importHeadless(moduleName)
+"""
+
+def getExecutor(workers):
+	if workers < 1:
+		workers = os.cpu_count() or 1
+	if workers not in executors:
+		bootstrapGlobals = {"moduleName": __name__, "modulePath": os.path.realpath(__file__)}
+		executors[workers] = concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"), initializer=exec, initargs=(workerBootstrap, bootstrapGlobals))
+	return executors[workers]
+
+def shutdownExecutors():
+	for anExecutor in executors.values():
+		anExecutor.shutdown(wait=False)
+	executors.clear()
+
+def processItemsInParallel(function, items, workers=0):
+	# Tasks are pickled by package-qualified module name. Worker processes run workerBootstrap first, so they import this
+	# module and the module of the function without the add-on's __init__
+	packedItems = [pack(anItem) for anItem in items]
+	results = getExecutor(workers).map(processTransportItem, itertools.repeat(function.__module__), itertools.repeat(function.__name__), packedItems)
+	return [unpack(aResult) for aResult in results]
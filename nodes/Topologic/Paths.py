@@ -0,0 +1,161 @@
+# Bounded path enumeration over a graph snapshot. This module must not import bpy
+# Paths are generated lazily as lists of vertex indices, so taking a page of them only enumerates the paths up to the end
+# of that page, and Wires are built for the paths of the page only. A path costs the weights of its edges plus the
+# weights of the vertices it enters, as in GraphSnapshot.shortestPathTree
+
+import math
+import time
+import heapq
+import itertools
+
+import topologic
+import cppyy
+
+# The deadline is checked once per this many steps of a depth-first search
+stepsPerTimeCheck = 1024
+
+def neighbourIndices(adjacency, i):
+	# The distinct neighbours of the vertex. Parallel edges lead to the same vertex sequence
+	return list(dict.fromkeys(j for j, _ in adjacency[i]))
+
+def allPaths(snapshot, source, target, maxLength=0, timeLimit=0):
+	# Yields the simple paths from the source to the target, depth first. maxLength is the largest number of edges of a
+	# path, 0 for no limit. A branch is cut as soon as the fewest edges it still needs to reach the target exceed maxLength
+	deadline = time.time()+timeLimit if timeLimit > 0 else None
+	if source == target:
+		return
+	adjacency = snapshot.adjacency()
+	hops = snapshot.breadthFirstDistances(target)
+	if hops[source] < 0:
+		return
+	limit = maxLength if maxLength > 0 else len(adjacency)
+	path = [source]
+	onPath = set(path)
+	stack = [iter(neighbourIndices(adjacency, source))]
+	steps = 0
+	while stack:
+		steps += 1
+		if deadline != None and steps % stepsPerTimeCheck == 0 and time.time() > deadline:
+			return
+		advanced = False
+		for j in stack[-1]:
+			if j in onPath or hops[j] < 0 or len(path)+hops[j] > limit:
+				continue
+			if j == target:
+				yield path+[j]
+				continue
+			path.append(j)
+			onPath.add(j)
+			stack.append(iter(neighbourIndices(adjacency, j)))
+			advanced = True
+			break
+		if not advanced:
+			_ = stack.pop()
+			onPath.discard(path.pop())
+
+class PathCosts:
+	# The weights of a snapshot as lists, and the cost of a path under them. Shortest paths need non-negative weights
+	# Costing paths found otherwise does not, so allowNegative skips the check
+	def __init__(self, snapshot, edgeKey="", vertexKey="", allowNegative=False):
+		self.adjacency = snapshot.adjacency()
+		edgeWeights = snapshot.edgeWeights(edgeKey)
+		vertexWeights = snapshot.vertexWeights(vertexKey)
+		if not allowNegative and ((edgeWeights < 0).any() or (vertexWeights < 0).any()):
+			raise Exception("Error: Shortest paths cannot be found with negative edge or vertex weights")
+		self.edgeWeights = edgeWeights.tolist()
+		self.vertexWeights = vertexWeights.tolist()
+
+	def stepCost(self, i, j):
+		# The cheapest edge from i to j plus the weight of j
+		return min(self.edgeWeights[e] for k, e in self.adjacency[i] if k == j)+self.vertexWeights[j]
+
+	def pathCost(self, path):
+		return sum(self.stepCost(path[k], path[k+1]) for k in range(len(path)-1))
+
+	def shortestPath(self, source, target, blockedVertices, blockedNeighbours):
+		# Dijkstra's algorithm avoiding the blocked vertices and the steps from the source to the blocked neighbours
+		# Returns the cheapest path as a list of vertex indices, or None if the target cannot be reached
+		distances = {source: 0.0}
+		predecessors = {source: -1}
+		done = set()
+		heap = [(0.0, source)]
+		while heap:
+			d, i = heapq.heappop(heap)
+			if i in done:
+				continue
+			if i == target:
+				path = [target]
+				while path[-1] != source:
+					path.append(predecessors[path[-1]])
+				path.reverse()
+				return path
+			done.add(i)
+			for j, e in self.adjacency[i]:
+				if j in blockedVertices or j in done or (i == source and j in blockedNeighbours):
+					continue
+				nd = d+self.edgeWeights[e]+self.vertexWeights[j]
+				if nd < distances.get(j, math.inf):
+					distances[j] = nd
+					predecessors[j] = i
+					heapq.heappush(heap, (nd, j))
+		return None
+
+def kShortestPaths(snapshot, source, target, edgeKey="", vertexKey="", maxLength=0, timeLimit=0):
+	# Yields the simple paths from the source to the target in order of non-decreasing cost with Yen's algorithm
+	# maxLength is the largest number of edges of a yielded path, 0 for no limit. Longer paths are still used to derive
+	# the next candidates, so the order stays exact
+	deadline = time.time()+timeLimit if timeLimit > 0 else None
+	if source == target:
+		return
+	costs = PathCosts(snapshot, edgeKey, vertexKey)
+	first = costs.shortestPath(source, target, set(), set())
+	if first == None:
+		return
+	found = [first]
+	seen = set([tuple(first)])
+	candidates = []
+	while True:
+		last = found[-1]
+		if maxLength <= 0 or len(last)-1 <= maxLength:
+			yield last
+		for i in range(len(last)-1):
+			if deadline != None and time.time() > deadline:
+				return
+			root = last[:i+1]
+			blockedNeighbours = set(aPath[i+1] for aPath in found if aPath[:i+1] == root)
+			spurPath = costs.shortestPath(last[i], target, set(root[:-1]), blockedNeighbours)
+			if spurPath == None:
+				continue
+			path = root[:-1]+spurPath
+			if tuple(path) not in seen:
+				seen.add(tuple(path))
+				heapq.heappush(candidates, (costs.pathCost(path), path))
+		if len(candidates) == 0:
+			return
+		found.append(heapq.heappop(candidates)[1])
+
+def shortestPaths(snapshot, source, target, edgeKey="", vertexKey="", timeLimit=0, tolerance=1e-9):
+	# Yields the paths that tie for the lowest cost
+	costs = PathCosts(snapshot, edgeKey, vertexKey)
+	lowest = None
+	for aPath in kShortestPaths(snapshot, source, target, edgeKey, vertexKey, 0, timeLimit):
+		cost = costs.pathCost(aPath)
+		if lowest == None:
+			lowest = cost
+		elif cost > lowest+tolerance*max(1.0, lowest):
+			return
+		yield aPath
+
+def pathPage(paths, maxPaths=0, page=0, pageSize=0):
+	# Returns the paths of the page, out of at most maxPaths paths. A pageSize of 0 returns them all
+	if maxPaths > 0:
+		paths = itertools.islice(paths, maxPaths)
+	if pageSize > 0:
+		return list(itertools.islice(paths, page*pageSize, (page+1)*pageSize))
+	return list(paths)
+
+def pathWire(snapshot, path):
+	edges = cppyy.gbl.std.list[topologic.Edge.Ptr]()
+	for i, j in zip(path[:-1], path[1:]):
+		edges.push_back(topologic.Edge.ByStartVertexEndVertex(snapshot.vertices[i], snapshot.vertices[j]))
+	return topologic.Wire.ByEdges(edges)
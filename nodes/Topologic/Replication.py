@@ -1,23 +1,44 @@
-import bpy
-from bpy.props import StringProperty, BoolProperty, FloatProperty, EnumProperty
-from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import updateNode
+import itertools
 
-import topologic
-from topologic import Vertex, Edge, Wire, Face, Shell, Cell, CellComplex, Cluster, Topology, Graph
-import cppyy
-import time
+# Shared replication helpers. Nodes import these instead of keeping their own copies.
 
-# From https://stackabuse.com/python-how-to-flatten-list-of-lists/
+# Iterative version of https://stackabuse.com/python-how-to-flatten-list-of-lists/
+# Runs in linear time and does not hit the recursion limit on deeply nested lists
 def flatten(element):
 	returnList = []
-	if isinstance(element, list) == True:
-		for anItem in element:
-			returnList = returnList + flatten(anItem)
-	else:
-		returnList = [element]
+	stack = [iter([element])]
+	while stack:
+		for anItem in stack[-1]:
+			if isinstance(anItem, list) == True:
+				stack.append(iter(anItem))
+				break
+			returnList.append(anItem)
+		else:
+			stack.pop()
 	return returnList
 
+# Lazily yields one argument tuple per processItem call without padding, copying or transposing the input lists
+# replication is one of "Trim", "Iterate", "Repeat", "Interlace". "Default" is treated as "Iterate"
+def replicateInputs(inputs, replication):
+	if len(inputs) == 0:
+		return
+	if replication == "Interlace":
+		yield from itertools.product(*inputs)
+		return
+	lengths = [len(anItem) for anItem in inputs]
+	if replication == "Trim":
+		for i in range(min(lengths)):
+			yield tuple(anItem[i] for anItem in inputs)
+	elif replication == "Repeat":
+		for i in range(max(lengths)):
+			yield tuple((anItem[i] if i < len(anItem) else anItem[-1]) if len(anItem) > 0 else None for anItem in inputs)
+	elif replication in ["Iterate", "Default"]:
+		for i in range(max(lengths)):
+			yield tuple(anItem[i % len(anItem)] if len(anItem) > 0 else None for anItem in inputs)
+	else:
+		raise Exception("ERROR: (Topologic>Replication) invalid replication name: "+str(replication))
+
+# The list-based helpers below are kept for nodes that still pad and transpose their inputs eagerly
 def repeat(list):
 	maxLength = len(list[0])
 	for aSubList in list:
@@ -0,0 +1,127 @@
+# Memoised selector (internal vertex, center of mass, centroid) computation. This module must not import bpy
+# Entries are keyed by the hash of the OCCT shape and matched with IsSame, so equal shapes share one entry
+# The cache is a bounded LRU without invalidation. OCCT shapes are never edited in place, so an edited topology has a
+# new shape that misses the cache, and the entries of shapes no longer used are evicted once maxEntries is exceeded
+# Only coordinates are cached. Every call returns a new Vertex so that dictionaries set on it by a node do not leak into other nodes
+
+import collections
+
+import topologic
+from topologic import Vertex, Edge, Wire, Face, Shell, Cell, CellComplex, Cluster, Topology
+import cppyy
+
+maxEntries = 4096
+hashUpperBound = 2147483647
+selectors = collections.OrderedDict()
+
+def classByType(argument):
+	switcher = {
+		1: Vertex,
+		2: Edge,
+		4: Wire,
+		8: Face,
+		16: Shell,
+		32: Cell,
+		64: CellComplex,
+		128: Cluster }
+	return switcher.get(argument, Topology)
+
+def fixTopologyClass(topology):
+  topology.__class__ = classByType(topology.GetType())
+  return topology
+
+def shapeHash(topology):
+	# Returns None if the shape cannot be hashed, in which case the selector is computed without caching
+	try:
+		return topology.GetOcctShape().HashCode(hashUpperBound)
+	except:
+		return None
+
+def cachedSelector(topology, kind, function):
+	h = shapeHash(topology)
+	if h == None:
+		return function(topology)
+	key = (h, kind)
+	entries = selectors.get(key)
+	if entries != None:
+		for aTopology, coordinates in entries:
+			if aTopology.IsSame(topology):
+				selectors.move_to_end(key)
+				return topologic.Vertex.ByCoordinates(coordinates[0], coordinates[1], coordinates[2])
+	vertex = function(topology)
+	if vertex == None:
+		return None
+	# Keeping the topology in the entry keeps its shape alive so that IsSame stays meaningful
+	entry = (topology, (vertex.X(), vertex.Y(), vertex.Z()))
+	if entries == None:
+		selectors[key] = [entry]
+	else:
+		entries.append(entry)
+		selectors.move_to_end(key)
+	while len(selectors) > maxEntries:
+		selectors.popitem(last=False)
+	return vertex
+
+def cellInternalVertex(cell, tolerance=None):
+	if tolerance == None:
+		return cachedSelector(cell, ("CellInternalVertex",), lambda t: topologic.CellUtility.InternalVertex(t))
+	return cachedSelector(cell, ("CellInternalVertex", tolerance), lambda t: topologic.CellUtility.InternalVertex(t, tolerance))
+
+def faceInternalVertex(face, tolerance=None):
+	if tolerance == None:
+		return cachedSelector(face, ("FaceInternalVertex",), lambda t: topologic.FaceUtility.InternalVertex(t))
+	return cachedSelector(face, ("FaceInternalVertex", tolerance), lambda t: topologic.FaceUtility.InternalVertex(t, tolerance))
+
+def centerOfMass(topology):
+	return cachedSelector(topology, ("CenterOfMass",), lambda t: t.CenterOfMass())
+
+def centroid(topology):
+	return cachedSelector(topology, ("Centroid",), lambda t: t.Centroid())
+
+def internalVertex(topology, tolerance):
+	# Returns a vertex guaranteed to be inside the topology (or on it for edges and open wires)
+	topology = fixTopologyClass(topology)
+	vst = None
+	classType = topology.GetType()
+	if classType == 64: #CellComplex
+		tempCells = cppyy.gbl.std.list[topologic.Cell.Ptr]()
+		_ = topology.Cells(tempCells)
+		vst = cellInternalVertex(tempCells.front(), tolerance)
+	elif classType == 32: #Cell
+		vst = cellInternalVertex(topology, tolerance)
+	elif classType == 16: #Shell
+		tempFaces = cppyy.gbl.std.list[topologic.Face.Ptr]()
+		_ = topology.Faces(tempFaces)
+		vst = faceInternalVertex(tempFaces.front(), tolerance)
+	elif classType == 8: #Face
+		vst = faceInternalVertex(topology, tolerance)
+	elif classType == 4: #Wire
+		if topology.IsClosed():
+			internalBoundaries = cppyy.gbl.std.list[topologic.Wire.Ptr]()
+			vst = cachedSelector(topology, ("WireInternalVertex", tolerance), lambda t: topologic.FaceUtility.InternalVertex(topologic.Face.ByExternalInternalBoundaries(t, internalBoundaries), tolerance))
+		else:
+			tempEdges = cppyy.gbl.std.list[topologic.Edge.Ptr]()
+			_ = topology.Edges(tempEdges)
+			vst = topologic.EdgeUtility.PointAtParameter(tempEdges.front(), 0.5)
+	elif classType == 2: #Edge
+		vst = topologic.EdgeUtility.PointAtParameter(topology, 0.5)
+	elif classType == 1: #Vertex
+		vst = topology
+	else:
+		vst = centerOfMass(topology)
+	return vst
+
+def relevantSelector(topology, useCenterOfMass=False):
+	# The vertex used to match a topology with the dictionaries of another one
+	if topology.GetType() == topologic.Vertex.Type():
+		return topology
+	elif topology.GetType() == topologic.Edge.Type():
+		return topologic.EdgeUtility.PointAtParameter(topology, 0.5)
+	elif topology.GetType() == topologic.Face.Type():
+		return faceInternalVertex(topology)
+	elif topology.GetType() == topologic.Cell.Type():
+		return cellInternalVertex(topology)
+	elif useCenterOfMass:
+		return centerOfMass(topology)
+	else:
+		return centroid(topology)
@@ -5,16 +5,6 @@ from sverchok.data_structure import updateNode
 
 import topologic
 import cppyy
-# From https://stackabuse.com/python-how-to-flatten-list-of-lists/
-def flatten(element):
-	returnList = []
-	if isinstance(element, list) == True:
-		for anItem in element:
-			returnList = returnList + flatten(anItem)
-	else:
-		returnList = [element]
-	return returnList
-
 def processItem(faces):
 	stl_faces = cppyy.gbl.std.list[topologic.Face.Ptr]()
 	for face in faces:
@@ -0,0 +1,139 @@
+# Spatial indices that narrow down candidates before exact (and expensive) geometric tests. This module must not import bpy
+
+import math
+
+import topologic
+import cppyy
+
+# Below this many topologies, building the index costs more than it saves
+minimumIndexSize = 8
+leafSize = 8
+boundingBoxLibrary = None
+
+def loadBoundingBoxLibrary():
+	global boundingBoxLibrary
+	if boundingBoxLibrary == None:
+		try:
+			cppyy.include("Bnd_Box.hxx")
+			cppyy.include("BRepBndLib.hxx")
+			boundingBoxLibrary = cppyy.gbl.BRepBndLib
+		except:
+			boundingBoxLibrary = False
+	return boundingBoxLibrary
+
+def boundingBox(topology, tolerance):
+	# Returns the OCCT bounding box of the topology grown by the tolerance, or None if it is not available
+	# Vertex coordinates alone are not enough because curved edges and faces bulge beyond their vertices
+	library = loadBoundingBoxLibrary()
+	if library == False:
+		return None
+	try:
+		box = cppyy.gbl.Bnd_Box()
+		library.Add(topology.GetOcctShape(), box)
+		if box.IsVoid():
+			return None
+		pMin = box.CornerMin()
+		pMax = box.CornerMax()
+	except:
+		return None
+	return (pMin.X()-tolerance, pMin.Y()-tolerance, pMin.Z()-tolerance, pMax.X()+tolerance, pMax.Y()+tolerance, pMax.Z()+tolerance)
+
+def enclosingBox(boxes):
+	return (min(b[0] for b in boxes), min(b[1] for b in boxes), min(b[2] for b in boxes), max(b[3] for b in boxes), max(b[4] for b in boxes), max(b[5] for b in boxes))
+
+class BoundingBoxTree:
+	# Axis-aligned bounding box tree built by median splits along the longest axis
+	# Indices without a box (None) are returned by every query so that they still get the exact test
+	def __init__(self, boxes):
+		self.boxes = boxes
+		self.unboxed = [i for i in range(len(boxes)) if boxes[i] == None]
+		boxed = [i for i in range(len(boxes)) if boxes[i] != None]
+		self.root = self.build(boxed) if len(boxed) > 0 else None
+
+	def build(self, indices):
+		box = enclosingBox([self.boxes[i] for i in indices])
+		if len(indices) <= leafSize:
+			return (box, None, None, indices)
+		extents = [box[3]-box[0], box[4]-box[1], box[5]-box[2]]
+		axis = extents.index(max(extents))
+		indices = sorted(indices, key=lambda i: self.boxes[i][axis]+self.boxes[i][axis+3])
+		middle = len(indices)//2
+		return (box, self.build(indices[:middle]), self.build(indices[middle:]), None)
+
+	def query(self, x, y, z):
+		# Returns, in ascending order, the indices of the boxes that contain the point
+		result = list(self.unboxed)
+		stack = [self.root] if self.root != None else []
+		while stack:
+			box, left, right, indices = stack.pop()
+			if x < box[0] or y < box[1] or z < box[2] or x > box[3] or y > box[4] or z > box[5]:
+				continue
+			if indices == None:
+				stack.append(left)
+				stack.append(right)
+				continue
+			for i in indices:
+				b = self.boxes[i]
+				if x >= b[0] and y >= b[1] and z >= b[2] and x <= b[3] and y <= b[4] and z <= b[5]:
+					result.append(i)
+		result.sort()
+		return result
+
+class TopologyIndex:
+	# Finds the topologies whose bounding box contains a vertex. Candidates keep their input order
+	def __init__(self, topologies, tolerance):
+		self.topologies = list(topologies)
+		self.tree = None
+		if len(self.topologies) >= minimumIndexSize and loadBoundingBoxLibrary() != False:
+			self.tree = BoundingBoxTree([boundingBox(aTopology, tolerance) for aTopology in self.topologies])
+
+	def candidateIndices(self, vertex):
+		if self.tree == None:
+			return range(len(self.topologies))
+		return self.tree.query(vertex.X(), vertex.Y(), vertex.Z())
+
+	def candidates(self, vertex):
+		if self.tree == None:
+			return self.topologies
+		return [self.topologies[i] for i in self.candidateIndices(vertex)]
+
+class VertexHash:
+	# Finds the first added point that lies closer than the tolerance to a query point in amortised constant time
+	# Points are bucketed on a grid whose cells are as wide as the tolerance, so every match lies in one of the 27 cells around the query
+	def __init__(self, tolerance):
+		self.tolerance = tolerance
+		self.cellSize = tolerance if tolerance > 0 else 1.0
+		self.points = []
+		self.cells = {}
+
+	def cell(self, x, y, z):
+		return (math.floor(x/self.cellSize), math.floor(y/self.cellSize), math.floor(z/self.cellSize))
+
+	def add(self, x, y, z):
+		# Returns the index of the new point. Points are not merged, so indices follow the order in which they were added
+		index = len(self.points)
+		self.points.append((x, y, z))
+		self.cells.setdefault(self.cell(x, y, z), []).append(index)
+		return index
+
+	def addVertex(self, vertex):
+		return self.add(vertex.X(), vertex.Y(), vertex.Z())
+
+	def find(self, x, y, z):
+		# Returns the lowest index of the points closer than the tolerance, or None
+		i, j, k = self.cell(x, y, z)
+		squaredTolerance = self.tolerance*self.tolerance
+		found = None
+		for di in (-1, 0, 1):
+			for dj in (-1, 0, 1):
+				for dk in (-1, 0, 1):
+					for index in self.cells.get((i+di, j+dj, k+dk), []):
+						if found != None and index > found:
+							continue
+						p = self.points[index]
+						if self.tolerance > 0 and (p[0]-x)**2+(p[1]-y)**2+(p[2]-z)**2 < squaredTolerance:
+							found = index
+		return found
+
+	def findVertex(self, vertex):
+		return self.find(vertex.X(), vertex.Y(), vertex.Z())
@@ -0,0 +1,103 @@
+import bpy
+from bpy.props import IntProperty, BoolProperty, FloatProperty, EnumProperty
+from sverchok.node_tree import SverchCustomTreeNode
+from sverchok.data_structure import updateNode
+
+import topologic
+import cppyy
+import time
+
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.Replication')
+importlib.import_module('topologicsverchok.nodes.Topologic.Boolean')
+importlib.import_module('topologicsverchok.nodes.Topologic.Parallel')
+from topologicsverchok.nodes.Topologic.Replication import flatten
+from topologicsverchok.nodes.Topologic.Boolean import processItem as booleanProcessItem
+from topologicsverchok.nodes.Topologic.Parallel import processItemsInParallel, shutdownExecutors
+
+def reduceLevel(topologies, operation, tranDict, tolerance, parallel, workers):
+	# Combines neighbouring pairs. An odd Topology out is carried up to the next level unchanged
+	pairs = []
+	for i in range(0, len(topologies)-1, 2):
+		pairs.append([topologies[i], topologies[i+1], operation, tranDict, tolerance])
+	if parallel and len(pairs) > 1:
+		results = processItemsInParallel(booleanProcessItem, pairs, workers)
+	else:
+		results = [booleanProcessItem(aPair) for aPair in pairs]
+	if len(topologies) % 2 == 1:
+		results.append(topologies[-1])
+	return results
+
+def processItem(item, operation, tranDict, tolerance, parallel, workers):
+	topologies = [aTopology for aTopology in item if aTopology != None]
+	while len(topologies) > 1:
+		topologies = reduceLevel(topologies, operation, tranDict, tolerance, parallel, workers)
+		if None in topologies:
+			if operation == "Intersect":
+				return None
+			topologies = [aTopology for aTopology in topologies if aTopology != None]
+	if len(topologies) == 0:
+		return None
+	return topologies[0]
+
+def recur(input, operation, tranDict, tolerance, parallel, workers):
+	output = []
+	if input == None:
+		return []
+	if len(input) > 0 and isinstance(input[0], list):
+		for anItem in input:
+			output.append(recur(anItem, operation, tranDict, tolerance, parallel, workers))
+	else:
+		output = processItem(input, operation, tranDict, tolerance, parallel, workers)
+	return output
+
+booleanOps = [("Union", "Union", "", 1),("Merge", "Merge", "", 2),("Intersect", "Intersect", "", 3)]
+
+class SvTopologyBooleanReduce(bpy.types.Node, SverchCustomTreeNode):
+	"""
+	Triggers: Topologic
+	Tooltip: Combines the input list of Topologies into one Topology by applying the Boolean operation pairwise in a balanced tree
+	"""
+	bl_idname = 'SvTopologyBooleanReduce'
+	bl_label = 'Topology.BooleanReduce'
+	BooleanOp: EnumProperty(name="Boolean Operation", description="Specify Boolean operation", default="Union", items=booleanOps, update=updateNode)
+	TransferDictionary: BoolProperty(name="Transfer Dictionary", default=False, update=updateNode)
+	Tolerance: FloatProperty(name="Tolerance",  default=0.001, precision=4, update=updateNode)
+	Parallel: BoolProperty(name="Parallel", description="Run the Boolean operations of each tree level in a pool of worker processes", default=False, update=updateNode)
+	Workers: IntProperty(name="Workers", description="Number of worker processes. 0 uses one per CPU core", default=0, min=0, update=updateNode)
+
+	def sv_init(self, context):
+		self.inputs.new('SvStringsSocket', 'Topologies')
+		self.inputs.new('SvStringsSocket', 'Transfer Dictionary').prop_name = 'TransferDictionary'
+		self.inputs.new('SvStringsSocket', 'Tolerance').prop_name = 'Tolerance'
+		self.outputs.new('SvStringsSocket', 'Topology')
+
+	def draw_buttons(self, context, layout):
+		layout.prop(self, "BooleanOp",text="")
+		layout.prop(self, "Parallel")
+		if self.Parallel:
+			layout.prop(self, "Workers")
+
+	def process(self):
+		start = time.time()
+		if not any(socket.is_linked for socket in self.outputs):
+			return
+		if not any(socket.is_linked for socket in self.inputs):
+			self.outputs['Topology'].sv_set([])
+			return
+		inputs = self.inputs['Topologies'].sv_get(deepcopy=False)
+		tranDict = flatten(self.inputs['Transfer Dictionary'].sv_get(deepcopy=True))[0]
+		tolerance = flatten(self.inputs['Tolerance'].sv_get(deepcopy=True))[0]
+		outputs = recur(inputs, self.BooleanOp, tranDict, tolerance, self.Parallel, self.Workers)
+		if not isinstance(outputs, list):
+			outputs = [outputs]
+		self.outputs['Topology'].sv_set(outputs)
+		end = time.time()
+		print("Topology.BooleanReduce Operation consumed "+str(round(end - start,2))+" seconds")
+
+def register():
+    bpy.utils.register_class(SvTopologyBooleanReduce)
+
+def unregister():
+    shutdownExecutors()
+    bpy.utils.unregister_class(SvTopologyBooleanReduce)
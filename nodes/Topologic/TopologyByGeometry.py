@@ -1,5 +1,5 @@
 import bpy
-from bpy.props import BoolProperty, FloatProperty
+from bpy.props import BoolProperty, FloatProperty, StringProperty
 from mathutils import Matrix
 
 from sverchok.node_tree import SverchCustomTreeNode
@@ -13,6 +13,10 @@ from topologic import Vertex, Edge, Wire, Face, Shell, Cell, CellComplex, Cluste
 import cppyy
 from itertools import cycle
 
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.MeshTopology')
+from topologicsverchok.nodes.Topologic.MeshTopology import flatFaces, verticesByArray, facesByArrays, edgesByIndexPairs, meshDigest, topologyByFaces, timingsString
+
 def classByType(argument):
   switcher = {
     1: Vertex,
@@ -61,26 +65,6 @@ def vertexIndex(v, vertices, tolerance):
     return index
 
 
-def topologyByFaces(faces, tolerance):
-	output = None
-	if len(faces) == 1:
-		return fixTopologyClass(faces.front())
-	try:
-		output = Cell.ByFaces(faces)
-	except:
-		try:
-			output = CellComplex.ByFaces(faces, tolerance)
-		except:
-			try:
-				output = Shell.ByFaces(faces)
-			except:
-				try:
-					output = Cluster.ByTopologies(faces)
-				except:
-					print("ERROR: Could not create any topology from the input faces!")
-					output = None
-	return fixTopologyClass(output)
-
 def topologyByEdges(edges):
 	output = None
 	if len(edges) == 1:
@@ -103,16 +87,22 @@ class SvTopologyByGeometry(bpy.types.Node, SverchCustomTreeNode):
 	bl_idname = 'SvTopologyByGeometry'
 	bl_label = 'Topology.ByGeometry'
 	Tol: FloatProperty(name='Tol', default=0.0001, precision=4, update=updateNode)
+	StageTimings: StringProperty(name="Stage Timings", default="")
+
 	def sv_init(self, context):
 		self.inputs.new('SvStringsSocket', 'Vertices')
 		self.inputs.new('SvStringsSocket', 'Edges')
 		self.inputs.new('SvStringsSocket', 'Faces')
 		self.inputs.new('SvStringsSocket', 'Tol').prop_name='Tol'
+		self.inputs.new('SvStringsSocket', 'Face Offsets')
 		self.outputs.new('SvStringsSocket', 'Topology')
 		self.outputs.new('SvStringsSocket', 'Vertices')
 		self.outputs.new('SvStringsSocket', 'Edges')
 		self.outputs.new('SvStringsSocket', 'Faces')
 
+	def draw_buttons(self, context, layout):
+		if self.StageTimings:
+			layout.label(text=self.StageTimings)
 
 	def process(self):
 		if not any(socket.is_linked for socket in self.outputs):
@@ -120,41 +110,42 @@ class SvTopologyByGeometry(bpy.types.Node, SverchCustomTreeNode):
 		vertices = []
 		edges = []
 		faces = []
+		offsets = None
 		if (self.inputs['Vertices'].is_linked):
 			vertices = self.inputs['Vertices'].sv_get(deepcopy=False, default=[])[0]
 		if (self.inputs['Edges'].is_linked):
 			edges = self.inputs['Edges'].sv_get(deepcopy=False, default=[])[0]
 		if (self.inputs['Faces'].is_linked):
 			faces = self.inputs['Faces'].sv_get(deepcopy=False, default=[])[0]
+		# Nodes created before the Face Offsets input was added do not have it
+		if ('Face Offsets' in self.inputs) and (self.inputs['Face Offsets'].is_linked):
+			offsets = self.inputs['Face Offsets'].sv_get(deepcopy=False, default=[])[0]
 		tol = self.inputs['Tol'].sv_get(deepcopy=False, default=0.0001)[0]
 
 		if len(vertices) > 0:
-			topVerts = cppyy.gbl.std.vector[Vertex.Ptr]()
-			for aVertex in vertices:
-				v = Vertex.ByCoordinates(aVertex[0], aVertex[1], aVertex[2])
-				topVerts.push_back(v)
+			topVerts = verticesByArray(vertices)
 			self.outputs['Vertices'].sv_set(list(topVerts))
 		else:
 			self.outputs['Topology'].sv_set([])
 			return
 
 		if len(faces) > 0:
+			indices, offsets = flatFaces(faces, offsets)
 			topFaces = cppyy.gbl.std.list[Face.Ptr]()
-			for aFace in faces:
-				faceEdges = edgesByVertices(aFace, topVerts)
-				faceWire = Wire.ByEdges(faceEdges)
-				topFace = Face.ByExternalBoundary(faceWire)
-				topFaces.push_back(topFace)
-			output = topologyByFaces(topFaces, tol)
+			for aFace in facesByArrays(topVerts, indices, offsets):
+				if aFace != None:
+					topFaces.push_back(aFace)
+			timings = []
+			output = topologyByFaces(topFaces, tol, meshDigest(vertices, indices, offsets, tol), timings)
+			self.StageTimings = timingsString(timings)
 			self.outputs['Faces'].sv_set(list(topFaces))
 			self.outputs['Topology'].sv_set([output])
 			return
 
 		if len(edges) > 0:
 			topEdges = cppyy.gbl.std.list[Edge.Ptr]()
-			for anEdge in edges:
-				topEdge = Edge.ByStartVertexEndVertex(topVerts[anEdge[0]], topVerts[anEdge[1]])
-				topEdges.push_back(topEdge)
+			for anEdge in edgesByIndexPairs(topVerts, edges):
+				topEdges.push_back(anEdge)
 			output = topologyByEdges(topEdges)
 			self.outputs['Edges'].sv_set(list(topEdges))
 			self.outputs['Topology'].sv_set([output])
@@ -14,6 +14,10 @@ import cppyy
 from itertools import cycle
 import collections
 
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.MeshTopology')
+from topologicsverchok.nodes.Topologic.MeshTopology import flatFaces, verticesByArray, facesByArrays, edgesByIndexPairs, meshDigest, topologyByFaces, timingsString
+
 def classByType(argument):
   switcher = {
     1: Vertex,
@@ -63,28 +67,6 @@ def vertexIndex(v, vertices, tolerance):
     return index
 
 
-def topologyByFaces(faces, tolerance):
-	output = None
-	if len(faces) == 1:
-		return fixTopologyClass(faces.front())
-	try:
-		output = Cell.ByFaces(faces)
-	except:
-		try:
-			output = CellComplex.ByFaces(faces, tolerance)
-		except:
-			try:
-				output = Shell.ByFaces(faces)
-			except:
-				try:
-					output = Cluster.ByTopologies(faces)
-				except:
-					print("ERROR: Could not create any topology from the input faces!")
-					output = None
-	return fixTopologyClass(output)
-
-
-
 def topologyByEdges(edges):
 	output = None
 	if len(edges) == 1:
@@ -103,30 +85,25 @@ def processItem(item, tol):
 	vertices = item[0]
 	edges = item[1]
 	faces = item[2]
-	topVerts = cppyy.gbl.std.vector[Vertex.Ptr]()
 	topFaces = cppyy.gbl.std.list[Face.Ptr]()
 	topEdges = cppyy.gbl.std.list[Edge.Ptr]()
 	output = None
 	if len(vertices) > 0:
-		for aVertex in vertices:
-			v = Vertex.ByCoordinates(aVertex[0], aVertex[1], aVertex[2])
-			topVerts.push_back(v)
+		topVerts = verticesByArray(vertices)
 	else: #No Vertices means no Topology
 		return None
 	# Faces exist, so try to make a topology out of the faces
 	if len(faces) > 0:
-		for aFace in faces:
-			faceEdges = edgesByVertices(aFace, topVerts)
-			faceWire = Wire.ByEdges(faceEdges)
-			topFace = Face.ByExternalBoundary(faceWire)
-			topFaces.push_back(topFace)
-		output = topologyByFaces(topFaces, tol)
+		indices, offsets = flatFaces(faces)
+		for aFace in facesByArrays(topVerts, indices, offsets):
+			if aFace != None:
+				topFaces.push_back(aFace)
+		output = topologyByFaces(topFaces, tol, meshDigest(vertices, indices, offsets, tol))
 		return output
 	# Faces do not exist, so try to make a topology out of the edges
 	if len(edges) > 0:
-		for anEdge in edges:
-			topEdge = Edge.ByStartVertexEndVertex(topVerts[anEdge[0]], topVerts[anEdge[1]])
-			topEdges.push_back(topEdge)
+		for anEdge in edgesByIndexPairs(topVerts, edges):
+			topEdges.push_back(anEdge)
 		output = topologyByEdges(topEdges)
 		return output
 	# No Edges or Faces exist, so try to make a Cluster of the Vertices
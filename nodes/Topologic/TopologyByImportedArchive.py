@@ -0,0 +1,66 @@
+import bpy
+from bpy.props import IntProperty, FloatProperty, StringProperty, BoolProperty
+from sverchok.node_tree import SverchCustomTreeNode
+from sverchok.data_structure import updateNode
+
+import topologic
+import cppyy
+
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.Replication')
+importlib.import_module('topologicsverchok.nodes.Topologic.Archive')
+from topologicsverchok.nodes.Topologic.Replication import flatten
+from topologicsverchok.nodes.Topologic.Archive import ArchiveReader
+
+def processItem(filepath, indices, keys):
+	# Loads the entries at the indices and those with the keys, in that order. Loads every entry if neither is given
+	# Returns the topologies and the table of contents (keys and types of all the entries)
+	with ArchiveReader(filepath) as reader:
+		topologies = []
+		if len(indices) == 0 and len(keys) == 0:
+			indices = range(len(reader))
+		for anIndex in indices:
+			topologies.append(reader.load(int(anIndex)))
+		for aKey in keys:
+			topologies += reader.loadByKey(aKey)
+		return topologies, reader.keys(), reader.types()
+
+class SvTopologyByImportedArchive(bpy.types.Node, SverchCustomTreeNode):
+	"""
+	Triggers: Topologic
+	Tooltip: Loads Topologies, with their Dictionaries, Contents and Apertures, from an archive file by index or by key
+	"""
+	bl_idname = 'SvTopologyByImportedArchive'
+	bl_label = 'Topology.ByImportedArchive'
+
+	def sv_init(self, context):
+		self.inputs.new('SvStringsSocket', 'File Path')
+		self.inputs.new('SvStringsSocket', 'Indices')
+		self.inputs.new('SvStringsSocket', 'Keys')
+		self.outputs.new('SvStringsSocket', 'Topology')
+		self.outputs.new('SvStringsSocket', 'Archive Keys')
+		self.outputs.new('SvStringsSocket', 'Archive Types')
+
+	def process(self):
+		if not any(socket.is_linked for socket in self.outputs):
+			return
+		if not self.inputs['File Path'].is_linked:
+			self.outputs['Topology'].sv_set([])
+			return
+		filepath = self.inputs['File Path'].sv_get(deepcopy=False)[0][0] #accept only one file path
+		indices = []
+		keys = []
+		if self.inputs['Indices'].is_linked:
+			indices = flatten(self.inputs['Indices'].sv_get(deepcopy=False))
+		if self.inputs['Keys'].is_linked:
+			keys = flatten(self.inputs['Keys'].sv_get(deepcopy=False))
+		topologies, archiveKeys, archiveTypes = processItem(filepath, indices, keys)
+		self.outputs['Topology'].sv_set(topologies)
+		self.outputs['Archive Keys'].sv_set(archiveKeys)
+		self.outputs['Archive Types'].sv_set(archiveTypes)
+
+def register():
+	bpy.utils.register_class(SvTopologyByImportedArchive)
+
+def unregister():
+	bpy.utils.unregister_class(SvTopologyByImportedArchive)
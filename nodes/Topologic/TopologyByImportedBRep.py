@@ -1,45 +1,21 @@
 import bpy
-from bpy.props import IntProperty, FloatProperty, StringProperty
+from bpy.props import IntProperty, FloatProperty, StringProperty, BoolProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode
 
 import topologic
 from topologic import Vertex, Edge, Wire, Face, Shell, Cell, CellComplex, Cluster, Topology
-import cppyy
 
-# From https://stackabuse.com/python-how-to-flatten-list-of-lists/
-def flatten(element):
-	returnList = []
-	if isinstance(element, list) == True:
-		for anItem in element:
-			returnList = returnList + flatten(anItem)
-	else:
-		returnList = [element]
-	return returnList
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.Replication')
+importlib.import_module('topologicsverchok.nodes.Topologic.BRepIO')
+from topologicsverchok.nodes.Topologic.Replication import flatten
+from topologicsverchok.nodes.Topologic.BRepIO import topologyByBRepFile, topologiesByBRepFile
 
-def classByType(argument):
-	switcher = {
-		1: Vertex,
-		2: Edge,
-		4: Wire,
-		8: Face,
-		16: Shell,
-		32: Cell,
-		64: CellComplex,
-		128: Cluster }
-	return switcher.get(argument, Topology)
-
-def fixTopologyClass(topology):
-  topology.__class__ = classByType(topology.GetType())
-  return topology
-
-def processItem(item):
-	topology = None
-	file = open(item)
-	brepString = file.read()
-	topology = fixTopologyClass(topologic.Topology.DeepCopy(Topology.ByString(brepString)))
-	file.close()
-	return topology
+def processItem(item, splitCompound=False):
+	if splitCompound:
+		return list(topologiesByBRepFile(item))
+	return topologyByBRepFile(item)
 		
 class SvTopologyByImportedBRep(bpy.types.Node, SverchCustomTreeNode):
 	"""
@@ -48,10 +24,15 @@ class SvTopologyByImportedBRep(bpy.types.Node, SverchCustomTreeNode):
 	"""
 	bl_idname = 'SvTopologyByImportedBRep'
 	bl_label = 'Topology.ByImportedBRep'
+	SplitCompound: BoolProperty(name="Split Compound", description="Output the members of the top-level compound one by one instead of one Cluster", default=False, update=updateNode)
+
 	def sv_init(self, context):
 		self.inputs.new('SvStringsSocket', 'File Path')
 		self.outputs.new('SvStringsSocket', 'Topology')
 
+	def draw_buttons(self, context, layout):
+		layout.prop(self, "SplitCompound")
+
 	def process(self):
 		if not any(socket.is_linked for socket in self.outputs):
 			return
@@ -62,7 +43,7 @@ class SvTopologyByImportedBRep(bpy.types.Node, SverchCustomTreeNode):
 		inputs = flatten(inputs)
 		outputs = []
 		for anInput in inputs:
-			outputs.append(processItem(anInput))
+			outputs.append(processItem(anInput, self.SplitCompound))
 		self.outputs['Topology'].sv_set(outputs)
 
 def register():
@@ -1,5 +1,5 @@
 import bpy
-from bpy.props import StringProperty, FloatProperty
+from bpy.props import StringProperty, FloatProperty, BoolProperty, IntProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode
 import sys
@@ -7,17 +7,14 @@ sys.path.append("C:\\ProgramData\\Anaconda3\\envs\\Blender377\\Lib\\site-package
 import ifcopenshell
 import ifcopenshell.geom
 import topologic
+from topologic import Vertex, Edge, Wire, Face, Shell, Cell, CellComplex, Cluster, Topology
 import cppyy
 
-# From https://stackabuse.com/python-how-to-flatten-list-of-lists/
-def flatten(element):
-	returnList = []
-	if isinstance(element, list) == True:
-		for anItem in element:
-			returnList = returnList + flatten(anItem)
-	else:
-		returnList = [element]
-	return returnList
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.Replication')
+importlib.import_module('topologicsverchok.nodes.Topologic.IFCImport')
+from topologicsverchok.nodes.Topologic.Replication import flatten
+from topologicsverchok.nodes.Topologic.IFCImport import productShapes, inProductOrder, filterProducts, classNames, clipBoxByInput, productKey
 
 def classByType(argument):
 	switcher = {
@@ -35,23 +32,42 @@ def fixTopologyClass(topology):
 	topology.__class__ = classByType(topology.GetType())
 	return topology
 
-def processItem(item):
-	settings = ifcopenshell.geom.settings()
-	settings.set(settings.USE_BREP_DATA,True)
-	settings.set(settings.SEW_SHELLS,True)
-	settings.set(settings.USE_WORLD_COORDS,True)
-
-	ifc_file = ifcopenshell.open(item)
-	products = ifc_file.by_type('IfcProduct')
-	output = []
-	for p in products:
+def topologiesByShapes(shapes):
+	# Converts the BReps to Topologies as they arrive, pairing each Topology with its product
+	for p, brepString in shapes:
 		try:
-			cr = ifcopenshell.geom.create_shape(settings, p)
-			brepString = cr.geometry.brep_data
-			output.append(fixTopologyClass(topologic.Topology.ByString(brepString)))
+			yield p, fixTopologyClass(topologic.Topology.ByString(brepString))
 		except:
 			continue
-	return output
+
+def processItem(item, filters=([], [], [], None), parallel=False, threads=0):
+	ifc_file = ifcopenshell.open(item)
+	products = filterProducts(ifc_file, ifc_file.by_type('IfcProduct'), *filters)
+	return inProductOrder(products, topologiesByShapes(productShapes(ifc_file, products, parallel, threads)))
+
+# Topologies of the previous incremental import of each node and file, keyed by productKey
+previousImports = {}
+
+def processItemIncrementally(item, previous, filters=([], [], [], None), parallel=False, threads=0):
+	# Only the products that are new or whose representation or placement changed since the previous import get new geometry
+	# Returns the Topologies and the entries to keep for the next import. Deleted products are not kept
+	ifc_file = ifcopenshell.open(item)
+	products = filterProducts(ifc_file, ifc_file.by_type('IfcProduct'), *filters)
+	memo = {}
+	keys = [productKey(p, memo) for p in products]
+	changed = [p for p, key in zip(products, keys) if key not in previous]
+	created = {}
+	for p, topology in topologiesByShapes(productShapes(ifc_file, changed, parallel, threads)):
+		created[p.id()] = topology
+	current = {}
+	output = []
+	for p, key in zip(products, keys):
+		# Products without geometry are remembered as None so that they are not tried again
+		topology = previous[key] if key in previous else created.get(p.id())
+		current[key] = topology
+		if topology != None:
+			output.append(topology)
+	return output, current
 
 class SvTopologyByImportedIFC(bpy.types.Node, SverchCustomTreeNode):
 	"""
@@ -60,19 +76,54 @@ class SvTopologyByImportedIFC(bpy.types.Node, SverchCustomTreeNode):
 	"""
 	bl_idname = 'SvTopologyByImportedIFC'
 	bl_label = 'Topology.ByImportedIFC'
+	Parallel: BoolProperty(name="Parallel", description="Create the product geometries with ifcopenshell's multi-core geometry iterator", default=False, update=updateNode)
+	Threads: IntProperty(name="Threads", description="Number of geometry threads. 0 uses one per CPU core", default=0, min=0, update=updateNode)
+	Incremental: BoolProperty(name="Incremental", description="Keep the previous import and only create the geometry of new or changed products", default=False, update=updateNode)
+	IncludeClasses: StringProperty(name="Include Classes", description="Comma separated IFC classes to import. Empty imports every IfcProduct", default="", update=updateNode)
+	ExcludeClasses: StringProperty(name="Exclude Classes", description="Comma separated IFC classes to skip", default="", update=updateNode)
+	Storeys: StringProperty(name="Storeys", description="Comma separated names or GlobalIds of the storeys to import. Empty imports every storey", default="", update=updateNode)
 
 	def sv_init(self, context):
 		self.inputs.new('SvStringsSocket', 'File Path')
+		self.inputs.new('SvStringsSocket', 'Include Classes').prop_name = 'IncludeClasses'
+		self.inputs.new('SvStringsSocket', 'Exclude Classes').prop_name = 'ExcludeClasses'
+		self.inputs.new('SvStringsSocket', 'Storeys').prop_name = 'Storeys'
+		self.inputs.new('SvStringsSocket', 'Clip Box')
 		self.outputs.new('SvStringsSocket', 'Topology')
 
+	def draw_buttons(self, context, layout):
+		layout.prop(self, "Incremental")
+		layout.prop(self, "Parallel")
+		if self.Parallel:
+			layout.prop(self, "Threads")
+
+	def productFilters(self):
+		# Nodes created before the filter inputs were added do not have them
+		if 'Include Classes' not in self.inputs:
+			return [], [], [], None
+		includeClasses = classNames(flatten(self.inputs['Include Classes'].sv_get(deepcopy=False)))
+		excludeClasses = classNames(flatten(self.inputs['Exclude Classes'].sv_get(deepcopy=False)))
+		storeys = classNames(flatten(self.inputs['Storeys'].sv_get(deepcopy=False)))
+		clipBox = None
+		if self.inputs['Clip Box'].is_linked:
+			clipBox = clipBoxByInput(flatten(self.inputs['Clip Box'].sv_get(deepcopy=False)))
+		return includeClasses, excludeClasses, storeys, clipBox
+
 	def process(self):
 		if not any(socket.is_linked for socket in self.outputs):
 			return
 		inputs = self.inputs['File Path'].sv_get(deepcopy=False)
 		inputs = flatten(inputs)
+		filters = self.productFilters()
 		outputs = []
-		for anInput in inputs:
-			outputs.append(processItem(anInput))
+		for i, anInput in enumerate(inputs):
+			key = (self.node_id, i)
+			if self.Incremental:
+				output, previousImports[key] = processItemIncrementally(anInput, previousImports.get(key, {}), filters, self.Parallel, self.Threads)
+				outputs.append(output)
+			else:
+				_ = previousImports.pop(key, None)
+				outputs.append(processItem(anInput, filters, self.Parallel, self.Threads))
 		self.outputs['Topology'].sv_set(outputs)
 
 def register():
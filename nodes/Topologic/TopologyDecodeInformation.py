@@ -6,110 +6,13 @@ from sverchok.data_structure import updateNode, list_match_func, list_match_mode
 import topologic
 import cppyy
 
-def getValueAtKey(dict, key):
-	returnValue = "None"
-	try:
-		returnValue = str((cppyy.bind_object(dict.ValueAtKey(key).Value(), "std::string")))
-	except:
-		returnValue = "None"
-	return returnValue
-
-def dictionaryString(sources):
-	returnList = []
-	for source in sources:
-		type = ""
-		x = ""
-		y = ""
-		z = ""
-		sourceKeys = ""
-		sourceValues = ""
-		d = source.GetDictionary()
-		if d == None:
-			continue
-		stl_keys = d.Keys()
-		if len(stl_keys) > 0:
-			sourceType = source.GetType()
-			type = str(sourceType)
-			if sourceType == topologic.Vertex.Type():
-				sourceSelector = source
-			elif sourceType == topologic.Edge.Type():
-				sourceSelector = topologic.EdgeUtility.PointAtParameter(source, 0.5)
-			elif sourceType == topologic.Face.Type():
-				sourceSelector = topologic.FaceUtility.InternalVertex(source)
-			elif sourceType == topologic.Cell.Type():
-				sourceSelector = topologic.CellUtility.InternalVertex(source)
-			elif sourceType == topologic.CellComplex.Type():
-				sourceSelector = source.Centroid()
-			x = "{:.4f}".format(sourceSelector.X())
-			y = "{:.4f}".format(sourceSelector.Y())
-			z = "{:.4f}".format(sourceSelector.Z())
-			copyKeys = stl_keys.__class__(stl_keys) #wlav suggested workaround. Make a copy first
-			stl_keys = [str((copyKeys.front(), copyKeys.pop_front())[0]) for x in copyKeys]
-			for aSourceKey in stl_keys:
-				if sourceKeys == "":
-					sourceKeys = aSourceKey
-				else:
-					sourceKeys = sourceKeys+"|"+aSourceKey
-				aSourceValue = getValueAtKey(d, aSourceKey)
-				if sourceValues == "":
-					sourceValues = aSourceValue
-				else:
-					sourceValues = sourceValues+"|"+aSourceValue
-
-			returnList.append(type+","+x+","+y+","+z+","+sourceKeys+","+sourceValues)
-	return returnList
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.Information')
+from topologicsverchok.nodes.Topologic.Information import informationRows, informationCSV
 
 def processItem(topology):
-	finalList = []
-	for anItem in topology:
-		itemType = anItem.GetType()
-		if itemType == topologic.CellComplex.Type():
-			finalList = finalList + (dictionaryString([anItem]))
-			cells = cppyy.gbl.std.list[topologic.Cell.Ptr]()
-			_ = anItem.Cells(cells)
-			finalList = finalList + (dictionaryString(cells))
-			faces = cppyy.gbl.std.list[topologic.Face.Ptr]()
-			_ = anItem.Faces(faces)
-			finalList = finalList + (dictionaryString(faces))
-			edges = cppyy.gbl.std.list[topologic.Edge.Ptr]()
-			_ = anItem.Edges(edges)
-			finalList = finalList + (dictionaryString(edges))
-			vertices = cppyy.gbl.std.list[topologic.Vertex.Ptr]()
-			_ = anItem.Vertices(vertices)
-			finalList = finalList + (dictionaryString(vertices))
-		if itemType == topologic.Cell.Type():
-			finalList = finalList + (dictionaryString([anItem]))
-			faces = cppyy.gbl.std.list[topologic.Face.Ptr]()
-			_ = anItem.Faces(faces)
-			finalList = finalList + (dictionaryString(faces))
-			edges = cppyy.gbl.std.list[topologic.Edge.Ptr]()
-			_ = anItem.Edges(edges)
-			finalList = finalList + (dictionaryString(edges))
-			vertices = cppyy.gbl.std.list[topologic.Vertex.Ptr]()
-			_ = anItem.Vertices(vertices)
-			finalList = finalList + (dictionaryString(vertices))
-		if itemType == topologic.Face.Type():
-			finalList = finalList + (dictionaryString([anItem]))
-			edges = cppyy.gbl.std.list[topologic.Edge.Ptr]()
-			_ = anItem.Edges(edges)
-			finalList = finalList + (dictionaryString(edges))
-			vertices = cppyy.gbl.std.list[topologic.Vertex.Ptr]()
-			_ = anItem.Vertices(vertices)
-			finalList = finalList + (dictionaryString(vertices))
-		if itemType == topologic.Edge.Type():
-			finalList = finalList + (dictionaryString([anItem]))
-			vertices = cppyy.gbl.std.list[topologic.Vertex.Ptr]()
-			_ = anItem.Vertices(vertices)
-			finalList = finalList + (dictionaryString(vertices))
-		if itemType == topologic.Vertex.Type():
-			finalList = finalList + (dictionaryString([anItem]))
-	finalString = ""
-	for i in range(len(finalList)):
-		if i == len(finalList) - 1:
-			finalString = finalString+finalList[i]
-		else:
-			finalString = finalString+finalList[i]+'\n'
-	return finalString
+	# Values are written as JSON so that Topology.EncodeInformation gives them back with their type
+	return informationCSV(informationRows(topology))
 
 class SvTopologyDecodeInformation(bpy.types.Node, SverchCustomTreeNode):
 	"""
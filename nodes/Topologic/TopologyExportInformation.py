@@ -0,0 +1,55 @@
+import bpy
+from bpy.props import IntProperty, FloatProperty, StringProperty, BoolProperty
+from sverchok.node_tree import SverchCustomTreeNode
+from sverchok.data_structure import updateNode
+
+import topologic
+import cppyy
+import os
+
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.Replication')
+importlib.import_module('topologicsverchok.nodes.Topologic.Information')
+from topologicsverchok.nodes.Topologic.Replication import flatten
+from topologicsverchok.nodes.Topologic.Information import informationRows, informationTable, saveInformation
+
+def processItem(topologyList, filepath, overwrite):
+	# Make sure the file extension is .NPZ
+	ext = filepath[len(filepath)-4:len(filepath)]
+	if ext.lower() != ".npz":
+		filepath = filepath+".npz"
+	if (overwrite == False) and os.path.exists(filepath):
+		raise Exception("Error: Could not create a new file at the following location: "+filepath)
+	saveInformation(filepath, informationTable(informationRows(topologyList)))
+	return True
+
+class SvTopologyExportInformation(bpy.types.Node, SverchCustomTreeNode):
+	"""
+	Triggers: Topologic
+	Tooltip: Exports the Dictionaries, Selectors, and Type Filters of the input Topologies to a columnar NumPy file, keeping the type of every value
+	"""
+	bl_idname = 'SvTopologyExportInformation'
+	bl_label = 'Topology.ExportInformation'
+	OverwriteProp: BoolProperty(name="Overwrite", default=True, update=updateNode)
+
+	def sv_init(self, context):
+		self.inputs.new('SvStringsSocket', 'Topology')
+		self.inputs.new('SvStringsSocket', 'File Path')
+		self.inputs.new('SvStringsSocket', 'Overwrite File').prop_name = 'OverwriteProp'
+		self.outputs.new('SvStringsSocket', 'Status')
+
+	def process(self):
+		if not any(socket.is_linked for socket in self.inputs):
+			self.outputs['Status'].sv_set([False])
+			return
+		topologyList = self.inputs['Topology'].sv_get(deepcopy=False)
+		topologyList = flatten(topologyList)
+		filepath = self.inputs['File Path'].sv_get(deepcopy=False)[0][0] #accept only one file path
+		overwrite = self.inputs['Overwrite File'].sv_get(deepcopy=False)[0][0] #accept only one overwrite flag
+		self.outputs['Status'].sv_set([processItem(topologyList, filepath, overwrite)])
+
+def register():
+	bpy.utils.register_class(SvTopologyExportInformation)
+
+def unregister():
+	bpy.utils.unregister_class(SvTopologyExportInformation)
@@ -0,0 +1,80 @@
+import bpy
+from bpy.props import IntProperty, FloatProperty, StringProperty, BoolProperty, EnumProperty
+from sverchok.node_tree import SverchCustomTreeNode
+from sverchok.data_structure import updateNode
+
+import topologic
+import cppyy
+import os
+
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.Replication')
+importlib.import_module('topologicsverchok.nodes.Topologic.Archive')
+from topologicsverchok.nodes.Topologic.Replication import flatten
+from topologicsverchok.nodes.Topologic.Archive import exportArchive
+
+def entryKey(topology, keyName):
+	# The entry key is the value the topology's dictionary holds at keyName, if any
+	if not keyName:
+		return None
+	try:
+		v = topology.GetDictionary().ValueAtKey(keyName).Value()
+	except:
+		return None
+	if isinstance(v, cppyy.gbl.std.string):
+		return v.c_str()
+	elif isinstance(v, (int, float)):
+		return str(v)
+	return None
+
+def processItem(topologyList, filepath, overwrite, keys, binary=False, compress=True):
+	# Make sure the file extension is .TPARCHIVE
+	ext = filepath[len(filepath)-10:len(filepath)]
+	if ext.lower() != ".tparchive":
+		filepath = filepath+".tparchive"
+	if (overwrite == False) and os.path.exists(filepath):
+		raise Exception("Error: Could not create a new file at the following location: "+filepath)
+	return exportArchive(topologyList, filepath, keys, binary, compress)
+
+formats = [("Text", "Text", "", 1),("Binary", "Binary", "", 2)]
+
+class SvTopologyExportToArchive(bpy.types.Node, SverchCustomTreeNode):
+	"""
+	Triggers: Topologic
+	Tooltip: Exports the input Topologies, with their Dictionaries, Contents and Apertures, to one archive file that can be read back one entry at a time
+	"""
+	bl_idname = 'SvTopologyExportToArchive'
+	bl_label = 'Topology.ExportToArchive'
+	OverwriteProp: BoolProperty(name="Overwrite", default=True, update=updateNode)
+	KeyName: StringProperty(name="Key", description="Dictionary key whose value is used as the archive key of each Topology. The index is used if it is empty or missing", default="", update=updateNode)
+	Format: EnumProperty(name="Format", description="Text BRep, or OCCT's binary BRep which is smaller and faster to read and write", default="Text", items=formats, update=updateNode)
+	Compress: BoolProperty(name="Compress", description="Compress the entries of the archive", default=True, update=updateNode)
+
+	def sv_init(self, context):
+		self.inputs.new('SvStringsSocket', 'Topology')
+		self.inputs.new('SvStringsSocket', 'File Path')
+		self.inputs.new('SvStringsSocket', 'Key').prop_name = 'KeyName'
+		self.inputs.new('SvStringsSocket', 'Overwrite File').prop_name = 'OverwriteProp'
+		self.outputs.new('SvStringsSocket', 'Status')
+
+	def draw_buttons(self, context, layout):
+		layout.prop(self, "Format", text="")
+		layout.prop(self, "Compress")
+
+	def process(self):
+		if not any(socket.is_linked for socket in self.inputs):
+			self.outputs['Status'].sv_set([False])
+			return
+		topologyList = self.inputs['Topology'].sv_get(deepcopy=False)
+		topologyList = flatten(topologyList)
+		filepath = self.inputs['File Path'].sv_get(deepcopy=False)[0][0] #accept only one file path
+		keyName = self.inputs['Key'].sv_get(deepcopy=False)[0][0] #accept only one key
+		overwrite = self.inputs['Overwrite File'].sv_get(deepcopy=False)[0][0] #accept only one overwrite flag
+		keys = [entryKey(aTopology, keyName) for aTopology in topologyList]
+		self.outputs['Status'].sv_set([processItem(topologyList, filepath, overwrite, keys, self.Format == "Binary", self.Compress)])
+
+def register():
+	bpy.utils.register_class(SvTopologyExportToArchive)
+
+def unregister():
+	bpy.utils.unregister_class(SvTopologyExportToArchive)
@@ -1,49 +1,46 @@
 import bpy
-from bpy.props import IntProperty, FloatProperty, StringProperty, BoolProperty
+from bpy.props import IntProperty, FloatProperty, StringProperty, BoolProperty, EnumProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode
 
 import topologic
 import cppyy
 
-# From https://stackabuse.com/python-how-to-flatten-list-of-lists/
-def flatten(element):
-	returnList = []
-	if isinstance(element, list) == True:
-		for anItem in element:
-			returnList = returnList + flatten(anItem)
-	else:
-		returnList = [element]
-	return returnList
+import os
+
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.Replication')
+importlib.import_module('topologicsverchok.nodes.Topologic.BRepIO')
+from topologicsverchok.nodes.Topologic.Replication import flatten
+from topologicsverchok.nodes.Topologic.BRepIO import exportTopology
 
-def processItem(topologyList, filepath, overwrite):
-	# Make sure the file extension is .BREP
+def processItem(topologyList, filepath, overwrite, binary=False, compression="None"):
+	# Make sure the file extension is .BREP, followed by the extension of the compression if any
 	ext = filepath[len(filepath)-5:len(filepath)]
 	if ext.lower() != ".brep":
 		filepath = filepath+".brep"
-	f = None
-	try:
-		if overwrite == True:
-			f = open(filepath, "w")
-		else:
-			f = open(filepath, "x") # Try to create a new File
-	except:
+	if compression == "GZip":
+		filepath = filepath+".gz"
+	elif compression == "Zstandard":
+		filepath = filepath+".zst"
+	if (overwrite == False) and os.path.exists(filepath):
 		raise Exception("Error: Could not create a new file at the following location: "+filepath)
-	if (f):
-		if len(topologyList) > 1:
-			stl_top = cppyy.gbl.std.list[topologic.Topology.Ptr]()
-			for aTopology in topologyList:
-				stl_top.push_back(aTopology)
-			cluster = topologic.Cluster.ByTopologies(stl_top)
-			topString = str(cluster.String())
-		else:
-			topString = str(topologyList[0].String())
-		f.write(topString)
-		f.close()	
-		return True
-	return False
+	if len(topologyList) > 1:
+		stl_top = cppyy.gbl.std.list[topologic.Topology.Ptr]()
+		for aTopology in topologyList:
+			stl_top.push_back(aTopology)
+		topology = topologic.Cluster.ByTopologies(stl_top)
+	else:
+		topology = topologyList[0]
+	try:
+		exportTopology(topology, filepath, binary, compression)
+	except Exception as e:
+		raise Exception("Error: Could not write the file at the following location: "+filepath+" ("+str(e)+")")
+	return True
+
+formats = [("Text", "Text", "", 1),("Binary", "Binary", "", 2)]
+compressions = [("None", "None", "", 1),("GZip", "GZip", "", 2),("Zstandard", "Zstandard", "", 3)]
 
-		
 class SvTopologyExportToBRep(bpy.types.Node, SverchCustomTreeNode):
 	"""
 	Triggers: Topologic
@@ -52,6 +49,8 @@ class SvTopologyExportToBRep(bpy.types.Node, SverchCustomTreeNode):
 	bl_idname = 'SvTopologyExportToBRep'
 	bl_label = 'Topology.ExportToBRep'
 	OverwriteProp: BoolProperty(name="Overwrite", default=True, update=updateNode)
+	Format: EnumProperty(name="Format", description="Text BRep, or OCCT's binary BRep which is smaller and faster to read and write", default="Text", items=formats, update=updateNode)
+	Compression: EnumProperty(name="Compression", description="Compress the file. Zstandard needs the zstandard Python package", default="None", items=compressions, update=updateNode)
 
 	def sv_init(self, context):
 		self.inputs.new('SvStringsSocket', 'Topology')
@@ -59,6 +58,10 @@ class SvTopologyExportToBRep(bpy.types.Node, SverchCustomTreeNode):
 		self.inputs.new('SvStringsSocket', 'Overwrite File').prop_name = 'OverwriteProp'
 		self.outputs.new('SvStringsSocket', 'Status')
 
+	def draw_buttons(self, context, layout):
+		layout.prop(self, "Format", text="")
+		layout.prop(self, "Compression", text="")
+
 	def process(self):
 		if not any(socket.is_linked for socket in self.inputs):
 			self.outputs['Status'].sv_set([False])
@@ -67,7 +70,7 @@ class SvTopologyExportToBRep(bpy.types.Node, SverchCustomTreeNode):
 		topologyList = flatten(topologyList)
 		filepath = self.inputs['File Path'].sv_get(deepcopy=False)[0][0] #accept only one file path 
 		overwrite = self.inputs['Overwrite File'].sv_get(deepcopy=False)[0][0] #accept only one overwrite flag
-		self.outputs['Status'].sv_set([processItem(topologyList, filepath, overwrite)])
+		self.outputs['Status'].sv_set([processItem(topologyList, filepath, overwrite, self.Format == "Binary", self.Compression)])
 
 def register():
 	bpy.utils.register_class(SvTopologyExportToBRep)
@@ -5,21 +5,17 @@ from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode
 from bpy_extras.object_utils import AddObjectHelper, object_data_add
 import uuid
-from sverchok.utils.sv_mesh_utils import get_unique_faces
+import numpy
 
 import topologic
 from topologic import Topology, Vertex, Edge, Wire, Face, Shell, Cell, CellComplex, Cluster, Graph, Dictionary, Attribute, AttributeManager, VertexUtility, EdgeUtility, WireUtility, FaceUtility, ShellUtility, CellUtility, TopologyUtility
 import cppyy
 
-# From https://stackabuse.com/python-how-to-flatten-list-of-lists/
-def flatten(element):
-	returnList = []
-	if isinstance(element, list) == True:
-		for anItem in element:
-			returnList = returnList + flatten(anItem)
-	else:
-		returnList = [element]
-	return returnList
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.Replication')
+importlib.import_module('topologicsverchok.nodes.Topologic.SpatialIndex')
+from topologicsverchok.nodes.Topologic.Replication import flatten
+from topologicsverchok.nodes.Topologic.SpatialIndex import VertexHash
 
 def classByType(argument):
 	switcher = {
@@ -73,6 +69,88 @@ def triangulate(faces):
 			triangles.append(aFace)
 	return triangles
 
+class MeshBuilder:
+	# Collects vertices, edges and faces in linear time. Vertices are deduplicated by exact coordinates or,
+	# if the tolerance is greater than zero, welded to the first vertex found within the tolerance
+	# Welding can collapse an edge to a single vertex and a face to fewer than three, so these are then skipped
+	def __init__(self, tolerance):
+		self.vertices = []
+		self.edges = []
+		self.faces = []
+		self.vertexIndices = {}
+		self.vertexHash = VertexHash(tolerance) if tolerance > 0 else None
+		self.edgeKeys = set()
+		self.faceKeys = set()
+
+	def vertexIndex(self, vertex):
+		x, y, z = vertex.X(), vertex.Y(), vertex.Z()
+		if self.vertexHash != None:
+			index = self.vertexHash.find(x, y, z)
+			if index == None:
+				index = self.vertexHash.add(x, y, z)
+				self.vertices.append([x, y, z])
+			return index
+		key = (x, y, z)
+		index = self.vertexIndices.get(key)
+		if index == None:
+			index = len(self.vertices)
+			self.vertexIndices[key] = index
+			self.vertices.append([x, y, z])
+		return index
+
+	def addEdge(self, edge):
+		e = [self.vertexIndex(edge.StartVertex()), self.vertexIndex(edge.EndVertex())]
+		if self.vertexHash != None and e[0] == e[1]:
+			return
+		key = (min(e), max(e))
+		if key not in self.edgeKeys:
+			self.edgeKeys.add(key)
+			self.edges.append(e)
+
+	def addFace(self, face):
+		# Faces with holes are triangulated. Faces that use the same set of vertices are only added once
+		ib = cppyy.gbl.std.list[Wire.Ptr]()
+		_ = face.InternalBoundaries(ib)
+		if len(ib) > 0:
+			triFaces = cppyy.gbl.std.list[Face.Ptr]()
+			FaceUtility.Triangulate(face, 0.0, triFaces)
+			boundaries = [aTriFace.ExternalBoundary() for aTriFace in triFaces]
+		else:
+			boundaries = [face.ExternalBoundary()]
+		for wire in boundaries:
+			f = [self.vertexIndex(aVertex) for aVertex in getSubTopologies(wire, Vertex)]
+			if self.vertexHash != None:
+				f = [index for k, index in enumerate(f) if index != f[k-1]]
+				if len(set(f)) < 3:
+					continue
+			key = tuple(sorted(f))
+			if key not in self.faceKeys:
+				self.faceKeys.add(key)
+				self.faces.append(f)
+
+	def add(self, topology):
+		topVerts = cppyy.gbl.std.list[Vertex.Ptr]()
+		if (topology.GetType() == 1): #input is a vertex, just add it and process it
+			topVerts.push_back(topology)
+		else:
+			_ = topology.Vertices(topVerts)
+		for aVertex in topVerts:
+			_ = self.vertexIndex(aVertex)
+		topEdges = cppyy.gbl.std.list[Edge.Ptr]()
+		if (topology.GetType() == 2): #Input is an Edge, just add it and process it
+			topEdges.push_back(topology)
+		elif (topology.GetType() > 2):
+			_ = topology.Edges(topEdges)
+		for anEdge in topEdges:
+			self.addEdge(anEdge)
+		topFaces = cppyy.gbl.std.list[Face.Ptr]()
+		if (topology.GetType() == 8): # Input is a Face, just add it and process it
+			topFaces.push_back(topology)
+		elif (topology.GetType() > 8):
+			_ = topology.Faces(topFaces)
+		for aFace in topFaces:
+			self.addFace(aFace)
+
 class SvTopologyGeometry(bpy.types.Node, SverchCustomTreeNode):
 	"""
 	Triggers: Topologic
@@ -80,6 +158,8 @@ class SvTopologyGeometry(bpy.types.Node, SverchCustomTreeNode):
 	"""
 	bl_idname = 'SvTopologyGeometry'
 	bl_label = 'Topology.Geometry'
+	Tolerance: FloatProperty(name="Tolerance", description="Weld vertices closer than this distance. 0 merges only identical vertices", default=0.0, min=0.0, precision=4, update=updateNode)
+	OutputNumPy: BoolProperty(name="NumPy", description="Output vertices and edges as NumPy arrays", default=False, update=updateNode)
 
 	def sv_init(self, context):
 		self.inputs.new('SvStringsSocket', 'Topology')
@@ -87,6 +167,10 @@ class SvTopologyGeometry(bpy.types.Node, SverchCustomTreeNode):
 		self.outputs.new('SvStringsSocket', 'Edges')
 		self.outputs.new('SvStringsSocket', 'Faces')
 
+	def draw_buttons(self, context, layout):
+		layout.prop(self, "Tolerance")
+		layout.prop(self, "OutputNumPy")
+
 	def process(self):
 		if not any(socket.is_linked for socket in self.outputs):
 			return
@@ -94,93 +178,19 @@ class SvTopologyGeometry(bpy.types.Node, SverchCustomTreeNode):
 			return
 		inputs = self.inputs['Topology'].sv_get(deepcopy=False)
 		inputs = flatten(inputs)
-		vertices = []
-		edges = []
-		faces = []
-		for anInput in inputs: # Collect all the vertices from all the inputs
-			if anInput == None:
-				vertices.append([])
-				continue
-			topVerts = cppyy.gbl.std.list[Vertex.Ptr]()
-			if (anInput.GetType() == 1): #input is a vertex, just add it and process it
-				topVerts.push_back(anInput)
-			else:
-				_ = anInput.Vertices(topVerts)
-			for aVertex in topVerts:
-				try:
-					vertices.index([aVertex.X(), aVertex.Y(), aVertex.Z()]) # Vertex already in list
-				except:
-					vertices.append([aVertex.X(), aVertex.Y(), aVertex.Z()]) # Vertex not in list, add it.
-
+		mesh = MeshBuilder(self.Tolerance)
 		for anInput in inputs:
 			if anInput == None:
-				edges.append([])
-				faces.append([])
 				continue
-			topEdges = cppyy.gbl.std.list[Edge.Ptr]()
-			if (anInput.GetType() == 2): #Input is an Edge, just add it and process it
-				topEdges.push_back(anInput)
-			elif (anInput.GetType() > 2):
-				_ = anInput.Edges(topEdges)
-			for anEdge in topEdges:
-				e = []
-				sv = anEdge.StartVertex()
-				ev = anEdge.EndVertex()
-				try:
-					svIndex = vertices.index([sv.X(), sv.Y(), sv.Z()])
-				except:
-					vertices.append([sv.X(), sv.Y(), sv.Z()])
-					svIndex = len(vertices)-1
-				try:
-					evIndex = vertices.index([ev.X(), ev.Y(), ev.Z()])
-				except:
-					vertices.append([ev.X(), ev.Y(), ev.Z()])
-					evIndex = len(vertices)-1
-				e.append(svIndex)
-				e.append(evIndex)
-				if ([e[0], e[1]] not in edges) and ([e[1], e[0]] not in edges):
-					edges.append(e)
-			topFaces = cppyy.gbl.std.list[Face.Ptr]()
-			if (anInput.GetType() == 8): # Input is a Face, just add it and process it
-				topFaces.push_back(anInput)
-			elif (anInput.GetType() > 8):
-				_ = anInput.Faces(topFaces)
-			for aFace in topFaces:
-				ib = cppyy.gbl.std.list[Wire.Ptr]()
-				_ = aFace.InternalBoundaries(ib)
-				if(len(ib) > 0):
-					triFaces = cppyy.gbl.std.list[Face.Ptr]()
-					FaceUtility.Triangulate(aFace, 0.0, triFaces)
-					for aTriFace in triFaces:
-						wire = aTriFace.ExternalBoundary()
-						faceVertices = getSubTopologies(wire, Vertex)
-						f = []
-						for aVertex in faceVertices:
-							try:
-								fVertexIndex = vertices.index([aVertex.X(), aVertex.Y(), aVertex.Z()])
-							except:
-								vertices.append([aVertex.X(), aVertex.Y(), aVertex.Z()])
-								fVertexIndex = len(vertices)-1
-							f.append(fVertexIndex)
-						faces.append(f)
-				else:
-					wire =  aFace.ExternalBoundary()
-					#wire = topologic.WireUtility.RemoveCollinearEdges(wire, 0.1) #This is an angle Tolerance
-					faceVertices = getSubTopologies(wire, Vertex)
-					f = []
-					for aVertex in faceVertices:
-						try:
-							fVertexIndex = vertices.index([aVertex.X(), aVertex.Y(), aVertex.Z()])
-						except:
-							vertices.append([aVertex.X(), aVertex.Y(), aVertex.Z()])
-							fVertexIndex = len(vertices)-1
-						f.append(fVertexIndex)
-					faces.append(f)
-		
-		faces = get_unique_faces(faces) #Make sure we do not accidentally have duplicate faces
+			mesh.add(anInput)
+		vertices = mesh.vertices
+		edges = mesh.edges
+		if self.OutputNumPy:
+			vertices = numpy.array(vertices, dtype=numpy.float64).reshape(-1, 3)
+			edges = numpy.array(edges, dtype=numpy.int64).reshape(-1, 2)
 		self.outputs['Vertices'].sv_set([vertices])
 		self.outputs['Edges'].sv_set([edges])
-		self.outputs['Faces'].sv_set([faces])
+		self.outputs['Faces'].sv_set([mesh.faces])
 
 def register():
 	bpy.utils.register_class(SvTopologyGeometry)
@@ -0,0 +1,44 @@
+import bpy
+from bpy.props import EnumProperty, FloatProperty
+from sverchok.node_tree import SverchCustomTreeNode
+from sverchok.data_structure import updateNode
+
+import topologic
+import cppyy
+
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.Information')
+from topologicsverchok.nodes.Topologic.Information import loadInformation, encodeInformation
+
+def processItem(topology, filepath, tolerance):
+	return encodeInformation(topology, loadInformation(filepath), tolerance)
+
+class SvTopologyImportInformation(bpy.types.Node, SverchCustomTreeNode):
+	"""
+	Triggers: Topologic
+	Tooltip: Embeds the Dictionaries of the input columnar NumPy file, written by Topology.ExportInformation, into the input Topology
+	"""
+	bl_idname = 'SvTopologyImportInformation'
+	bl_label = 'Topology.ImportInformation'
+	Tolerance: FloatProperty(name="Tolerance",  default=0.0001, precision=4, update=updateNode)
+
+	def sv_init(self, context):
+		self.inputs.new('SvStringsSocket', 'Topology')
+		self.inputs.new('SvStringsSocket', 'File Path')
+		self.inputs.new('SvStringsSocket', 'Tolerance').prop_name='Tolerance'
+		self.outputs.new('SvStringsSocket', 'Topology')
+
+	def process(self):
+		if not any(socket.is_linked for socket in self.outputs):
+			return
+		topology = self.inputs['Topology'].sv_get(deepcopy=False)[0]
+		filepath = self.inputs['File Path'].sv_get(deepcopy=False)[0][0] #accept only one file path
+		tolerance = self.inputs['Tolerance'].sv_get(deepcopy=False)[0][0]
+		topology = processItem(topology, filepath, tolerance)
+		self.outputs['Topology'].sv_set([topology])
+
+def register():
+    bpy.utils.register_class(SvTopologyImportInformation)
+
+def unregister():
+    bpy.utils.unregister_class(SvTopologyImportInformation)
@@ -9,7 +9,8 @@ import cppyy
 
 import importlib
 importlib.import_module('topologicsverchok.nodes.Topologic.Replication')
-from topologicsverchok.nodes.Topologic.Replication import flatten, repeat, onestep, iterate, trim, interlace, transposeList
+from topologicsverchok.nodes.Topologic.Replication import flatten, replicateInputs
+
 replication = [("Default", "Default", "", 1),("Trim", "Trim", "", 2),("Iterate", "Iterate", "", 3),("Repeat", "Repeat", "", 4),("Interlace", "Interlace", "", 5)]
 
 def classByType(argument):
@@ -80,19 +81,9 @@ class SvTopologySelectSubTopology(bpy.types.Node, SverchCustomTreeNode):
 		inputs = [topologyList, selectorList]
 		outputs = []
 		if ((self.Replication) == "Default"):
-			inputs = repeat(inputs)
-			inputs = transposeList(inputs)
-		elif ((self.Replication) == "Trim"):
-			inputs = trim(inputs)
-			inputs = transposeList(inputs)
-		elif ((self.Replication) == "Iterate"):
-			inputs = iterate(inputs)
-			inputs = transposeList(inputs)
-		elif ((self.Replication) == "Repeat"):
-			inputs = repeat(inputs)
-			inputs = transposeList(inputs)
-		elif ((self.Replication) == "Interlace"):
-			inputs = list(interlace(inputs))
+			inputs = replicateInputs(inputs, "Repeat")
+		else:
+			inputs = replicateInputs(inputs, self.Replication)
 		for anInput in inputs:
 			outputs.append(processItem(anInput, self.subtopologyType))
 		self.outputs['SubTopology'].sv_set(outputs)
@@ -3,18 +3,15 @@ from bpy.props import StringProperty, IntProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode
 
+import topologic
 from topologic import Vertex, Edge, Wire, Face, Shell, Cell, CellComplex, Cluster, Topology, Dictionary
 import cppyy
 
-# From https://stackabuse.com/python-how-to-flatten-list-of-lists/
-def flatten(element):
-	returnList = []
-	if isinstance(element, list) == True:
-		for anItem in element:
-			returnList = returnList + flatten(anItem)
-	else:
-		returnList = [element]
-	return returnList
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.Replication')
+importlib.import_module('topologicsverchok.nodes.Topologic.DictionaryTransfer')
+from topologicsverchok.nodes.Topologic.Replication import flatten
+from topologicsverchok.nodes.Topologic.DictionaryTransfer import transferDictionaries
 
 def classByType(argument):
 	switcher = {
@@ -32,86 +29,6 @@ def fixTopologyClass(topology):
   topology.__class__ = classByType(topology.GetType())
   return topology
 
-def getValueAtKey(dict, key):
-	returnValue = None
-	try:
-		returnValue = str((cppyy.bind_object(dict.ValueAtKey(key).Value(), "std::string")))
-	except:
-		returnValue = None
-	return returnValue
-
-def relevantSelector(topology):
-	returnVertex = None
-	if topology.GetType() == topologic.Vertex.Type():
-		return topology
-	elif topology.GetType() == topologic.Edge.Type():
-		return topologic.EdgeUtility.PointAtParameter(topology, 0.5)
-	elif topology.GetType() == topologic.Face.Type():
-		return topologic.FaceUtility.InternalVertex(topology)
-	elif topology.GetType() == topologic.Cell.Type():
-		return topologic.CellUtility.InternalVertex(topology)
-	else:
-		return topology.Centroid()
-
-def topologyContains(topology, vertex, tol):
-	contains = False
-	if topology.GetType() == topologic.Vertex.Type():
-		try:
-			contains = (topologic.VertexUtility.Distance(topology, vertex) <= tol)
-		except:
-			contains = False
-		return contains
-	elif topology.GetType() == topologic.Edge.Type():
-		try:
-			_ = topologic.EdgeUtility.ParameterAtPoint(topology, vertex)
-			contains = True
-		except:
-			contains = False
-		return contains
-	elif topology.GetType() == topologic.Face.Type():
-		return topologic.FaceUtility.IsInside(topology, vertex, tol)
-	elif topology.GetType() == topologic.Cell.Type():
-		return (topologic.CellUtility.Contains(topology, vertex, tol) == 0)
-	return False
-
-def transferDictionaries(sources, sinks, tol):
-	for sink in sinks:
-		sinkKeys = []
-		sinkValues = []
-		iv = relevantSelector(sink)
-		j = 1
-		for source in sources:
-			if topologyContains(source, iv, tol):
-				d = source.GetDictionary()
-				if d == None:
-					continue
-				stl_keys = d.Keys()
-				if len(stl_keys) > 0:
-					copyKeys = stl_keys.__class__(stl_keys) #wlav suggested workaround. Make a copy first
-					sourceKeys = [str((copyKeys.front(), copyKeys.pop_front())[0]) for x in copyKeys]
-					for aSourceKey in sourceKeys:
-						if aSourceKey not in sinkKeys:
-							sinkKeys.append(aSourceKey)
-							sinkValues.append("")
-					for i in range(len(sourceKeys)):
-						index = sinkKeys.index(sourceKeys[i])
-						k = cppyy.gbl.std.string(sourceKeys[i])
-						sourceValue = getValueAtKey(d, k)
-						if sourceValue != None:
-							if sinkValues[index] != "":
-								sinkValues[index] = sinkValues[index]+","+sourceValue
-							else:
-								sinkValues[index] = sourceValue
-		if len(sinkKeys) > 0 and len(sinkValues) > 0:
-			stlKeys = cppyy.gbl.std.list[cppyy.gbl.std.string]()
-			for aKey in sinkKeys:
-				stlKeys.push_back(aKey)
-			stlValues = cppyy.gbl.std.list[topologic.Attribute.Ptr]()
-			for aValue in sinkValues:
-				stlValues.push_back(topologic.StringAttribute(aValue))
-			newDict = topologic.Dictionary.ByKeysValues(stlKeys, stlValues)
-			_ = sink.SetDictionary(newDict)
-
 def highestDimension(topology):
 	if (topology.GetType() == topologic.Cluster.Type()):
 		cellComplexes = cppyy.gbl.std.list[topologic.CellComplex.Ptr]()
@@ -8,15 +8,9 @@ from topologic import Vertex, Edge, Wire, Face, Shell, Cell, CellComplex, Cluste
 import cppyy
 import time
 
-# From https://stackabuse.com/python-how-to-flatten-list-of-lists/
-def flatten(element):
-	returnList = []
-	if isinstance(element, list) == True:
-		for anItem in element:
-			returnList = returnList + flatten(anItem)
-	else:
-		returnList = [element]
-	return returnList
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.DictionaryTransfer')
+from topologicsverchok.nodes.Topologic.DictionaryTransfer import transferDictionaries
 
 def classByType(argument):
 	switcher = {
@@ -34,110 +28,6 @@ def fixTopologyClass(topology):
   topology.__class__ = classByType(topology.GetType())
   return topology
 
-def relevantSelector(topology):
-	returnVertex = None
-	if topology.GetType() == topologic.Vertex.Type():
-		return topology
-	elif topology.GetType() == topologic.Edge.Type():
-		return topologic.EdgeUtility.PointAtParameter(topology, 0.5)
-	elif topology.GetType() == topologic.Face.Type():
-		return topologic.FaceUtility.InternalVertex(topology)
-	elif topology.GetType() == topologic.Cell.Type():
-		return topologic.CellUtility.InternalVertex(topology)
-	else:
-		return topology.CenterOfMass()
-
-def topologyContains(topology, vertex, tol):
-	contains = False
-	if topology.GetType() == topologic.Vertex.Type():
-		try:
-			contains = (topologic.VertexUtility.Distance(topology, vertex) <= tol)
-		except:
-			contains = False
-		return contains
-	elif topology.GetType() == topologic.Edge.Type():
-		try:
-			_ = topologic.EdgeUtility.ParameterAtPoint(topology, vertex)
-			contains = True
-		except:
-			contains = False
-		return contains
-	elif topology.GetType() == topologic.Face.Type():
-		return topologic.FaceUtility.IsInside(topology, vertex, tol)
-	elif topology.GetType() == topologic.Cell.Type():
-		return (topologic.CellUtility.Contains(topology, vertex, tol) == 0)
-	return False
-
-def getKeys(item):
-	stl_keys = item.Keys()
-	returnList = []
-	copyKeys = stl_keys.__class__(stl_keys) #wlav suggested workaround. Make a copy first
-	for x in copyKeys:
-		k = x.c_str()
-		returnList.append(k)
-	return returnList
-
-def transferDictionaries(sources, sinks, tol):
-	for sink in sinks:
-		sinkKeys = []
-		sinkValues = []
-		iv = relevantSelector(sink)
-		j = 1
-		for source in sources:
-			if topologyContains(source, iv, tol):
-				d = source.GetDictionary()
-				if d == None:
-					continue
-				stlKeys = d.Keys()
-				if len(stlKeys) > 0:
-					sourceKeys = getKeys(d)
-					for aSourceKey in sourceKeys:
-						if aSourceKey not in sinkKeys:
-							sinkKeys.append(aSourceKey)
-							sinkValues.append("")
-					for i in range(len(sourceKeys)):
-						index = sinkKeys.index(sourceKeys[i])
-						k = cppyy.gbl.std.string(sourceKeys[i])
-						sourceValue = d.ValueAtKey(k).Value()
-						if sourceValue != None:
-							if (isinstance(sourceValue, cppyy.gbl.std.string)):
-								sourceValue = sourceValue.c_str()
-							if sinkValues[index] != "":
-								if isinstance(sinkValues[index], list):
-									sinkValues[index].append(sourceValue)
-								else:
-									sinkValues[index] = [sinkValues[index], sourceValue]
-							else:
-								sinkValues[index] = sourceValue
-		if len(sinkKeys) > 0 and len(sinkValues) > 0:
-			stlKeys = cppyy.gbl.std.list[cppyy.gbl.std.string]()
-			for sinkKey in sinkKeys:
-				stlKeys.push_back(sinkKey)
-			stlValues = cppyy.gbl.std.list[topologic.Attribute.Ptr]()
-			for sinkValue in sinkValues:
-				if isinstance(sinkValue, bool):
-					stlValues.push_back(topologic.IntAttribute(sinkValue))
-				elif isinstance(sinkValue, int):
-					stlValues.push_back(topologic.IntAttribute(sinkValue))
-				elif isinstance(sinkValue, float):
-					stlValues.push_back(topologic.DoubleAttribute(sinkValue))
-				elif isinstance(sinkValue, str):
-					stlValues.push_back(topologic.StringAttribute(sinkValue))
-				elif isinstance(sinkValue, list):
-					l = cppyy.gbl.std.list[topologic.Attribute.Ptr]()
-					for v in sinkValue:
-						if isinstance(v, bool):
-							l.push_back(topologic.IntAttribute(v))
-						elif isinstance(v, int):
-							l.push_back(topologic.IntAttribute(v))
-						elif isinstance(v, float):
-							l.push_back(topologic.DoubleAttribute(v))
-						elif isinstance(v, str):
-							l.push_back(topologic.StringAttribute(v))
-					stlValues.push_back(topologic.ListAttribute(l))
-			newDict = topologic.Dictionary.ByKeysValues(stlKeys, stlValues)
-			_ = sink.SetDictionary(newDict)
-
 def highestDimension(topology):
 	if (topology.GetType() == topologic.Cluster.Type()):
 		cellComplexes = cppyy.gbl.std.list[topologic.CellComplex.Ptr]()
@@ -210,7 +100,7 @@ def processItem(sources, sink, tranVertices, tranEdges, tranFaces, tranCells, to
 			sink.Cells(stlSinkCells)
 			sinkCells = list(stlSinkCells)
 	for source in sources:
-		_ = transferDictionaries([source], [sink], tolerance)
+		_ = transferDictionaries([source], [sink], tolerance, True, True)
 		hidimSource = highestDimension(source)
 		if tranVertices == True:
 			stlSourceVertices = cppyy.gbl.std.list[topologic.Vertex.Ptr]()
@@ -219,7 +109,7 @@ def processItem(sources, sink, tranVertices, tranEdges, tranFaces, tranCells, to
 			elif hidimSource >= topologic.Vertex.Type():
 				source.Vertices(stlSourceVertices)
 				sourceVertices = list(stlSourceVertices)
-			_ = transferDictionaries(sourceVertices, sinkVertices, tolerance)
+			_ = transferDictionaries(sourceVertices, sinkVertices, tolerance, True, True)
 		if tranEdges == True:
 			if source.Type() == topologic.Edge.Type():
 				sourceEdges.append(source)
@@ -227,7 +117,7 @@ def processItem(sources, sink, tranVertices, tranEdges, tranFaces, tranCells, to
 				stlSourceEdges = cppyy.gbl.std.list[topologic.Edge.Ptr]()
 				source.Edges(stlSourceEdges)
 				sourceEdges = list(stlSourceEdges)
-			_ = transferDictionaries(sourceEdges, sinkEdges, tolerance)
+			_ = transferDictionaries(sourceEdges, sinkEdges, tolerance, True, True)
 		if tranFaces == True:
 			if source.Type() == topologic.Face.Type():
 				sourceFaces.append(source)
@@ -235,7 +125,7 @@ def processItem(sources, sink, tranVertices, tranEdges, tranFaces, tranCells, to
 				stlSourceFaces = cppyy.gbl.std.list[topologic.Face.Ptr]()
 				source.Faces(stlSourceFaces)
 				sourceFaces = list(stlSourceFaces)
-			_ = transferDictionaries(sourceFaces, sinkFaces, tolerance)
+			_ = transferDictionaries(sourceFaces, sinkFaces, tolerance, True, True)
 		if tranCells == True:
 			if source.Type() == topologic.Cell.Type():
 				sourceCells.append(source)
@@ -243,7 +133,7 @@ def processItem(sources, sink, tranVertices, tranEdges, tranFaces, tranCells, to
 				stlSourceCells = cppyy.gbl.std.list[topologic.Cell.Ptr]()
 				source.Cells(stlSourceCells)
 				sourceCells = list(stlSourceCells)
-			_ = transferDictionaries(sourceCells, sinkCells, tolerance)
+			_ = transferDictionaries(sourceCells, sinkCells, tolerance, True, True)
 	return sink
 
 class SvTopologyTransferDictionaries(bpy.types.Node, SverchCustomTreeNode):
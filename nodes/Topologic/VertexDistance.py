@@ -5,14 +5,10 @@ from sverchok.data_structure import updateNode
 
 import topologic
 import cppyy
-def flatten(element):
-	returnList = []
-	if isinstance(element, list) == True:
-		for anItem in element:
-			returnList = returnList + flatten(anItem)
-	else:
-		returnList = [element]
-	return returnList
+
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.Replication')
+from topologicsverchok.nodes.Topologic.Replication import flatten
 
 def matchLengths(list):
 	maxLength = len(list[0])
@@ -25,89 +25,11 @@ import cppyy
 import math
 import time
 
-# From https://stackabuse.com/python-how-to-flatten-list-of-lists/
-def flatten(element):
-	returnList = []
-	if isinstance(element, list) == True:
-		for anItem in element:
-			returnList = returnList + flatten(anItem)
-	else:
-		returnList = [element]
-	return returnList
-
-def repeat(list):
-	maxLength = len(list[0])
-	for aSubList in list:
-		newLength = len(aSubList)
-		if newLength > maxLength:
-			maxLength = newLength
-	for anItem in list:
-		if (len(anItem) > 0):
-			itemToAppend = anItem[-1]
-		else:
-			itemToAppend = None
-		for i in range(len(anItem), maxLength):
-			anItem.append(itemToAppend)
-	return list
-
-# From https://stackoverflow.com/questions/34432056/repeat-elements-of-list-between-each-other-until-we-reach-a-certain-length
-def onestep(cur,y,base):
-    # one step of the iteration
-    if cur is not None:
-        y.append(cur)
-        base.append(cur)
-    else:
-        y.append(base[0])  # append is simplest, for now
-        base = base[1:]+[base[0]]  # rotate
-    return base
-
-def iterate(list):
-	maxLength = len(list[0])
-	returnList = []
-	for aSubList in list:
-		newLength = len(aSubList)
-		if newLength > maxLength:
-			maxLength = newLength
-	for anItem in list:
-		for i in range(len(anItem), maxLength):
-			anItem.append(None)
-		y=[]
-		base=[]
-		for cur in anItem:
-			base = onestep(cur,y,base)
-		returnList.append(y)
-	return returnList
-
-def trim(list):
-	minLength = len(list[0])
-	returnList = []
-	for aSubList in list:
-		newLength = len(aSubList)
-		if newLength < minLength:
-			minLength = newLength
-	for anItem in list:
-		anItem = anItem[:minLength]
-		returnList.append(anItem)
-	return returnList
-
-# Adapted from https://stackoverflow.com/questions/533905/get-the-cartesian-product-of-a-series-of-lists
-def interlace(ar_list):
-    if not ar_list:
-        yield []
-    else:
-        for a in ar_list[0]:
-            for prod in interlace(ar_list[1:]):
-                yield [a,]+prod
-
-def transposeList(l):
-	length = len(l[0])
-	returnList = []
-	for i in range(length):
-		tempRow = []
-		for j in range(len(l)):
-			tempRow.append(l[j][i])
-		returnList.append(tempRow)
-	return returnList
+import importlib
+importlib.import_module('topologicsverchok.nodes.Topologic.Replication')
+importlib.import_module('topologicsverchok.nodes.Topologic.SpatialIndex')
+from topologicsverchok.nodes.Topologic.Replication import flatten, replicateInputs
+from topologicsverchok.nodes.Topologic.SpatialIndex import VertexHash
 
 def classByType(argument):
 	switcher = {
@@ -127,11 +49,11 @@ def fixTopologyClass(topology):
 
 #Based on open source code from: https://stackoverflow.com/questions/12367801/finding-all-cycles-in-undirected-graphs
 
-def vIndex(v, vList, tolerance):
-    for i in range(len(vList)):
-        if topologic.VertexUtility.Distance(v, vList[i]) < tolerance:
-            return i+1
-    return None
+def vIndex(v, vertexHash):
+    i = vertexHash.findVertex(v)
+    if i == None:
+        return None
+    return i+1
 
 #  rotate cycle path such that it begins with the smallest node
 def rotate_to_smallest(path):
@@ -197,10 +119,13 @@ def processItem(item):
 	tVertices = cppyy.gbl.std.list[topologic.Vertex.Ptr]()
 	_ = wire.Vertices(tVertices)
 	tVertices = list(tVertices)
+	vertexHash = VertexHash(tolerance)
+	for aVertex in tVertices:
+		_ = vertexHash.addVertex(aVertex)
 
 	graph = []
 	for anEdge in tEdges:
-		graph.append([vIndex(anEdge.StartVertex(), tVertices, tolerance), vIndex(anEdge.EndVertex(), tVertices, tolerance)])
+		graph.append([vIndex(anEdge.StartVertex(), vertexHash), vIndex(anEdge.EndVertex(), vertexHash)])
 
 	cycles = []
 	resultingCycles = main(graph, cycles, maxVertices)
@@ -262,19 +187,9 @@ class SvWireCycles(bpy.types.Node, SverchCustomTreeNode):
 		inputs = [wireList, maxVerticesList, toleranceList]
 		outputs = []
 		if ((self.Replication) == "Default"):
-			inputs = repeat(inputs)
-			inputs = transposeList(inputs)
-		elif ((self.Replication) == "Trim"):
-			inputs = trim(inputs)
-			inputs = transposeList(inputs)
-		elif ((self.Replication) == "Iterate"):
-			inputs = iterate(inputs)
-			inputs = transposeList(inputs)
-		elif ((self.Replication) == "Repeat"):
-			inputs = repeat(inputs)
-			inputs = transposeList(inputs)
-		elif ((self.Replication) == "Interlace"):
-			inputs = list(interlace(inputs))
+			inputs = replicateInputs(inputs, "Repeat")
+		else:
+			inputs = replicateInputs(inputs, self.Replication)
 		for anInput in inputs:
 			outputs.append(processItem(anInput))
 		self.outputs['Cycles'].sv_set(outputs)